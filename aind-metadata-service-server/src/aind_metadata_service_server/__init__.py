@@ -1,5 +1,6 @@
 """Init package"""
 
+import atexit
 import logging.config
 import os
 from datetime import datetime, timezone
@@ -8,6 +9,8 @@ from logging import LogRecord
 import yaml
 from pythonjsonlogger import json as log_json
 
+from aind_metadata_service_server.logs import start_queue_listener
+
 __version__ = "2.9.6"
 
 
@@ -39,4 +42,8 @@ if os.path.isfile(os.getenv("LOGGING_CONFIG_FILE", "log_config.yaml")):
     with open(config_path, "rt") as f:
         config = yaml.safe_load(f.read())
     logging.config.dictConfig(config)
+    # Handlers write from a background thread so slow streams, such as
+    # stdout in containers, do not block the event loop
+    log_listener = start_queue_listener()
+    atexit.register(log_listener.stop)
     logging.info(f"Found logging file at: {config_path}")
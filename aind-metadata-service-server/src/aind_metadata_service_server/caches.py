@@ -0,0 +1,224 @@
+"""Module for in-memory caches shared across requests"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from aind_metadata_service_server.timing import record_cache_lookup
+
+# Sentinel returned when a key is not in a cache
+MISSING = object()
+
+_registered_caches: List["TTLCache"] = []
+
+
+class TTLCache:
+    """
+    Least recently used cache where entries expire after a time to live.
+    Concurrent fetches for the same missing key are coalesced into a single
+    call to the backend.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        maxsize: int = 1024,
+        negative_ttl: Optional[float] = None,
+        stale_if_error: bool = False,
+    ):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        name : str
+            Name used in logs and statistics
+        ttl : float
+            Seconds an entry is fresh for
+        maxsize : int
+            Maximum number of entries. Least recently used entries are
+            evicted first. Default is 1024.
+        negative_ttl : Optional[float]
+            Seconds an empty value, such as None or [], is fresh for. If 0,
+            empty values are not cached. If None, the ttl is used.
+        stale_if_error : bool
+            If True, an expired entry is returned when refreshing it raises
+            an exception. Default is False.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.stale_if_error = stale_if_error
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+        _registered_caches.append(self)
+
+    def __len__(self) -> int:
+        """Number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def _ttl_for(self, value: Any) -> float:
+        """Time to live for a value"""
+        if not value and self.negative_ttl is not None:
+            return self.negative_ttl
+        return self.ttl
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Return a fresh value for key, or default if missing or expired.
+
+        Parameters
+        ----------
+        key : Hashable
+        default : Any
+
+        Returns
+        -------
+        Any
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            record_cache_lookup(self.name, hit=False)
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_cache_lookup(self.name, hit=True)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value. Empty values are skipped if negative_ttl is 0.
+
+        Parameters
+        ----------
+        key : Hashable
+        value : Any
+        """
+        ttl = self._ttl_for(value)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def _fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Await fetch and store its value, serving stale values on error."""
+        try:
+            value = await fetch()
+        except Exception as e:
+            stale_entry = self._entries.get(key)
+            if self.stale_if_error and stale_entry is not None:
+                logging.warning(
+                    f"Serving stale {self.name} entry for {key}: {e}"
+                )
+                return stale_entry[1]
+            raise
+        self.set(key, value)
+        return value
+
+    def _forget_fetch(self, key: Hashable, task: asyncio.Task) -> None:
+        """Remove a finished fetch so the next miss starts a new one."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved if every waiter gave up
+            task.exception()
+
+    async def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a fresh value for key, awaiting fetch to load it if needed.
+        If a fetch for the same key is already in flight, its result is
+        shared instead of calling the backend again. Fetches usually use a
+        client owned by the caller that started them, so a fetch is
+        cancelled with that caller, and the other callers waiting on it
+        start a new fetch with their own clients.
+
+        Parameters
+        ----------
+        key : Hashable
+        fetch : Callable[[], Awaitable[Any]]
+            Called without arguments to load the value
+
+        Returns
+        -------
+        Any
+        """
+        while True:
+            value = self.get(key)
+            if value is not MISSING:
+                return value
+            task = self._pending.get(key)
+            is_owner = task is None
+            if is_owner:
+                task = asyncio.create_task(self._fetch(key, fetch))
+                self._pending[key] = task
+                task.add_done_callback(partial(self._forget_fetch, key))
+            try:
+                # Unlike shield, wait does not raise if the task is cancelled
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                if is_owner:
+                    task.cancel()
+                raise
+            if not task.cancelled():
+                return task.result()
+
+    async def refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Reload a key even if its entry is still fresh. If fetch raises, the
+        existing entry is kept and the error is logged.
+
+        Parameters
+        ----------
+        key : Hashable
+        fetch : Callable[[], Awaitable[Any]]
+            Called without arguments to load the value
+
+        Returns
+        -------
+        Any
+            The new value, or MISSING if fetch raised
+        """
+        try:
+            value = await fetch()
+        except Exception as e:
+            logging.warning(f"Unable to refresh {self.name} entry {key}: {e}")
+            return MISSING
+        self.set(key, value)
+        return value
+
+
+def get_registered_caches() -> List[TTLCache]:
+    """Return every cache created by the service."""
+    return list(_registered_caches)
+
+
+def clear_caches() -> None:
+    """Clear every cache created by the service."""
+    for cache in _registered_caches:
+        cache.clear()
@@ -0,0 +1,49 @@
+"""Module to preload and periodically refresh slowly changing catalogs"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from aind_metadata_service_server.routes.funding import (
+    fetch_funding_snapshot,
+    funding_snapshot_cache,
+)
+from aind_metadata_service_server.routes.protocol import (
+    fetch_protocol_catalog,
+    protocol_catalog_cache,
+)
+from aind_metadata_service_server.sessions import get_smartsheet_api_instance
+
+
+async def refresh_catalogs() -> None:
+    """
+    Download the protocol catalog and funding snapshot and replace the
+    cached copies. A catalog that fails to download keeps its cached copy.
+    """
+    async with asynccontextmanager(get_smartsheet_api_instance)() as api:
+        await asyncio.gather(
+            protocol_catalog_cache.refresh(
+                "protocols", lambda: fetch_protocol_catalog(api)
+            ),
+            funding_snapshot_cache.refresh(
+                "funding", lambda: fetch_funding_snapshot(api)
+            ),
+        )
+
+
+async def refresh_catalogs_periodically(interval: float) -> None:
+    """
+    Refresh the catalogs immediately and then every interval seconds until
+    cancelled.
+
+    Parameters
+    ----------
+    interval : float
+        Seconds between refreshes
+    """
+    while True:
+        try:
+            await refresh_catalogs()
+        except Exception as e:
+            logging.warning(f"Unable to refresh catalogs: {e}")
+        await asyncio.sleep(interval)
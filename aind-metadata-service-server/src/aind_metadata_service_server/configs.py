@@ -1,6 +1,8 @@
 """Module for settings to connect to backend"""
 
-from pydantic import Field, HttpUrl
+from typing import List, Optional
+
+from pydantic import Field, HttpUrl, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -40,6 +42,142 @@ class Settings(BaseSettings):
     active_directory_host: HttpUrl = Field(
         ..., description="Host address for active directory endpoint"
     )
+    dataverse_catalog_ttl: int = Field(
+        default=3600,
+        description=(
+            "Seconds to cache the Dataverse table catalog and learned table "
+            "columns before refreshing them"
+        ),
+    )
+    dataverse_catalog_reload_interval: int = Field(
+        default=60,
+        description=(
+            "Minimum seconds between reloads of the Dataverse table catalog "
+            "for requests to tables that are not in it"
+        ),
+    )
+    dataverse_table_page_ttl: int = Field(
+        default=120,
+        description=(
+            "Seconds to keep a Dataverse table fetched for a paged request, "
+            "so that the following pages are served without fetching it "
+            "again"
+        ),
+    )
+    dataverse_table_page_max_records: int = Field(
+        default=10000,
+        description=(
+            "Largest Dataverse table, in records, kept for paged requests. "
+            "Pages of larger tables fetch the table again"
+        ),
+    )
+    funding_snapshot_ttl: int = Field(
+        default=900,
+        description=(
+            "Seconds to serve the indexed funding sheet before downloading "
+            "it again"
+        ),
+    )
+    protocol_catalog_ttl: int = Field(
+        default=3600,
+        description=(
+            "Seconds to serve the protocol catalog before downloading it again"
+        ),
+    )
+    tars_cache_ttl: int = Field(
+        default=86400,
+        description=(
+            "Seconds to cache TARS prep lots and viruses, which do not change "
+            "once created"
+        ),
+    )
+    negative_cache_ttl: int = Field(
+        default=300,
+        description=(
+            "Seconds to remember that a backend has no record for a name"
+        ),
+    )
+    catalog_refresh_interval: int = Field(
+        default=900,
+        description=(
+            "Seconds between background refreshes of the protocol catalog "
+            "and funding snapshot. They are first loaded at startup. Set to "
+            "0 to disable and load them on first use instead."
+        ),
+    )
+    source_cache_ttl: int = Field(
+        default=60,
+        description=(
+            "Seconds to reuse a raw backend response for a subject across "
+            "routes"
+        ),
+    )
+    batch_concurrency_limit: int = Field(
+        default=4,
+        description=(
+            "Maximum number of subjects processed concurrently by a single "
+            "batch request"
+        ),
+    )
+    backend_concurrency_limit: int = Field(
+        default=8,
+        description=(
+            "Maximum number of concurrent backend requests made while "
+            "handling a single batch request"
+        ),
+    )
+    job_store_size: int = Field(
+        default=1000,
+        description=(
+            "Maximum number of asynchronous jobs kept in memory. The oldest "
+            "finished jobs are evicted first."
+        ),
+    )
+    job_timeout: int = Field(
+        default=600,
+        description="Seconds an asynchronous job may run before giving up",
+    )
+    job_concurrency_limit: int = Field(
+        default=4,
+        description=(
+            "Maximum number of asynchronous jobs running at once. Other "
+            "jobs stay pending until one finishes."
+        ),
+    )
+    tracing_enabled: bool = Field(
+        default=False,
+        description=(
+            "Export OpenTelemetry traces over OTLP/HTTP. Requires the tracing "
+            "extra. The exporter is configured with the standard "
+            "OTEL_EXPORTER_OTLP_* environment variables."
+        ),
+    )
+    event_loop_monitor_interval: float = Field(
+        default=0.1,
+        description=(
+            "Seconds between event loop heartbeats used to measure lag. Set "
+            "to 0 to disable the monitor."
+        ),
+    )
+    event_loop_block_threshold: float = Field(
+        default=0.5,
+        description=(
+            "Seconds the event loop may be blocked before the stack of the "
+            "blocking code is logged"
+        ),
+    )
+    profiling_token: Optional[SecretStr] = Field(
+        default=None,
+        description=(
+            "Admin token sent in the X-Profile-Token header to profile a "
+            "request. Requires the profiling extra. Profiling is disabled "
+            "when unset."
+        ),
+    )
+    profiling_routes: List[str] = Field(
+        default=["/api/v2/procedures/{subject_id}"],
+        description="Route templates that can be profiled",
+    )
 
 
 def get_settings():
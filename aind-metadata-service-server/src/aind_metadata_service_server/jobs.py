@@ -0,0 +1,190 @@
+"""Module for running long requests as background jobs"""
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Coroutine, Dict, Optional
+
+from aind_metadata_service_server.utils import capture_response
+
+
+class JobStoreFullError(Exception):
+    """Raised when every job in a store is still running"""
+
+
+class Job:
+    """A request running in the background and its captured outcome"""
+
+    def __init__(
+        self,
+        kind: str,
+        awaitable: Coroutine[Any, Any, Any],
+        timeout: float,
+        semaphore: asyncio.Semaphore,
+    ):
+        """
+        Class constructor. Starts running the awaitable as soon as the
+        semaphore is acquired.
+
+        Parameters
+        ----------
+        kind : str
+            Name of the kind of job, such as procedures
+        awaitable : Coroutine[Any, Any, Any]
+            Route handler call returning a Response or a JSON serializable
+            value
+        timeout : float
+            Seconds to wait for the awaitable before giving up, not counting
+            the time spent waiting for the semaphore
+        semaphore : asyncio.Semaphore
+            Limits the number of jobs running at once
+        """
+        self.job_id = str(uuid.uuid4())
+        self.kind = kind
+        self.submitted_at = datetime.now(tz=timezone.utc)
+        self.completed_at: Optional[datetime] = None
+        self.awaitable = awaitable
+        self.task = asyncio.create_task(self._run(timeout, semaphore))
+        self.task.add_done_callback(self._set_completed_at)
+
+    async def _run(
+        self, timeout: float, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Capture the response of the awaitable once it may run."""
+        async with semaphore:
+            return await capture_response(
+                self.awaitable,
+                timeout=timeout,
+                name=f"{self.kind} job {self.job_id}",
+            )
+
+    def _set_completed_at(self, _: asyncio.Task) -> None:
+        """Record when the task finished."""
+        self.completed_at = datetime.now(tz=timezone.utc)
+
+    def done(self) -> bool:
+        """Whether the job has finished."""
+        return self.task.done()
+
+    async def wait(self, timeout: float) -> None:
+        """
+        Wait for the job to finish without cancelling it on timeout.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum seconds to wait
+        """
+        if timeout > 0 and not self.done():
+            await asyncio.wait({self.task}, timeout=timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the job. The result is only set once the job has finished.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary with job_id, kind, status, submitted_at, completed_at
+            and result keys
+        """
+        finished = self.done() and not self.task.cancelled()
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": "completed" if finished else "pending",
+            "submitted_at": self.submitted_at,
+            "completed_at": self.completed_at if finished else None,
+            "result": self.task.result() if finished else None,
+        }
+
+
+class JobStore:
+    """
+    Bounded in-memory store of jobs. When the store is full, the oldest
+    finished job is evicted to make room for a new one. Only
+    concurrency_limit jobs run at once and the others wait their turn.
+    """
+
+    def __init__(self, maxsize: int, timeout: float, concurrency_limit: int):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of jobs kept, waiting, running or finished
+        timeout : float
+            Seconds each job may run before giving up
+        concurrency_limit : int
+            Maximum number of jobs running at once
+        """
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of jobs kept, running or finished."""
+        return len(self._jobs)
+
+    def _evict(self) -> None:
+        """Remove the oldest finished jobs until there is room for one."""
+        for job_id in list(self._jobs):
+            if len(self._jobs) < self.maxsize:
+                return
+            if self._jobs[job_id].done():
+                del self._jobs[job_id]
+        if len(self._jobs) >= self.maxsize:
+            raise JobStoreFullError(
+                f"{len(self._jobs)} jobs are already running"
+            )
+
+    def submit(self, kind: str, awaitable: Coroutine[Any, Any, Any]) -> Job:
+        """
+        Start running an awaitable in the background.
+
+        Parameters
+        ----------
+        kind : str
+        awaitable : Coroutine[Any, Any, Any]
+
+        Returns
+        -------
+        Job
+
+        Raises
+        ------
+        JobStoreFullError
+            If the store is full and no job has finished yet. The awaitable
+            is closed without being run.
+        """
+        try:
+            self._evict()
+        except JobStoreFullError:
+            awaitable.close()
+            raise
+        job = Job(
+            kind=kind,
+            awaitable=awaitable,
+            timeout=self.timeout,
+            semaphore=self._semaphore,
+        )
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID, or None if unknown or evicted."""
+        return self._jobs.get(job_id)
+
+    async def close(self) -> None:
+        """Cancel running jobs and remove every job."""
+        tasks = [job.task for job in self._jobs.values() if not job.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            # Jobs cancelled before they started never awaited their call
+            job.awaitable.close()
+        self._jobs.clear()
@@ -0,0 +1,176 @@
+"""Module to log without blocking the event loop"""
+
+import logging
+import queue
+import re
+import uuid
+from contextvars import ContextVar
+from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from aind_metadata_service_server.timing import get_request_timings
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Request IDs sent by clients are only reused if they look like IDs
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Adds the request_id of the request being handled and the backend
+    timings recorded for it so far, in milliseconds, to log records. It has
+    to run in the thread that logged the record.
+    """
+
+    def filter(self, record: LogRecord) -> bool:
+        """Add request fields to the record and keep it."""
+        request_id = _request_id.get()
+        if request_id is not None:
+            record.request_id = request_id
+        timings = get_request_timings()
+        if timings is not None and timings.durations:
+            record.backend_timings = {
+                name: round(seconds * 1000, 1)
+                for name, (_, seconds, _) in timings.durations.items()
+            }
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every n records whose message matches a pattern, such as
+    the warnings logged for each allele of a subject. Other records are
+    always kept.
+    """
+
+    def __init__(self, patterns: List[str], one_in: int = 10):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        patterns : List[str]
+            Regular expressions searched for in the message of noisy records
+        one_in : int
+            Keep one in every one_in matching records. Default is 10.
+        """
+        super().__init__()
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.one_in = one_in
+        self._seen: Dict[str, int] = {}
+
+    def filter(self, record: LogRecord) -> bool:
+        """Whether to keep the record."""
+        message = record.getMessage()
+        for pattern in self.patterns:
+            if pattern.search(message):
+                seen = self._seen.get(pattern.pattern, 0)
+                self._seen[pattern.pattern] = seen + 1
+                return seen % self.one_in == 0
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Puts records on a queue for a QueueListener to handle in a background
+    thread. Messages and tracebacks are rendered before enqueuing, but
+    unlike QueueHandler the traceback is kept separate from the message so
+    JSON formatters still log it as its own field.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """Render the message and traceback of a copy of the record."""
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+        prepared.exc_info = None
+        return prepared
+
+
+def start_queue_listener(
+    logger_names: Optional[List[str]] = None,
+) -> QueueListener:
+    """
+    Move the handlers of loggers to a background thread, so that writing
+    to a slow stream does not block the event loop. The handlers are
+    replaced by a single handler that adds request fields to records and
+    puts them on a queue.
+
+    Parameters
+    ----------
+    logger_names : Optional[List[str]]
+        Loggers whose handlers are moved. Default is the root logger and
+        the uvicorn loggers.
+
+    Returns
+    -------
+    QueueListener
+        Started listener. Stop it to flush the queue at shutdown.
+    """
+    if logger_names is None:
+        logger_names = ["", "uvicorn.error", "uvicorn.access"]
+    log_queue = queue.SimpleQueue()
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    handlers = []
+    for logger_name in logger_names:
+        logger = logging.getLogger(logger_name)
+        if not logger.handlers:
+            continue
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+        logger.handlers = [queue_handler]
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware that gives every request an ID for its log records.
+    The X-Request-ID header is reused if the client sent a valid one, and
+    the ID is returned in the X-Request-ID response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        app : ASGIApp
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle a request with its ID set."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if request_id is None or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            """Add the request ID header when the response starts."""
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = _request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _request_id.reset(token)
@@ -0,0 +1,123 @@
+"""Module to detect code that blocks the event loop"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import suppress
+from types import FrameType
+from typing import Optional
+
+from aind_metadata_service_server.metrics import (
+    EVENT_LOOP_BLOCKS,
+    EVENT_LOOP_LAG,
+)
+
+PACKAGE_NAME = "aind_metadata_service_server"
+
+
+def get_blocking_location(frame: FrameType) -> str:
+    """
+    Name the code responsible for a stack, preferring the innermost frame
+    from this package over library code it called.
+
+    Parameters
+    ----------
+    frame : FrameType
+        Innermost frame of the stack
+
+    Returns
+    -------
+    str
+        Module and function name, such as
+        aind_metadata_service_server.mappers.responses.map_to_response
+    """
+    current = frame
+    while current is not None:
+        if current.f_globals.get("__name__", "").startswith(PACKAGE_NAME):
+            break
+        current = current.f_back
+    current = current or frame
+    return f"{current.f_globals.get('__name__')}.{current.f_code.co_name}"
+
+
+class EventLoopMonitor:
+    """
+    Measures event loop lag with a heartbeat task. A watchdog thread logs
+    the event loop's stack whenever the heartbeat stalls for longer than a
+    threshold, which shows the synchronous code that is blocking it.
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        interval : float
+            Seconds between heartbeats
+        threshold : float
+            Seconds without a heartbeat before the loop is reported blocked
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self._last_beat = time.monotonic()
+        self._beats = 0
+        self._reported_beat = -1
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        """Sleep for the interval and record how late each wake up is."""
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            EVENT_LOOP_LAG.observe(max(0.0, now - start - self.interval))
+            self._last_beat = now
+            self._beats += 1
+
+    def _watch(self) -> None:
+        """Check the heartbeat from another thread until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        """Report the event loop's stack once per stall over the threshold."""
+        blocked_for = time.monotonic() - self._last_beat
+        if blocked_for <= self.threshold or self._reported_beat == self._beats:
+            return
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        self._reported_beat = self._beats
+        location = get_blocking_location(frame)
+        EVENT_LOOP_BLOCKS.labels(location=location).inc()
+        stack = "".join(traceback.format_stack(frame))
+        logging.warning(
+            f"Event loop blocked for {blocked_for:.3f}s in {location}:\n"
+            f"{stack}"
+        )
+
+    def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="event-loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog."""
+        self._stopped.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._thread.join()
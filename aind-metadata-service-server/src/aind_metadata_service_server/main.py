@@ -1,14 +1,23 @@
 """Starts and runs a FastAPI Server"""
 
+import asyncio
 import logging
 import os
 import warnings
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
 
 from aind_metadata_service_server import __version__ as service_version
+from aind_metadata_service_server.catalogs import (
+    refresh_catalogs_periodically,
+)
+from aind_metadata_service_server.logs import RequestIdMiddleware
+from aind_metadata_service_server.loop_monitor import EventLoopMonitor
+from aind_metadata_service_server.metrics import MetricsMiddleware
+from aind_metadata_service_server.profiling import ProfilingMiddleware
 from aind_metadata_service_server.routes import (
     dataverse,
     funding,
@@ -16,6 +25,9 @@ from aind_metadata_service_server.routes import (
     index,
     injection_materials,
     intended_measurements,
+    jobs,
+    metadata_bundle,
+    metrics,
     mgi_allele,
     perfusion,
     procedures,
@@ -25,6 +37,12 @@ from aind_metadata_service_server.routes import (
     v1_proxy,
     user_email,
 )
+from aind_metadata_service_server.sessions import settings
+from aind_metadata_service_server.timing import ServerTimingMiddleware
+from aind_metadata_service_server.tracing import (
+    TracingMiddleware,
+    configure_tracing,
+)
 
 warnings.filterwarnings(
     "ignore", category=UserWarning, message=r".*Pydantic serializer warnings.*"
@@ -58,12 +76,48 @@ def set_operation_ids(router: APIRouter) -> None:
             route.operation_id = route.name
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Preload catalogs at startup and keep refreshing them in the background
+    while the app is running. Running jobs are cancelled at shutdown.
+    Traces are exported while the app is running if tracing is enabled.
+    Event loop lag is monitored unless its interval is 0.
+    """
+    tracer_provider = None
+    if settings.tracing_enabled:
+        tracer_provider = configure_tracing()
+    loop_monitor = None
+    if settings.event_loop_monitor_interval > 0:
+        loop_monitor = EventLoopMonitor(
+            interval=settings.event_loop_monitor_interval,
+            threshold=settings.event_loop_block_threshold,
+        )
+        loop_monitor.start()
+    refresh_task = None
+    if settings.catalog_refresh_interval > 0:
+        refresh_task = asyncio.create_task(
+            refresh_catalogs_periodically(settings.catalog_refresh_interval)
+        )
+    yield
+    if refresh_task is not None:
+        refresh_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresh_task
+    await jobs.job_store.close()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
+
+
 # noinspection PyTypeChecker
 app = FastAPI(
     title="aind-metadata-service",
     description=description,
     summary="Serves data from various databases at AIND.",
     version=service_version,
+    lifespan=lifespan,
 )
 
 # noinspection PyTypeChecker
@@ -72,12 +126,25 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["GET"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID"],
 )
+app.add_middleware(ServerTimingMiddleware)
+# Profiling is only installed when enabled, so it costs nothing when off
+if settings.profiling_token is not None:
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.profiling_token.get_secret_value(),
+        routes=settings.profiling_routes,
+    )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 # Set operation IDs for each router before including
 routers = [
     v1_proxy.router,
     healthcheck.router,
+    metrics.router,
     funding.router,
     intended_measurements.router,
     procedures.router,
@@ -88,6 +155,8 @@ routers = [
     mgi_allele.router,
     injection_materials.router,
     dataverse.router,
+    metadata_bundle.router,
+    jobs.router,
     user_email.router,
     index.router,
 ]
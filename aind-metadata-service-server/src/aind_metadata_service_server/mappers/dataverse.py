@@ -1,14 +1,110 @@
 """Module to handle dataverse data mapping and filtering"""
 
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from statistics import fmean
+from typing import Dict, List, Optional, Set, Tuple
 
-from aind_metadata_service_server.models import MouseWeightData
+from aind_dataverse_service_async_client.models import EntityTableRow
+
+from aind_metadata_service_server.models import (
+    MouseWeightDailySummary,
+    MouseWeightData,
+)
+
+FORMATTED_VALUE_SUFFIX = "@OData.Community.Display.V1.FormattedValue"
+
+
+@lru_cache(maxsize=4096)
+def _is_kept_key(key: str) -> bool:
+    """
+    Classify a single Dataverse key. Formatted value annotations are kept,
+    while other annotations and private or lookup keys are dropped.
+
+    Parameters
+    ----------
+    key : str
+        A key from a Dataverse record
+
+    Returns
+    -------
+    bool
+        True if the key should be kept.
+    """
+    return key.endswith(FORMATTED_VALUE_SUFFIX) or not (
+        key.startswith("@") or "@" in key or key.startswith("_")
+    )
+
+
+@lru_cache(maxsize=1024)
+def _project_schema(schema: Tuple[str, ...]) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Compute the keys to keep for a record schema. Rows from the same table
+    share a schema, so the decision is only made once per table shape.
+
+    Parameters
+    ----------
+    schema : Tuple[str, ...]
+        The ordered keys of a record
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], bool]
+        The keys to keep and whether every key in the schema is kept.
+    """
+    kept_keys = tuple(key for key in schema if _is_kept_key(key))
+    return kept_keys, len(kept_keys) == len(schema)
+
+
+def _filter_list(data: List) -> List:
+    """
+    Filter every item in a list. The original list is returned if none of
+    its items needed to change.
+
+    Parameters
+    ----------
+    data : List
+
+    Returns
+    -------
+    List
+    """
+    filtered = [filter_dataverse_metadata(item) for item in data]
+    if all(new is old for new, old in zip(filtered, data)):
+        return data
+    return filtered
+
+
+def _filter_dict(data: Dict) -> Dict:
+    """
+    Project a record onto its kept keys. The original dict is returned if
+    no keys were dropped and none of its nested values needed to change.
+
+    Parameters
+    ----------
+    data : Dict
+
+    Returns
+    -------
+    Dict
+    """
+    kept_keys, all_kept = _project_schema(tuple(data))
+    changed = not all_kept
+    projected = {}
+    for key in kept_keys:
+        value = data[key]
+        filtered_value = filter_dataverse_metadata(value)
+        changed = changed or filtered_value is not value
+        projected[key] = filtered_value
+    return projected if changed else data
 
 
 def filter_dataverse_metadata(data: Dict) -> Dict:
     """
-    Filter out Dataverse metadata fields from the response.
+    Filter out Dataverse metadata fields from the response. Key decisions
+    are cached per key and per record schema, and structures that do not
+    contain metadata fields are returned as-is rather than copied.
     Parameters
     ----------
     data : Dict
@@ -20,22 +116,276 @@ def filter_dataverse_metadata(data: Dict) -> Dict:
         Filtered data with metadata fields removed
     """
     if isinstance(data, dict):
-        return {
-            key: filter_dataverse_metadata(value)
-            for key, value in data.items()
-            if (
-                key.endswith("@OData.Community.Display.V1.FormattedValue")
-                or not (
-                    key.startswith("@") or "@" in key or key.startswith("_")
-                )
-            )
-        }
+        return _filter_dict(data)
     elif isinstance(data, list):
-        return [filter_dataverse_metadata(item) for item in data]
+        return _filter_list(data)
     else:
         return data
 
 
+class DataverseTableCatalog:
+    """Indexed list of the entity tables available in Dataverse"""
+
+    def __init__(self, tables: List[EntityTableRow]):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        tables : List[EntityTableRow]
+            Table information returned by the Dataverse service
+        """
+        self.tables = tables
+        self.entity_set_names = {
+            table.entitysetname for table in tables if table.entitysetname
+        }
+        self._search_keys = [
+            " ".join(
+                (
+                    table.entitysetname or "",
+                    table.logicalname or "",
+                    table.name or "",
+                )
+            ).lower()
+            for table in tables
+        ]
+
+    def __len__(self) -> int:
+        """Number of tables in the catalog"""
+        return len(self.tables)
+
+    def __contains__(self, entity_set_name: str) -> bool:
+        """Whether a table with the entity set name exists"""
+        return entity_set_name in self.entity_set_names
+
+    def search(self, query: str) -> List[EntityTableRow]:
+        """
+        Return tables whose entity set, logical, or display name contains
+        the query, ignoring case.
+
+        Parameters
+        ----------
+        query : str
+
+        Returns
+        -------
+        List[EntityTableRow]
+        """
+        query = query.lower()
+        return [
+            table
+            for table, search_key in zip(self.tables, self._search_keys)
+            if query in search_key
+        ]
+
+
+def get_column_names(records: List[Dict]) -> Set[str]:
+    """
+    Get the column names of a table from an unprojected Dataverse response.
+    Dataverse returns every column for every record, so the first record
+    is enough. Annotation keys are reduced to the column they annotate.
+
+    Parameters
+    ----------
+    records : List[Dict]
+        Records fetched without a column selection
+
+    Returns
+    -------
+    Set[str]
+    """
+    if not records:
+        return set()
+    column_names = {key.split("@", 1)[0] for key in records[0]}
+    column_names.discard("")
+    return column_names
+
+
+def get_unknown_columns(columns: str, known_columns: Set[str]) -> List[str]:
+    """
+    Get the columns in a comma-separated selection that are not known.
+
+    Parameters
+    ----------
+    columns : str
+        Comma-separated column names
+    known_columns : Set[str]
+
+    Returns
+    -------
+    List[str]
+    """
+    return [
+        column.strip()
+        for column in columns.split(",")
+        if column.strip() and column.strip() not in known_columns
+    ]
+
+
+def paginate_records(
+    records: List[Dict], top: Optional[int] = None, skip: int = 0
+) -> Tuple[List[Dict], Optional[int]]:
+    """
+    Slice a page of records out of a Dataverse response.
+
+    Parameters
+    ----------
+    records : List[Dict]
+        The dataverse response records
+    top : Optional[int]
+        Maximum number of records in the page. If None, all remaining
+        records are returned.
+    skip : int
+        Number of records to skip before the page starts
+
+    Returns
+    -------
+    Tuple[List[Dict], Optional[int]]
+        The page of records and the skip value of the next page, or None if
+        there are no more records.
+    """
+    if top is None:
+        return records[skip:], None
+    end = skip + top
+    next_skip = end if end < len(records) else None
+    return records[skip:end], next_skip
+
+
+def get_select_columns(field_sources: Dict[str, str]) -> str:
+    """
+    Build a comma-separated column selection from a mapping of model fields
+    to Dataverse keys. Annotation keys, such as FormattedValue, are reduced
+    to the column they annotate since Dataverse returns the annotations for
+    every selected column.
+
+    Parameters
+    ----------
+    field_sources : Dict[str, str]
+        Mapping of model field name to Dataverse record key
+
+    Returns
+    -------
+    str
+        Comma-separated column names without duplicates
+    """
+    columns = dict.fromkeys(
+        source.split("@", 1)[0] for source in field_sources.values()
+    )
+    return ",".join(columns)
+
+
+MOUSE_WEIGHT_RECORDS_TABLE = "aibs_fact_mouse_weight_recordses"
+
+# Dataverse record keys read for each MouseWeightData field
+MOUSE_WEIGHT_FIELD_SOURCES: Dict[str, str] = {
+    "record_id": "aibs_fact_mouse_weight_recordsid",
+    "mouse_id": f"_aibs_mouse_id_value{FORMATTED_VALUE_SUFFIX}",
+    "weight": "aibs_weight",
+    "weight_datetime": "cr138_datetime",
+    "is_baseline_weight": "aibs_is_baseline_weight",
+    "operator": f"_aibs_operator_value{FORMATTED_VALUE_SUFFIX}",
+    "workstation": "aibs_workstation",
+    "software_version": "aibs_software_version",
+    "software_source": "aibs_software_source",
+    "status": f"statuscode{FORMATTED_VALUE_SUFFIX}",
+    "notes": "aibs_notes",
+}
+
+MOUSE_WEIGHT_COLUMNS = get_select_columns(MOUSE_WEIGHT_FIELD_SOURCES)
+# Only the columns read by aggregate_daily_mouse_weights
+MOUSE_WEIGHT_DAILY_COLUMNS = get_select_columns(
+    {
+        field: MOUSE_WEIGHT_FIELD_SOURCES[field]
+        for field in ["weight", "weight_datetime", "is_baseline_weight"]
+    }
+)
+
+
+def _format_odata_datetime(value: datetime) -> str:
+    """
+    Format a datetime as an OData UTC datetime literal. Naive datetimes are
+    assumed to already be in UTC.
+
+    Parameters
+    ----------
+    value : datetime
+
+    Returns
+    -------
+    str
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_mouse_weight_filter(
+    subject_ids: List[str],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> str:
+    """
+    Build an OData filter expression for the mouse weight records table.
+
+    Parameters
+    ----------
+    subject_ids : List[str]
+        One or more subject IDs to match
+    start : Optional[datetime]
+        If set, only match records measured at or after this datetime
+    end : Optional[datetime]
+        If set, only match records measured before this datetime
+
+    Returns
+    -------
+    str
+        OData filter expression
+    """
+    subject_clauses = []
+    for subject_id in subject_ids:
+        escaped_id = subject_id.replace("'", "''")
+        subject_clauses.append(
+            f"aibs_mouse_id/aibs_mouse_id eq '{escaped_id}'"
+        )
+    if len(subject_clauses) == 1:
+        filter_query = subject_clauses[0]
+    else:
+        filter_query = f"({' or '.join(subject_clauses)})"
+    if start is not None:
+        start_str = _format_odata_datetime(start)
+        filter_query += f" and cr138_datetime ge {start_str}"
+    if end is not None:
+        end_str = _format_odata_datetime(end)
+        filter_query += f" and cr138_datetime lt {end_str}"
+    return filter_query
+
+
+def group_mouse_weight_records(
+    records: List[MouseWeightData], subject_ids: List[str]
+) -> Dict[str, List[MouseWeightData]]:
+    """
+    Group mapped mouse weight records by subject ID.
+
+    Parameters
+    ----------
+    records : List[MouseWeightData]
+        Mapped records for any of the subject IDs
+    subject_ids : List[str]
+        The requested subject IDs. Every ID is present in the output, even
+        if no records were found for it.
+
+    Returns
+    -------
+    Dict[str, List[MouseWeightData]]
+        Records keyed by subject ID
+    """
+    grouped = {subject_id: [] for subject_id in subject_ids}
+    for record in records:
+        if record.mouse_id in grouped:
+            grouped[record.mouse_id].append(record)
+    return grouped
+
+
 def map_mouse_weight_records(
     dataverse_response: List[Dict],
 ) -> List[MouseWeightData]:
@@ -57,32 +407,75 @@ def map_mouse_weight_records(
 
     mapped_records = []
 
-    for i, record in enumerate(dataverse_response):
-        mapped_record = MouseWeightData(
-            record_id=record.get("aibs_fact_mouse_weight_recordsid"),
-            mouse_id=record.get(
-                "_aibs_mouse_id_value@OData.Community.Display.V1."
-                "FormattedValue"
-            ),
-            weight=record.get("aibs_weight"),
-            weight_datetime=_parse_datetime(record.get("cr138_datetime")),
-            is_baseline_weight=record.get("aibs_is_baseline_weight"),
-            operator=record.get(
-                "_aibs_operator_value@OData.Community.Display.V1."
-                "FormattedValue"
-            ),
-            workstation=record.get("aibs_workstation"),
-            software_version=record.get("aibs_software_version"),
-            software_source=record.get("aibs_software_source"),
-            status=record.get(
-                "statuscode@OData.Community.Display.V1.FormattedValue"
-            ),
-            notes=record.get("aibs_notes"),
-        )
-        mapped_records.append(mapped_record)
+    for record in dataverse_response:
+        values = {
+            field: record.get(source)
+            for field, source in MOUSE_WEIGHT_FIELD_SOURCES.items()
+        }
+        values["weight_datetime"] = _parse_datetime(values["weight_datetime"])
+        mapped_records.append(MouseWeightData(**values))
     return mapped_records
 
 
+def aggregate_daily_mouse_weights(
+    dataverse_response: List[Dict], baseline_only: bool = False
+) -> List[MouseWeightDailySummary]:
+    """
+    Summarize raw Dataverse mouse weight records per UTC calendar day. The
+    weight and datetime columns are read straight from the records, so no
+    per-record models are built.
+
+    Parameters
+    ----------
+    dataverse_response : List[Dict]
+        The raw Dataverse API response as a list of records
+    baseline_only : bool
+        If True, only records flagged as baseline weights are summarized.
+
+    Returns
+    -------
+    List[MouseWeightDailySummary]
+        One summary per day that has records, sorted by day
+    """
+    weight_key = MOUSE_WEIGHT_FIELD_SOURCES["weight"]
+    datetime_key = MOUSE_WEIGHT_FIELD_SOURCES["weight_datetime"]
+    baseline_key = MOUSE_WEIGHT_FIELD_SOURCES["is_baseline_weight"]
+
+    measurements_by_day: Dict[date, List[Tuple[datetime, float]]] = (
+        defaultdict(list)
+    )
+    for record in dataverse_response or []:
+        if baseline_only and not record.get(baseline_key):
+            continue
+        weight = record.get(weight_key)
+        weight_datetime = _parse_datetime(record.get(datetime_key))
+        if weight is None or weight_datetime is None:
+            continue
+        measurements_by_day[weight_datetime.date()].append(
+            (weight_datetime, weight)
+        )
+
+    summaries = []
+    for day in sorted(measurements_by_day):
+        measurements = measurements_by_day[day]
+        weights = [weight for _, weight in measurements]
+        latest_datetime, latest_weight = max(
+            measurements, key=lambda measurement: measurement[0]
+        )
+        summaries.append(
+            MouseWeightDailySummary(
+                day=day,
+                count=len(weights),
+                min_weight=min(weights),
+                mean_weight=fmean(weights),
+                max_weight=max(weights),
+                latest_weight=latest_weight,
+                latest_weight_datetime=latest_datetime,
+            )
+        )
+    return summaries
+
+
 def _parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
     """
     Parse ISO datetime string to datetime object.
@@ -3,7 +3,8 @@ aind-data-schema Funding model."""
 
 import logging
 import re
-from typing import List, Optional, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
 
 from aind_data_schema.components.identifiers import Person
 from aind_data_schema.core.data_description import Funding
@@ -11,6 +12,8 @@ from aind_data_schema_models.organizations import Organization
 from aind_smartsheet_service_async_client.models import FundingModel
 from pydantic import ValidationError
 
+from aind_metadata_service_server.models import ProjectNameMatch
+
 
 class FundingMapper:
     """Class to handle mapping of funding data"""
@@ -182,3 +185,217 @@ class FundingMapper:
                 project_names.add(f"{project_name} - {subproject_name}")
 
         return sorted(list(project_names))
+
+
+class ProjectNameIndex:
+    """
+    Trigram index over project names used to suggest the intended project
+    when a requested name does not match exactly. Names are compared after
+    normalizing case, punctuation and spacing, so variations around the
+    ' - ' subproject separator still match.
+    """
+
+    def __init__(self, project_names: List[str]):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        project_names : List[str]
+        """
+        self.project_names = project_names
+        self._normalized = [self.normalize(n) for n in project_names]
+        self._trigram_counts = []
+        self._postings: Dict[str, List[int]] = {}
+        for i, normalized_name in enumerate(self._normalized):
+            trigrams = self.trigrams(normalized_name)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(i)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Lowercase a name and collapse punctuation and whitespace runs into
+        single spaces.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        str
+        """
+        return " ".join(re.findall(r"[a-z0-9]+", name.lower()))
+
+    @staticmethod
+    def trigrams(normalized_name: str) -> Set[str]:
+        """
+        Set of character trigrams in a normalized name, padded so that
+        short names and word boundaries are represented.
+
+        Parameters
+        ----------
+        normalized_name : str
+
+        Returns
+        -------
+        Set[str]
+        """
+        padded = f"  {normalized_name} "
+        return {
+            "".join(chars) for chars in zip(padded, padded[1:], padded[2:])
+        }
+
+    def search(
+        self, query: str, limit: int = 10, min_score: float = 0.3
+    ) -> List[ProjectNameMatch]:
+        """
+        Rank project names by similarity to a query. The score is the Dice
+        coefficient of the trigram sets. Names containing the whole query
+        score at least 0.5, more the closer the query is to the full name.
+
+        Parameters
+        ----------
+        query : str
+        limit : int
+            Maximum number of matches to return. Default is 10.
+        min_score : float
+            Matches scoring below this are dropped. Default is 0.3.
+
+        Returns
+        -------
+        List[ProjectNameMatch]
+            Best matches first
+        """
+        normalized_query = self.normalize(query)
+        if not normalized_query:
+            return []
+        query_trigrams = self.trigrams(normalized_query)
+        shared_counts = Counter(
+            i
+            for trigram in query_trigrams
+            for i in self._postings.get(trigram, [])
+        )
+        scored = []
+        for i, shared in shared_counts.items():
+            score = (
+                2 * shared / (len(query_trigrams) + self._trigram_counts[i])
+            )
+            normalized_name = self._normalized[i]
+            if normalized_query in normalized_name:
+                coverage = len(normalized_query) / len(normalized_name)
+                score = max(score, 0.5 + 0.5 * coverage)
+            if score >= min_score:
+                scored.append((-score, self.project_names[i]))
+        scored.sort()
+        return [
+            ProjectNameMatch(name=name, score=round(-neg_score, 3))
+            for neg_score, name in scored[:limit]
+        ]
+
+
+class FundingSnapshot:
+    """
+    Indexed copy of the funding sheet. Built once per refresh so routes can
+    look up rows, subprojects, investigators and project names without
+    scanning the sheet.
+    """
+
+    def __init__(self, smartsheet_funding: List[FundingModel]):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        smartsheet_funding : List[FundingModel]
+            Every row of the funding sheet
+        """
+        self.rows = smartsheet_funding
+        self.rows_by_project: Dict[
+            Tuple[str, Optional[str]], List[FundingModel]
+        ] = {}
+        self.subprojects_by_project: Dict[str, List[str]] = {}
+        project_names = set()
+        for row in smartsheet_funding:
+            if row.project_name is None:
+                continue
+            self.rows_by_project.setdefault(
+                (row.project_name, None), []
+            ).append(row)
+            if row.subproject is None:
+                project_names.add(row.project_name)
+                continue
+            self.rows_by_project.setdefault(
+                (row.project_name, row.subproject), []
+            ).append(row)
+            subprojects = self.subprojects_by_project.setdefault(
+                row.project_name, []
+            )
+            if row.subproject not in subprojects:
+                subprojects.append(row.subproject)
+            project_names.add(f"{row.project_name} - {row.subproject}")
+        self.project_names: List[str] = sorted(project_names)
+        self.project_name_index = ProjectNameIndex(self.project_names)
+        self.investigators_by_project: Dict[
+            Tuple[str, Optional[str]], List[Person]
+        ] = {
+            key: FundingMapper(rows).get_investigators_list()
+            for key, rows in self.rows_by_project.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of rows in the funding sheet."""
+        return len(self.rows)
+
+    def get_rows(
+        self, project_name: str, subproject: Optional[str] = None
+    ) -> List[FundingModel]:
+        """
+        Return the rows for a project. If subproject is None, rows for every
+        subproject of the project are returned.
+
+        Parameters
+        ----------
+        project_name : str
+        subproject : Optional[str]
+
+        Returns
+        -------
+        List[FundingModel]
+        """
+        return self.rows_by_project.get((project_name, subproject), [])
+
+    def has_subprojects(self, project_name: str) -> bool:
+        """
+        Check whether a project is split into subprojects.
+
+        Parameters
+        ----------
+        project_name : str
+
+        Returns
+        -------
+        bool
+        """
+        return bool(self.subprojects_by_project.get(project_name))
+
+    def get_investigators(
+        self, project_name: str, subproject: Optional[str] = None
+    ) -> List[Person]:
+        """
+        Return the investigators for a project or subproject.
+
+        Parameters
+        ----------
+        project_name : str
+        subproject : Optional[str]
+
+        Returns
+        -------
+        List[Person]
+        """
+        return list(
+            self.investigators_by_project.get((project_name, subproject), [])
+        )
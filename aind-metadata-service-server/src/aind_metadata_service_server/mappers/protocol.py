@@ -2,7 +2,7 @@
 Protocols model."""
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 
 from aind_smartsheet_service_async_client.models import ProtocolsModel
 from pydantic import ValidationError
@@ -74,3 +74,73 @@ class ProtocolMapper:
                 version=version,
                 protocol_collection=protocol_collection,
             )
+
+
+class ProtocolCatalog:
+    """
+    In-memory copy of the protocols sheet indexed by protocol name, with
+    each protocol already mapped to ProtocolInformation.
+    """
+
+    def __init__(self, smartsheet_protocols: List[ProtocolsModel]):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        smartsheet_protocols : List[ProtocolsModel]
+            Every row of the protocols sheet
+        """
+        self.protocols_by_name: Dict[str, List[ProtocolsModel]] = {}
+        for smartsheet_protocol in smartsheet_protocols:
+            if smartsheet_protocol.protocol_name is not None:
+                self.protocols_by_name.setdefault(
+                    smartsheet_protocol.protocol_name, []
+                ).append(smartsheet_protocol)
+        self.protocol_information_by_name: Dict[
+            str, List[ProtocolInformation]
+        ] = {
+            name: [
+                ProtocolMapper(protocol).map_to_protocol_information()
+                for protocol in protocols
+            ]
+            for name, protocols in self.protocols_by_name.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of protocol names in the catalog."""
+        return len(self.protocols_by_name)
+
+    def __contains__(self, protocol_name: str) -> bool:
+        """Check whether a protocol name is in the catalog."""
+        return protocol_name in self.protocols_by_name
+
+    def get_protocols(self, protocol_name: str) -> List[ProtocolsModel]:
+        """
+        Rows of the protocols sheet with the given protocol name.
+
+        Parameters
+        ----------
+        protocol_name : str
+
+        Returns
+        -------
+        List[ProtocolsModel]
+        """
+        return self.protocols_by_name.get(protocol_name, [])
+
+    def get_protocol_information(
+        self, protocol_name: str
+    ) -> List[ProtocolInformation]:
+        """
+        Mapped protocols with the given protocol name.
+
+        Parameters
+        ----------
+        protocol_name : str
+
+        Returns
+        -------
+        List[ProtocolInformation]
+        """
+        return self.protocol_information_by_name.get(protocol_name, [])
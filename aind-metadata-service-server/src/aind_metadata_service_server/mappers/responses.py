@@ -6,6 +6,8 @@ from typing import List, Union
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
 
+from aind_metadata_service_server.metrics import mapping_stage
+
 
 def map_to_response(model: Union[BaseModel, List[BaseModel]]) -> JSONResponse:
     """
@@ -14,21 +16,30 @@ def map_to_response(model: Union[BaseModel, List[BaseModel]]) -> JSONResponse:
     will return a 400 status code with the validation errors in the headers
     under the 'X-Error-Message' key.
     """
-
+    model_name = (
+        type(model[0]).__name__
+        if isinstance(model, list) and model
+        else type(model).__name__
+    )
     try:
-        if isinstance(model, list):
-            for item in model:
-                item.model_validate(item.model_dump())
-            content = [item.model_dump(mode="json") for item in model]
-        else:
-            validate = model.model_validate(model.model_dump())
-            content = validate.model_dump(mode="json")
-        return JSONResponse(content=content)
+        with mapping_stage("validate_response", model_name):
+            if isinstance(model, list):
+                for item in model:
+                    item.model_validate(item.model_dump())
+            else:
+                model = model.model_validate(model.model_dump())
+        with mapping_stage("serialize_response", model_name):
+            if isinstance(model, list):
+                content = [item.model_dump(mode="json") for item in model]
+            else:
+                content = model.model_dump(mode="json")
+            return JSONResponse(content=content)
     except ValidationError as e:
-        if isinstance(model, list):
-            content = [item.model_dump(mode="json") for item in model]
-        else:
-            content = model.model_dump(mode="json")
+        with mapping_stage("serialize_response", model_name):
+            if isinstance(model, list):
+                content = [item.model_dump(mode="json") for item in model]
+            else:
+                content = model.model_dump(mode="json")
 
         errors = e.json(
             include_url=False, include_context=False, include_input=False
@@ -0,0 +1,284 @@
+"""Module for Prometheus metrics"""
+
+import inspect
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterable, Iterator
+
+from opentelemetry.trace import SpanKind
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from aind_metadata_service_server.caches import get_registered_caches
+from aind_metadata_service_server.timing import record_duration
+from aind_metadata_service_server.tracing import tracer
+
+# Backend calls can take minutes, so the default buckets are extended
+LATENCY_BUCKETS = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request, including streaming the response",
+    ["method", "route", "status_code"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Number of requests being handled",
+    ["method"],
+)
+BACKEND_CALL_DURATION = Histogram(
+    "backend_call_duration_seconds",
+    "Time spent waiting on a backend client call",
+    ["client", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+BACKEND_CALLS_IN_PROGRESS = Gauge(
+    "backend_calls_in_progress",
+    "Number of backend client calls waiting on a response",
+    ["client"],
+)
+MAPPING_DURATION = Histogram(
+    "mapping_duration_seconds",
+    "Time spent mapping backend responses and serializing models",
+    ["step", "model"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop monitor's heartbeat woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks",
+    "Times the event loop was blocked for longer than the threshold",
+    ["location"],
+)
+
+
+@contextmanager
+def mapping_stage(step: str, model: str) -> Iterator[None]:
+    """
+    Time a mapping or serialization step in a histogram, a span and the
+    request's Server-Timing header.
+
+    Parameters
+    ----------
+    step : str
+        Name of the step, such as map_responses_to_aind_procedures
+    model : str
+        Name of the model being built, such as Procedures
+    """
+    start = time.perf_counter()
+    try:
+        with tracer.start_as_current_span(
+            step, attributes={"aind.model": model}
+        ):
+            yield
+    finally:
+        seconds = time.perf_counter() - start
+        MAPPING_DURATION.labels(step=step, model=model).observe(seconds)
+        record_duration(step, seconds, model)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records the latency and status of every request.
+    Requests are labelled with their route template, such as
+    /api/v2/subject/{subject_id}, so subject IDs do not become labels.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        app : ASGIApp
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle a request and record its metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            """Remember the status code of the response."""
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        in_progress = REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(
+                method=method, route=route, status_code=str(status_code)
+            ).observe(time.perf_counter() - start)
+
+
+@contextmanager
+def backend_call(client: str, operation: str) -> Iterator[None]:
+    """
+    Time a backend call in a histogram, a client span and the request's
+    Server-Timing header. The call's outcome is error if it raises.
+
+    Parameters
+    ----------
+    client : str
+        Name of the backend, such as labtracks
+    operation : str
+        Name of the call, such as get_subject
+    """
+    outcome = "error"
+    start = time.perf_counter()
+    in_progress = BACKEND_CALLS_IN_PROGRESS.labels(client=client)
+    in_progress.inc()
+    try:
+        with tracer.start_as_current_span(
+            f"{client}.{operation}",
+            kind=SpanKind.CLIENT,
+            attributes={"aind.backend": client, "aind.operation": operation},
+        ):
+            yield
+        outcome = "success"
+    finally:
+        in_progress.dec()
+        seconds = time.perf_counter() - start
+        BACKEND_CALL_DURATION.labels(
+            client=client, operation=operation, outcome=outcome
+        ).observe(seconds)
+        record_duration(f"{client}.{operation}", seconds)
+
+
+class InstrumentedApi:
+    """
+    Wraps a backend client so that every public async operation, such as
+    get_subject, records its latency and outcome, adds it to the request's
+    Server-Timing header, and runs in a client span. Synchronous operations
+    are only timed if they are listed, since clients also expose helpers.
+    """
+
+    def __init__(
+        self,
+        client: str,
+        api_instance: Any,
+        sync_operations: Iterable[str] = (),
+    ):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        client : str
+            Name of the backend, used as a label
+        api_instance : Any
+            Generated DefaultApi object, or another client such as an
+            httpx.AsyncClient
+        sync_operations : Iterable[str]
+            Names of synchronous methods that call the backend. Default is
+            no methods.
+        """
+        self._client = client
+        self._api_instance = api_instance
+        self._sync_operations = frozenset(sync_operations)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute, timing it if it is a public operation."""
+        attribute = getattr(self._api_instance, name)
+        if name in self._sync_operations:
+            return self._instrument_sync(name, attribute)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attribute):
+            return attribute
+        return self._instrument(name, attribute)
+
+    def _instrument(self, operation: str, call: Callable) -> Callable:
+        """Wrap an async operation to record its metrics."""
+
+        @wraps(call)
+        async def instrumented_call(*args, **kwargs):
+            """Await the operation and record how long it took."""
+            with backend_call(self._client, operation):
+                return await call(*args, **kwargs)
+
+        return instrumented_call
+
+    def _instrument_sync(self, operation: str, call: Callable) -> Callable:
+        """Wrap a synchronous operation to record its metrics."""
+
+        @wraps(call)
+        def instrumented_call(*args, **kwargs):
+            """Call the operation and record how long it took."""
+            with backend_call(self._client, operation):
+                return call(*args, **kwargs)
+
+        return instrumented_call
+
+
+class CacheCollector(Collector):
+    """Reports hits, misses, sizes and hit ratios of the service caches."""
+
+    def collect(self) -> Iterator:
+        """Yield cache metrics, combining caches that share a name."""
+        totals = defaultdict(lambda: [0, 0, 0])
+        for cache in get_registered_caches():
+            total = totals[cache.name]
+            total[0] += cache.hits
+            total[1] += cache.misses
+            total[2] += len(cache)
+        hits = CounterMetricFamily(
+            "cache_hits", "Lookups served from a cache", labels=["cache"]
+        )
+        misses = CounterMetricFamily(
+            "cache_misses", "Lookups not found in a cache", labels=["cache"]
+        )
+        entries = GaugeMetricFamily(
+            "cache_entries", "Number of entries in a cache", labels=["cache"]
+        )
+        hit_ratio = GaugeMetricFamily(
+            "cache_hit_ratio",
+            "Fraction of lookups served from a cache since it was cleared",
+            labels=["cache"],
+        )
+        for name, (cache_hits, cache_misses, size) in sorted(totals.items()):
+            lookups = cache_hits + cache_misses
+            hits.add_metric([name], cache_hits)
+            misses.add_metric([name], cache_misses)
+            entries.add_metric([name], size)
+            hit_ratio.add_metric(
+                [name], cache_hits / lookups if lookups else 0
+            )
+        yield hits
+        yield misses
+        yield entries
+        yield hit_ratio
+
+
+REGISTRY.register(CacheCollector())
@@ -1,7 +1,8 @@
 """Models and schema definitions for backend data structures"""
 
-from datetime import datetime
-from typing import Literal, Optional
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Literal, Optional
 
 from aind_data_schema.components.injection_procedures import ViralMaterial
 from pydantic import BaseModel, Field, field_validator
@@ -87,3 +88,141 @@ class MouseWeightData(BaseModel):
     )
     status: Optional[str] = Field(default=None, description="Record status")
     notes: Optional[str] = Field(default=None, description="Additional notes")
+
+
+class MouseWeightRecordsRequest(BaseModel):
+    """Request body to fetch mouse weight records for many subjects"""
+
+    subject_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Subject IDs to fetch mouse weight records for",
+    )
+    start: Optional[datetime] = Field(
+        default=None,
+        description="Only return records measured at or after this datetime",
+    )
+    end: Optional[datetime] = Field(
+        default=None,
+        description="Only return records measured before this datetime",
+    )
+
+
+class MouseWeightAggregation(str, Enum):
+    """Options to aggregate mouse weight records per day"""
+
+    DAILY = "daily"
+    BASELINE = "baseline"
+
+
+class MouseWeightDailySummary(BaseModel):
+    """Summary of the mouse weight records measured on a single day"""
+
+    day: date = Field(..., description="UTC calendar day of the records")
+    count: int = Field(..., description="Number of records on the day")
+    min_weight: float = Field(..., description="Minimum weight in grams")
+    mean_weight: float = Field(..., description="Mean weight in grams")
+    max_weight: float = Field(..., description="Maximum weight in grams")
+    latest_weight: float = Field(
+        ..., description="Weight in grams of the last record on the day"
+    )
+    latest_weight_datetime: datetime = Field(
+        ..., description="When the last record on the day was measured"
+    )
+
+
+class ProjectNameMatch(BaseModel):
+    """Project name returned by a fuzzy project name search"""
+
+    name: str = Field(
+        ..., description="Project name, including any ' - Subproject' suffix"
+    )
+    score: float = Field(
+        ..., description="Similarity to the query from 0 to 1", ge=0, le=1
+    )
+
+
+class InjectionMaterialsBatchRequest(BaseModel):
+    """Request body to fetch injection materials for many prep lots"""
+
+    prep_lot_numbers: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="TARS prep lot numbers to fetch injection materials for",
+    )
+
+
+class InjectionMaterialsResult(BaseModel):
+    """Injection materials found for a single prep lot"""
+
+    viral_materials: List[ViralMaterialInformation] = Field(
+        default=[], description="Viral materials for each prep in the lot"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description=(
+            "Set if the lot was not found, the lookup failed, or the viral "
+            "materials did not pass validation"
+        ),
+    )
+
+
+class CapturedResponse(BaseModel):
+    """Outcome of an endpoint embedded in a bundle or batch response"""
+
+    status_code: int = Field(
+        ..., description="Status code the endpoint would return on its own"
+    )
+    data: Optional[Any] = Field(
+        default=None, description="Response body of the endpoint"
+    )
+    error: Optional[Any] = Field(
+        default=None,
+        description="Error detail, or validation errors for a 400 status",
+    )
+
+
+class MetadataBundle(BaseModel):
+    """Metadata from several endpoints for a single subject"""
+
+    subject_id: str = Field(..., description="Subject ID of the bundle")
+    parts: Dict[str, CapturedResponse] = Field(
+        ...,
+        description=(
+            "Parts keyed by name: subject, procedures, intended_measurements "
+            "and mouse_weights"
+        ),
+    )
+
+
+class SubjectBatchRequest(BaseModel):
+    """Request body to fetch metadata for many subjects"""
+
+    subject_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="Subject IDs to fetch metadata for",
+    )
+
+
+class JobStatus(BaseModel):
+    """Status of an asynchronous job and its result once finished"""
+
+    job_id: str = Field(..., description="ID to poll the job with")
+    kind: str = Field(..., description="Kind of job, such as procedures")
+    status: Literal["pending", "completed"] = Field(
+        ..., description="Whether the job is still running"
+    )
+    submitted_at: datetime = Field(..., description="When the job started")
+    completed_at: Optional[datetime] = Field(
+        default=None, description="When the job finished"
+    )
+    result: Optional[CapturedResponse] = Field(
+        default=None,
+        description=(
+            "Outcome of the underlying endpoint, set once the job completes"
+        ),
+    )
@@ -0,0 +1,139 @@
+"""Module to profile requests on demand"""
+
+import secrets
+from typing import Any, List, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_FORMAT_HEADER = "X-Profile-Format"
+
+
+def import_profiler() -> Any:
+    """
+    Import the sampling profiler.
+
+    Returns
+    -------
+    type
+        pyinstrument's Profiler class
+
+    Raises
+    ------
+    ImportError
+        If the profiling extra is not installed.
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError as e:
+        raise ImportError(
+            "Profiling requires the profiling extra. Install it with "
+            "pip install aind-metadata-service-server[profiling]"
+        ) from e
+    return Profiler
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that runs a request under a sampling profiler when it
+    has an X-Profile-Token header matching the admin token, and returns the
+    profile instead of the payload. Only routes in a list of targets, such
+    as /api/v2/procedures/{subject_id}, can be profiled. Requests without
+    the header only pay for a header lookup.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str,
+        routes: List[str],
+        interval: float = 0.001,
+    ):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        app : ASGIApp
+        token : str
+            Admin token that requests must send to be profiled
+        routes : List[str]
+            Route templates that can be profiled
+        interval : float
+            Seconds between samples. Default is 0.001.
+
+        Raises
+        ------
+        ImportError
+            If the profiling extra is not installed.
+        """
+        self.app = app
+        self.token = token
+        self.routes = routes
+        self.interval = interval
+        self._profiler_class = import_profiler()
+
+    def _matches_target(self, scope: Scope) -> bool:
+        """Whether the request is for one of the target routes."""
+        for route in scope["app"].router.routes:
+            if getattr(route, "path", None) not in self.routes:
+                continue
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return True
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle a request, profiling it if requested."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        token = headers.get(PROFILE_TOKEN_HEADER)
+        if token is None:
+            await self.app(scope, receive, send)
+            return
+        error_response: Optional[JSONResponse] = None
+        if not secrets.compare_digest(token.encode(), self.token.encode()):
+            error_response = JSONResponse(
+                status_code=403, content={"detail": "Invalid profiling token"}
+            )
+        elif not self._matches_target(scope):
+            error_response = JSONResponse(
+                status_code=400,
+                content={
+                    "detail": (
+                        f"Only these routes can be profiled: {self.routes}"
+                    )
+                },
+            )
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        status_code = 500
+
+        async def discard_response(message: Message) -> None:
+            """Remember the status code and drop the payload."""
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        profiler = self._profiler_class(
+            interval=self.interval, async_mode="enabled"
+        )
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard_response)
+        finally:
+            profiler.stop()
+        if headers.get(PROFILE_FORMAT_HEADER) == "text":
+            response = PlainTextResponse(
+                profiler.output_text(unicode=True, color=False)
+            )
+        else:
+            response = HTMLResponse(profiler.output_html())
+        response.headers["X-Profiled-Status-Code"] = str(status_code)
+        await response(scope, receive, send)
@@ -1,20 +1,215 @@
 """Module to handle dataverse endpoints"""
 
+import json
+import logging
+from asyncio import to_thread
 from datetime import datetime, timedelta
-from typing import List
+from functools import partial
+from typing import Dict, Iterator, List
 
 from aind_dataverse_service_async_client.exceptions import ApiException
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 
+from aind_metadata_service_server.caches import MISSING, TTLCache
 from aind_metadata_service_server.mappers.dataverse import (
+    MOUSE_WEIGHT_COLUMNS,
+    MOUSE_WEIGHT_DAILY_COLUMNS,
+    MOUSE_WEIGHT_RECORDS_TABLE,
+    DataverseTableCatalog,
+    aggregate_daily_mouse_weights,
+    build_mouse_weight_filter,
     filter_dataverse_metadata,
+    get_column_names,
+    get_unknown_columns,
+    group_mouse_weight_records,
     map_mouse_weight_records,
+    paginate_records,
+)
+from aind_metadata_service_server.models import (
+    MouseWeightAggregation,
+    MouseWeightDailySummary,
+    MouseWeightData,
+    MouseWeightRecordsRequest,
+)
+from aind_metadata_service_server.sessions import (
+    get_dataverse_api_instance,
+    settings,
+)
+from aind_metadata_service_server.utils import (
+    chunked,
+    gather_with_concurrency,
 )
-from aind_metadata_service_server.models import MouseWeightData
-from aind_metadata_service_server.sessions import get_dataverse_api_instance
 
 router = APIRouter()
 
+# Seconds to wait for a whole table, which may be large
+TABLE_EXPORT_TIMEOUT = 60
+
+table_catalog_cache = TTLCache(
+    name="dataverse_table_catalog",
+    ttl=settings.dataverse_catalog_ttl,
+    maxsize=1,
+    negative_ttl=0,
+    stale_if_error=True,
+)
+# Remembers that the catalog was reloaded for an unknown table
+table_catalog_reloads = TTLCache(
+    name="dataverse_table_catalog_reloads",
+    ttl=settings.dataverse_catalog_reload_interval,
+    maxsize=1,
+)
+table_columns_cache = TTLCache(
+    name="dataverse_table_columns",
+    ttl=settings.dataverse_catalog_ttl,
+    negative_ttl=0,
+)
+# Whole tables fetched for paged requests, so later pages reuse them.
+# Tables with more than dataverse_table_page_max_records are not kept.
+table_page_cache = TTLCache(
+    name="dataverse_table_pages",
+    ttl=settings.dataverse_table_page_ttl,
+    maxsize=8,
+    negative_ttl=0,
+)
+
+
+async def load_table_catalog(dataverse_api_instance) -> DataverseTableCatalog:
+    """
+    Load the table catalog from Dataverse.
+
+    Parameters
+    ----------
+    dataverse_api_instance : DefaultApi
+
+    Returns
+    -------
+    DataverseTableCatalog
+    """
+    tables = await dataverse_api_instance.get_table_info(_request_timeout=10)
+    return DataverseTableCatalog(tables or [])
+
+
+async def get_table_catalog(dataverse_api_instance) -> DataverseTableCatalog:
+    """
+    Return the cached Dataverse table catalog, loading it if needed.
+
+    Parameters
+    ----------
+    dataverse_api_instance : DefaultApi
+
+    Returns
+    -------
+    DataverseTableCatalog
+    """
+    return await table_catalog_cache.get_or_fetch(
+        "tables", partial(load_table_catalog, dataverse_api_instance)
+    )
+
+
+async def reload_table_catalog(
+    dataverse_api_instance, catalog: DataverseTableCatalog
+) -> DataverseTableCatalog:
+    """
+    Reload the cached catalog so that tables created since it was loaded are
+    found. The catalog is reloaded at most once every
+    dataverse_catalog_reload_interval seconds.
+
+    Parameters
+    ----------
+    dataverse_api_instance : DefaultApi
+    catalog : DataverseTableCatalog
+        Catalog that is returned if it is not reloaded
+
+    Returns
+    -------
+    DataverseTableCatalog
+    """
+    if table_catalog_reloads.get("tables", None) is not None:
+        return catalog
+    table_catalog_reloads.set("tables", True)
+    reloaded = await table_catalog_cache.refresh(
+        "tables", partial(load_table_catalog, dataverse_api_instance)
+    )
+    return catalog if reloaded is MISSING else reloaded
+
+
+async def validate_table_request(
+    dataverse_api_instance, entity_set_table_name: str, columns: str | None
+) -> None:
+    """
+    Reject requests for tables that are not in the catalog, or for columns
+    that are not in a table whose columns have been seen before. Unknown
+    tables are looked up again in a reloaded catalog before being rejected.
+    Validation is skipped if the catalog cannot be loaded.
+
+    Parameters
+    ----------
+    dataverse_api_instance : DefaultApi
+    entity_set_table_name : str
+    columns : str | None
+        Comma-separated column names
+
+    Raises
+    ------
+    HTTPException
+        404 for unknown tables and 400 for unknown columns
+    """
+    try:
+        catalog = await get_table_catalog(dataverse_api_instance)
+    except Exception as e:
+        # The catalog is an optimization, so requests are still forwarded
+        logging.warning(f"Unable to load Dataverse table catalog: {e}")
+        catalog = None
+    if catalog and entity_set_table_name not in catalog:
+        catalog = await reload_table_catalog(dataverse_api_instance, catalog)
+    if catalog and entity_set_table_name not in catalog:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Table {entity_set_table_name} not found",
+        )
+    known_columns = table_columns_cache.get(entity_set_table_name, None)
+    if columns and known_columns:
+        unknown_columns = get_unknown_columns(columns, known_columns)
+        if unknown_columns:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Unknown columns for {entity_set_table_name}: "
+                    f"{', '.join(unknown_columns)}"
+                ),
+            )
+
+
+def learn_table_columns(
+    entity_set_table_name: str, columns: str | None, records: List[Dict]
+) -> None:
+    """
+    Remember the columns of a table from a response fetched without a
+    column selection.
+
+    Parameters
+    ----------
+    entity_set_table_name : str
+    columns : str | None
+        The column selection used for the request
+    records : List[Dict]
+        The raw Dataverse records
+    """
+    if columns is None and records:
+        table_columns_cache.set(
+            entity_set_table_name, get_column_names(records)
+        )
+
 
 @router.get(
     "/api/v2/dataverse/tables",
@@ -23,18 +218,32 @@ router = APIRouter()
     },
 )
 async def get_dataverse_table_info(
+    search: str | None = Query(
+        default=None,
+        description=(
+            "Only return tables whose entity set, logical, or display name "
+            "contains this text, ignoring case"
+        ),
+        openapi_examples={
+            "default": {
+                "summary": "A sample search",
+                "description": "Example table name search",
+                "value": "project",
+            }
+        },
+    ),
     dataverse_api_instance=Depends(get_dataverse_api_instance),
 ):
     """
     ## Entity table identifying information
     Retrieves identifying information for all table entities in Dataverse.
+    The table catalog is cached and refreshed periodically.
     """
-    dataverse_response = await dataverse_api_instance.get_table_info(
-        _request_timeout=10
-    )
-    if not dataverse_response:
+    catalog = await get_table_catalog(dataverse_api_instance)
+    tables = catalog.search(search) if search else catalog.tables
+    if not tables:
         raise HTTPException(status_code=404, detail="Not found")
-    return dataverse_response
+    return tables
 
 
 @router.get(
@@ -44,6 +253,8 @@ async def get_dataverse_table_info(
     },
 )
 async def get_dataverse_table(
+    request: Request,
+    response: Response,
     entity_set_table_name: str = Path(
         ...,
         description="The entity set name of the table to fetch",
@@ -77,30 +288,158 @@ async def get_dataverse_table(
             }
         },
     ),
+    top: int | None = Query(
+        default=None,
+        ge=1,
+        description="Maximum number of records to return in a page",
+    ),
+    skip: int = Query(
+        default=0,
+        ge=0,
+        description="Number of records to skip before the page starts",
+    ),
     dataverse_api_instance=Depends(get_dataverse_api_instance),
 ):
     """
     ## Table Data
-    Retrieves data for a specific entity table in Dataverse.
+    Retrieves data for a specific entity table in Dataverse. Use top and skip
+    to page through large tables. If more records are available, a Link
+    header with rel="next" is returned. The table is fetched once for the
+    first page and kept briefly for the following pages.
     """
-    try:
+    await validate_table_request(
+        dataverse_api_instance, entity_set_table_name, columns
+    )
 
-        dataverse_response = await dataverse_api_instance.get_table(
+    async def fetch_table(timeout: int = 10) -> List[Dict]:
+        """Fetch the whole table from Dataverse"""
+        table = await dataverse_api_instance.get_table(
             entity_set_table_name,
             columns=columns,
             filter=filter,
-            _request_timeout=10,
+            _request_timeout=timeout,
         )
+        learn_table_columns(entity_set_table_name, columns, table)
+        return table
+
+    try:
+        if top is None and skip == 0:
+            dataverse_response = await fetch_table()
+        else:
+            # The backend cannot page, so pages are sliced from a table
+            # kept briefly for the requests that follow the next link
+            cache_key = (entity_set_table_name, columns, filter)
+            dataverse_response = await table_page_cache.get_or_fetch(
+                cache_key, partial(fetch_table, TABLE_EXPORT_TIMEOUT)
+            )
+            if (
+                len(dataverse_response or [])
+                > settings.dataverse_table_page_max_records
+            ):
+                table_page_cache.delete(cache_key)
         if not dataverse_response:
             raise HTTPException(status_code=404, detail="Not found")
 
-        return filter_dataverse_metadata(dataverse_response)
+        records, next_skip = paginate_records(
+            dataverse_response, top=top, skip=skip
+        )
+        if next_skip is not None:
+            next_url = request.url.include_query_params(skip=next_skip)
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return await to_thread(filter_dataverse_metadata, records)
+
+    except ApiException as e:
+        raise HTTPException(
+            status_code=e.status,
+            detail=f"Error fetching {entity_set_table_name}: {e.reason}",
+        )
+
+
+def _iter_ndjson_lines(records: List[Dict]) -> Iterator[str]:
+    """
+    Filter and serialize records one at a time as newline-delimited JSON.
+
+    Parameters
+    ----------
+    records : List[Dict]
+        Raw Dataverse records
+
+    Yields
+    ------
+    str
+        A single JSON-encoded record followed by a newline
+    """
+    for record in records:
+        yield json.dumps(filter_dataverse_metadata(record)) + "\n"
+
 
+@router.get(
+    "/api/v2/dataverse/tables/{entity_set_table_name}/stream",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        404: {"description": "Not found"},
+    },
+)
+async def stream_dataverse_table(
+    entity_set_table_name: str = Path(
+        ...,
+        description="The entity set name of the table to fetch",
+        openapi_examples={
+            "default": {
+                "summary": "A sample entity set name ID",
+                "description": "Example entity set name",
+                "value": "cr138_projects",
+            }
+        },
+    ),
+    columns: str | None = Query(
+        default=None,
+        description="Comma-separated column names to select from the table",
+    ),
+    filter: str | None = Query(
+        default=None,
+        description="OData-style filter expression",
+    ),
+    top: int | None = Query(
+        default=None,
+        ge=1,
+        description="Maximum number of records to stream",
+    ),
+    skip: int = Query(
+        default=0,
+        ge=0,
+        description="Number of records to skip before streaming starts",
+    ),
+    dataverse_api_instance=Depends(get_dataverse_api_instance),
+) -> StreamingResponse:
+    """
+    ## Table Data Export
+    Streams data for a specific entity table in Dataverse as newline-delimited
+    JSON. Records are filtered and emitted one at a time, which allows whole
+    tables to be exported without building a single large response.
+    """
+    await validate_table_request(
+        dataverse_api_instance, entity_set_table_name, columns
+    )
+    try:
+        dataverse_response = await dataverse_api_instance.get_table(
+            entity_set_table_name,
+            columns=columns,
+            filter=filter,
+            _request_timeout=TABLE_EXPORT_TIMEOUT,
+        )
     except ApiException as e:
         raise HTTPException(
             status_code=e.status,
             detail=f"Error fetching {entity_set_table_name}: {e.reason}",
         )
+    if not dataverse_response:
+        raise HTTPException(status_code=404, detail="Not found")
+    learn_table_columns(entity_set_table_name, columns, dataverse_response)
+    records, _ = paginate_records(dataverse_response, top=top, skip=skip)
+    return StreamingResponse(
+        _iter_ndjson_lines(records), media_type="application/x-ndjson"
+    )
 
 
 @router.get(
@@ -132,28 +471,45 @@ async def get_mouse_weight_records(
             }
         },
     ),
+    start: datetime | None = Query(
+        default=None,
+        description=(
+            "Only return records measured at or after this datetime. "
+            "Cannot be combined with acquisition_datetime."
+        ),
+    ),
+    end: datetime | None = Query(
+        default=None,
+        description=(
+            "Only return records measured before this datetime. "
+            "Cannot be combined with acquisition_datetime."
+        ),
+    ),
     dataverse_api_instance=Depends(get_dataverse_api_instance),
 ) -> List[MouseWeightData]:
     """
     ## Mouse Weight Records
-    Retrieves mouse weight records from Dataverse.
+    Retrieves mouse weight records from Dataverse. Records can be filtered
+    to the calendar day of acquisition_datetime, or to a start and end range.
     """
-    filter_query = f"aibs_mouse_id/aibs_mouse_id eq '{subject_id}'"
+    if acquisition_datetime and (start or end):
+        raise HTTPException(
+            status_code=400,
+            detail="Use either acquisition_datetime or start and end.",
+        )
     if acquisition_datetime:
         # Get start and end of the day for date filtering
-        start_of_day = acquisition_datetime.replace(
+        start = acquisition_datetime.replace(
             hour=0, minute=0, second=0, microsecond=0
         )
-        end_of_day = start_of_day + timedelta(days=1)
-        start_str = start_of_day.strftime("%Y-%m-%dT%H:%M:%SZ")
-        end_str = end_of_day.strftime("%Y-%m-%dT%H:%M:%SZ")
-        filter_query += (
-            f" and cr138_datetime ge {start_str} "
-            f" and cr138_datetime lt {end_str}"
-        )
+        end = start + timedelta(days=1)
+    filter_query = build_mouse_weight_filter(
+        [subject_id], start=start, end=end
+    )
     try:
         dataverse_response = await dataverse_api_instance.get_table(
-            entity_set_table_name="aibs_fact_mouse_weight_recordses",
+            entity_set_table_name=MOUSE_WEIGHT_RECORDS_TABLE,
+            columns=MOUSE_WEIGHT_COLUMNS,
             filter=filter_query,
             _request_timeout=10,
         )
@@ -169,3 +525,129 @@ async def get_mouse_weight_records(
             status_code=e.status,
             detail=f"Error fetching mouse weight records: {e.reason}",
         )
+
+
+@router.get(
+    "/api/v2/dataverse/mouse_weight_records/{subject_id}/daily",
+    responses={
+        404: {"description": "Not found"},
+    },
+)
+async def get_daily_mouse_weights(
+    subject_id: str = Path(
+        ...,
+        description="The subject ID to summarize mouse weight records for",
+        openapi_examples={
+            "default": {
+                "summary": "A sample subject ID",
+                "description": "Example subject ID",
+                "value": "864846",
+            }
+        },
+    ),
+    start: datetime | None = Query(
+        default=None,
+        description="Only summarize records measured at or after this time",
+    ),
+    end: datetime | None = Query(
+        default=None,
+        description="Only summarize records measured before this time",
+    ),
+    aggregation: MouseWeightAggregation = Query(
+        default=MouseWeightAggregation.DAILY,
+        description=(
+            "daily summarizes every record per day. baseline only "
+            "summarizes records flagged as baseline weights."
+        ),
+    ),
+    dataverse_api_instance=Depends(get_dataverse_api_instance),
+) -> List[MouseWeightDailySummary]:
+    """
+    ## Daily Mouse Weights
+    Returns the daily minimum, mean, maximum, and latest weight for a subject
+    computed from Dataverse mouse weight records in a time range.
+    """
+    filter_query = build_mouse_weight_filter(
+        [subject_id], start=start, end=end
+    )
+    try:
+        dataverse_response = await dataverse_api_instance.get_table(
+            entity_set_table_name=MOUSE_WEIGHT_RECORDS_TABLE,
+            columns=MOUSE_WEIGHT_DAILY_COLUMNS,
+            filter=filter_query,
+            _request_timeout=30,
+        )
+    except ApiException as e:
+        raise HTTPException(
+            status_code=e.status,
+            detail=f"Error fetching mouse weight records: {e.reason}",
+        )
+    summaries = aggregate_daily_mouse_weights(
+        dataverse_response,
+        baseline_only=aggregation == MouseWeightAggregation.BASELINE,
+    )
+    if not summaries:
+        raise HTTPException(status_code=404, detail="Not found")
+    return summaries
+
+
+# Number of subject IDs combined into a single OData filter expression
+MOUSE_WEIGHT_BATCH_SIZE = 50
+
+
+@router.post(
+    "/api/v2/dataverse/mouse_weight_records",
+)
+async def get_batch_mouse_weight_records(
+    batch_request: MouseWeightRecordsRequest = Body(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample batch request",
+                "description": "Example subject IDs and date range",
+                "value": {
+                    "subject_ids": ["864846", "864847"],
+                    "start": "2026-08-01T00:00:00",
+                    "end": "2026-09-01T00:00:00",
+                },
+            }
+        },
+    ),
+    dataverse_api_instance=Depends(get_dataverse_api_instance),
+) -> Dict[str, List[MouseWeightData]]:
+    """
+    ## Mouse Weight Records Batch
+    Retrieves mouse weight records for many subjects from Dataverse. Subject
+    IDs are combined into chunked filter expressions that are queried
+    concurrently. Records are returned grouped by subject ID. Subjects
+    without records map to an empty list.
+    """
+    subject_ids = list(dict.fromkeys(batch_request.subject_ids))
+    tasks = [
+        dataverse_api_instance.get_table(
+            entity_set_table_name=MOUSE_WEIGHT_RECORDS_TABLE,
+            columns=MOUSE_WEIGHT_COLUMNS,
+            filter=build_mouse_weight_filter(
+                list(subject_id_chunk),
+                start=batch_request.start,
+                end=batch_request.end,
+            ),
+            _request_timeout=10,
+        )
+        for subject_id_chunk in chunked(subject_ids, MOUSE_WEIGHT_BATCH_SIZE)
+    ]
+    try:
+        dataverse_responses = await gather_with_concurrency(
+            settings.backend_concurrency_limit, tasks
+        )
+    except ApiException as e:
+        raise HTTPException(
+            status_code=e.status,
+            detail=f"Error fetching mouse weight records: {e.reason}",
+        )
+    mouse_weight_records = [
+        record
+        for dataverse_response in dataverse_responses
+        for record in map_mouse_weight_records(dataverse_response)
+    ]
+    return group_mouse_weight_records(mouse_weight_records, subject_ids)
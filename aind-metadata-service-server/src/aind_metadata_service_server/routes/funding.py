@@ -1,14 +1,102 @@
 """Module to handle funding endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from starlette.responses import JSONResponse
 
-from aind_metadata_service_server.mappers.funding import FundingMapper
+from aind_metadata_service_server.caches import TTLCache
+from aind_metadata_service_server.mappers.funding import (
+    FundingMapper,
+    FundingSnapshot,
+)
 from aind_metadata_service_server.mappers.responses import map_to_response
-from aind_metadata_service_server.sessions import get_smartsheet_api_instance
+from aind_metadata_service_server.models import ProjectNameMatch
+from aind_metadata_service_server.sessions import (
+    get_smartsheet_api_instance,
+    settings,
+)
 
 router = APIRouter()
 
+funding_snapshot_cache = TTLCache(
+    name="funding_snapshot",
+    ttl=settings.funding_snapshot_ttl,
+    maxsize=1,
+    negative_ttl=0,
+    stale_if_error=True,
+)
+
+
+async def fetch_funding_snapshot(smartsheet_api_instance) -> FundingSnapshot:
+    """
+    Download the funding sheet and index it.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+
+    Returns
+    -------
+    FundingSnapshot
+    """
+    funding_response = await smartsheet_api_instance.get_funding(
+        _request_timeout=10
+    )
+    return FundingSnapshot(funding_response)
+
+
+async def get_funding_snapshot(smartsheet_api_instance) -> FundingSnapshot:
+    """
+    Return the cached funding snapshot, loading the sheet if needed.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+
+    Returns
+    -------
+    FundingSnapshot
+    """
+    return await funding_snapshot_cache.get_or_fetch(
+        "funding", lambda: fetch_funding_snapshot(smartsheet_api_instance)
+    )
+
+
+def resolve_project_name(
+    snapshot: FundingSnapshot, project_name: str
+) -> Tuple[str, Optional[str]]:
+    """
+    Split a project name and check a subproject is given when required.
+
+    Parameters
+    ----------
+    snapshot : FundingSnapshot
+    project_name : str
+        Project name, optionally followed by ' - Subproject Name'
+
+    Returns
+    -------
+    Tuple[str, Optional[str]]
+        The main project name and subproject
+
+    Raises
+    ------
+    HTTPException
+        406 if the project has subprojects but none was specified.
+    """
+    main_project_name, subproject = FundingMapper.split_name(project_name)
+    if subproject is None and snapshot.has_subprojects(main_project_name):
+        raise HTTPException(
+            status_code=406,
+            detail=(
+                f"Project '{main_project_name}' has subprojects. "
+                f"Please specify a subproject in the format: "
+                f"'{main_project_name} - Subproject Name'"
+            ),
+        )
+    return main_project_name, subproject
+
 
 @router.get(
     "/api/v2/funding/{project_name}",
@@ -45,23 +133,13 @@ async def get_funding(
     ## Funding
     Return Funding metadata.
     """
-    main_project_name, subproject = FundingMapper.split_name(project_name)
-    funding_response = await smartsheet_api_instance.get_funding(
-        project_name=main_project_name,
-        subproject=subproject,
-        _request_timeout=10,
+    snapshot = await get_funding_snapshot(smartsheet_api_instance)
+    main_project_name, subproject = resolve_project_name(
+        snapshot, project_name
+    )
+    mapper = FundingMapper(
+        smartsheet_funding=snapshot.get_rows(main_project_name, subproject)
     )
-    has_subprojects = any(row.subproject for row in funding_response)
-    if subproject is None and has_subprojects:
-        raise HTTPException(
-            status_code=406,
-            detail=(
-                f"Project '{main_project_name}' has subprojects. "
-                f"Please specify a subproject in the format: "
-                f"'{main_project_name} - Subproject Name'"
-            ),
-        )
-    mapper = FundingMapper(smartsheet_funding=funding_response)
     funding_information = mapper.get_funding_list()
 
     if len(funding_information) == 0:
@@ -105,24 +183,11 @@ async def get_investigators(
     ## Funding
     Return Funding metadata.
     """
-    main_project_name, subproject = FundingMapper.split_name(project_name)
-    funding_response = await smartsheet_api_instance.get_funding(
-        project_name=main_project_name,
-        subproject=subproject,
-        _request_timeout=10,
+    snapshot = await get_funding_snapshot(smartsheet_api_instance)
+    main_project_name, subproject = resolve_project_name(
+        snapshot, project_name
     )
-    has_subprojects = any(row.subproject for row in funding_response)
-    if subproject is None and has_subprojects:
-        raise HTTPException(
-            status_code=406,
-            detail=(
-                f"Project '{main_project_name}' has subprojects. "
-                f"Please specify a subproject in the format: "
-                f"'{main_project_name} - Subproject Name'"
-            ),
-        )
-    mapper = FundingMapper(smartsheet_funding=funding_response)
-    investigators = mapper.get_investigators_list()
+    investigators = snapshot.get_investigators(main_project_name, subproject)
 
     if len(investigators) == 0:
         raise HTTPException(status_code=404, detail="Not found")
@@ -137,11 +202,8 @@ async def get_project_names(
     """
     Get a list of project names from the Smartsheet API.
     """
-    funding_response = await smartsheet_api_instance.get_funding(
-        _request_timeout=10
-    )
-    mapper = FundingMapper(smartsheet_funding=funding_response)
-    project_names_list = mapper.get_project_names()
+    snapshot = await get_funding_snapshot(smartsheet_api_instance)
+    project_names_list = snapshot.project_names
     if len(project_names_list) == 0:
         raise HTTPException(status_code=404, detail="Not found")
     response = JSONResponse(
@@ -151,6 +213,38 @@ async def get_project_names(
     return response
 
 
+@router.get(
+    "/api/v2/project_names/search",
+    response_model=List[ProjectNameMatch],
+)
+async def search_project_names(
+    q: str = Query(
+        ...,
+        min_length=1,
+        description="Full or partial project name to search for",
+        openapi_examples={
+            "default": {
+                "summary": "A misspelled project name",
+                "description": "Subproject separator without spaces",
+                "value": "Thalamus-Project 1 Mesoscale thalamic circuits",
+            }
+        },
+    ),
+    limit: int = Query(
+        10, ge=1, le=100, description="Maximum number of matches to return"
+    ),
+    smartsheet_api_instance=Depends(get_smartsheet_api_instance),
+) -> List[ProjectNameMatch]:
+    """
+    ## Project name search
+    Return project names ranked by similarity to the query, ignoring case,
+    punctuation and spacing. Useful for suggesting the intended name when
+    a funding lookup returns 404 or 406.
+    """
+    snapshot = await get_funding_snapshot(smartsheet_api_instance)
+    return snapshot.project_name_index.search(q, limit=limit)
+
+
 @router.get("/api/v2/smartsheet/funding")
 async def get_smartsheet_funding(
     smartsheet_api_instance=Depends(get_smartsheet_api_instance),
@@ -158,7 +252,5 @@ async def get_smartsheet_funding(
     """
     Get raw funding data from Smartsheet.
     """
-    funding_response = await smartsheet_api_instance.get_funding(
-        _request_timeout=10
-    )
-    return funding_response
+    snapshot = await get_funding_snapshot(smartsheet_api_instance)
+    return snapshot.rows
@@ -1,18 +1,163 @@
 """Module to handle injection_material endpoints"""
 
-from typing import List
+from typing import Dict, Iterable, List, Union
 
-from aind_tars_service_async_client import PrepLotData
-from fastapi import APIRouter, Depends, HTTPException, Path
+from aind_tars_service_async_client import PrepLotData, VirusData
+from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
+from aind_metadata_service_server.caches import TTLCache
 from aind_metadata_service_server.mappers.injection_materials import (
     InjectionMaterialsMapper,
 )
 from aind_metadata_service_server.mappers.responses import map_to_response
-from aind_metadata_service_server.sessions import get_tars_api_instance
+from aind_metadata_service_server.models import (
+    InjectionMaterialsBatchRequest,
+    InjectionMaterialsResult,
+)
+from aind_metadata_service_server.sessions import (
+    get_tars_api_instance,
+    settings,
+)
+from aind_metadata_service_server.utils import gather_with_concurrency
 
 router = APIRouter()
 
+# Lots that do not exist are usually typos, so they are remembered briefly
+tars_prep_lot_cache = TTLCache(
+    name="tars_prep_lots",
+    ttl=settings.tars_cache_ttl,
+    maxsize=4096,
+    negative_ttl=settings.negative_cache_ttl,
+)
+tars_virus_cache = TTLCache(
+    name="tars_viruses",
+    ttl=settings.tars_cache_ttl,
+    maxsize=4096,
+    negative_ttl=settings.negative_cache_ttl,
+)
+
+
+async def get_prep_lots(tars_api_instance, lot: str) -> List[PrepLotData]:
+    """
+    Return the TARS prep lots matching a lot number, using cached results
+    when available.
+
+    Parameters
+    ----------
+    tars_api_instance : DefaultApi
+    lot : str
+
+    Returns
+    -------
+    List[PrepLotData]
+    """
+    return await tars_prep_lot_cache.get_or_fetch(
+        lot,
+        lambda: tars_api_instance.get_viral_prep_lots(
+            lot=lot, _request_timeout=10
+        ),
+    )
+
+
+async def get_viruses(tars_api_instance, virus_id: str) -> List[VirusData]:
+    """
+    Return the TARS viruses matching a virus alias, using cached results
+    when available.
+
+    Parameters
+    ----------
+    tars_api_instance : DefaultApi
+    virus_id : str
+
+    Returns
+    -------
+    List[VirusData]
+    """
+
+    async def fetch_viruses() -> List[VirusData]:
+        """Fetch viruses from TARS"""
+        virus_response = await tars_api_instance.get_viruses(
+            name=virus_id, _request_timeout=10
+        )
+        return virus_response or []
+
+    return await tars_virus_cache.get_or_fetch(virus_id, fetch_viruses)
+
+
+async def resolve_injection_materials(
+    tars_api_instance, lots: Iterable[str], return_exceptions: bool = False
+) -> Dict[str, Union[List[InjectionMaterialsMapper], Exception]]:
+    """
+    Look up prep lots and their viruses in TARS. Lot numbers and virus
+    aliases are deduplicated and fetched concurrently, at most
+    backend_concurrency_limit requests at a time.
+
+    Parameters
+    ----------
+    tars_api_instance : DefaultApi
+    lots : Iterable[str]
+        Prep lot numbers
+    return_exceptions : bool
+        If True, a lot whose prep lot or virus lookup fails maps to the
+        exception instead of it being raised. Default is False.
+
+    Returns
+    -------
+    Dict[str, Union[List[InjectionMaterialsMapper], Exception]]
+        Mappers for each lot, with virus data attached. The list is empty
+        if the lot was not found.
+    """
+    unique_lots = list(dict.fromkeys(lots))
+    prep_lot_responses = await gather_with_concurrency(
+        settings.backend_concurrency_limit,
+        [get_prep_lots(tars_api_instance, lot) for lot in unique_lots],
+        return_exceptions=return_exceptions,
+    )
+    mappers_by_lot = {
+        lot: (
+            prep_lot_response
+            if isinstance(prep_lot_response, Exception)
+            else [
+                InjectionMaterialsMapper(tars_prep_lot_data=prep_lot_data)
+                for prep_lot_data in prep_lot_response
+            ]
+        )
+        for lot, prep_lot_response in zip(unique_lots, prep_lot_responses)
+    }
+    found_mappers = [
+        mappers
+        for mappers in mappers_by_lot.values()
+        if not isinstance(mappers, Exception)
+    ]
+    virus_ids = list(
+        dict.fromkeys(
+            mapper.virus_id
+            for mappers in found_mappers
+            for mapper in mappers
+            if mapper.virus_id
+        )
+    )
+    virus_responses = await gather_with_concurrency(
+        settings.backend_concurrency_limit,
+        [get_viruses(tars_api_instance, virus_id) for virus_id in virus_ids],
+        return_exceptions=return_exceptions,
+    )
+    viruses_by_id = dict(zip(virus_ids, virus_responses))
+    for lot, mappers in mappers_by_lot.items():
+        if isinstance(mappers, Exception):
+            continue
+        for mapper in mappers:
+            if not mapper.virus_id:
+                continue
+            virus_response = viruses_by_id[mapper.virus_id]
+            if isinstance(virus_response, Exception):
+                mappers_by_lot[lot] = virus_response
+                break
+            mapper.virus_data = virus_response
+    return mappers_by_lot
+
 
 @router.get(
     "/api/v2/tars_injection_materials/{prep_lot_number}",
@@ -48,25 +193,73 @@ async def get_injection_materials(
     ## Injection Materials
     Return Injection Materials metadata.
     """
-    tars_prep_lot_response: List[PrepLotData] = (
-        await tars_api_instance.get_viral_prep_lots(
-            lot=prep_lot_number, _request_timeout=10
-        )
+    mappers_by_lot = await resolve_injection_materials(
+        tars_api_instance, [prep_lot_number]
     )
-    mappers = [
-        InjectionMaterialsMapper(tars_prep_lot_data=prep_lot_data)
-        for prep_lot_data in tars_prep_lot_response
-    ]
-    for mapper in mappers:
-        virus_id = mapper.virus_id
-        if virus_id:
-            virus_response = await tars_api_instance.get_viruses(
-                name=virus_id, _request_timeout=10
-            )
-            mapper.virus_data = virus_response or []
-
+    mappers = mappers_by_lot[prep_lot_number]
     viral_materials = [m.map_to_viral_material_information() for m in mappers]
     if len(viral_materials) == 0:
         raise HTTPException(status_code=404, detail="Not found")
     else:
         return map_to_response(viral_materials)
+
+
+@router.post(
+    "/api/v2/tars_injection_materials",
+    response_model=Dict[str, InjectionMaterialsResult],
+)
+async def get_batch_injection_materials(
+    batch_request: InjectionMaterialsBatchRequest = Body(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample batch request",
+                "description": "Example prep lot numbers for TARS",
+                "value": {"prep_lot_numbers": ["VT3214G", "VT3215G"]},
+            }
+        },
+    ),
+    tars_api_instance=Depends(get_tars_api_instance),
+) -> JSONResponse:
+    """
+    ## Injection Materials Batch
+    Return Injection Materials metadata for many prep lots. Lots and
+    viruses are looked up concurrently and each is fetched once. Each lot
+    maps to its viral materials and an error message. The error is set if
+    the lot was not found, the TARS lookup failed, or the viral materials
+    did not pass validation.
+    """
+    mappers_by_lot = await resolve_injection_materials(
+        tars_api_instance,
+        batch_request.prep_lot_numbers,
+        return_exceptions=True,
+    )
+    content = {}
+    for lot, mappers in mappers_by_lot.items():
+        viral_materials = []
+        error = None
+        if isinstance(mappers, Exception):
+            error = f"Error fetching from TARS: {mappers}"
+        elif len(mappers) == 0:
+            error = "Not found"
+        else:
+            viral_materials = [
+                m.map_to_viral_material_information() for m in mappers
+            ]
+            try:
+                for viral_material in viral_materials:
+                    viral_material.model_validate(viral_material.model_dump())
+            except ValidationError as e:
+                error = e.json(
+                    include_url=False,
+                    include_context=False,
+                    include_input=False,
+                )
+        content[lot] = {
+            "viral_materials": [
+                viral_material.model_dump(mode="json")
+                for viral_material in viral_materials
+            ],
+            "error": error,
+        }
+    return JSONResponse(content=content)
@@ -1,5 +1,7 @@
 """Module to handle subject endpoints"""
 
+from asyncio import gather
+
 from fastapi import APIRouter, Depends, HTTPException, Path
 
 from aind_metadata_service_server.mappers.intended_measurements import (
@@ -7,6 +9,7 @@ from aind_metadata_service_server.mappers.intended_measurements import (
 )
 from aind_metadata_service_server.mappers.responses import map_to_response
 from aind_metadata_service_server.sessions import get_sharepoint_api_instance
+from aind_metadata_service_server.sources import call_subject_source
 
 router = APIRouter()
 
@@ -45,11 +48,21 @@ async def get_intended_measurements(
     ## Intended Measurements
     Return Intended Measurements metadata.
     """
-    nsb_2023_response = await sharepoint_api_instance.get_nsb2023(
-        subject_id, _request_timeout=10
-    )
-    nsb_present_response = await sharepoint_api_instance.get_nsb_present(
-        subject_id, _request_timeout=10
+    nsb_2023_response, nsb_present_response = await gather(
+        call_subject_source(
+            "sharepoint",
+            sharepoint_api_instance,
+            "get_nsb2023",
+            subject_id,
+            _request_timeout=10,
+        ),
+        call_subject_source(
+            "sharepoint",
+            sharepoint_api_instance,
+            "get_nsb_present",
+            subject_id,
+            _request_timeout=10,
+        ),
     )
     mapper = IntendedMeasurementMapper(
         nsb_2023=nsb_2023_response,
@@ -0,0 +1,184 @@
+"""Module to handle asynchronous job endpoints"""
+
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+from fastapi import (
+    APIRouter,
+    Body,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from starlette.datastructures import QueryParams
+
+from aind_metadata_service_server.jobs import Job, JobStore, JobStoreFullError
+from aind_metadata_service_server.models import JobStatus
+from aind_metadata_service_server.routes.procedures import (
+    get_procedures,
+    procedures_api_instances,
+)
+from aind_metadata_service_server.routes.v1_proxy import proxy
+from aind_metadata_service_server.sessions import (
+    get_aind_data_schema_v1_session,
+    settings,
+)
+
+router = APIRouter()
+
+job_store = JobStore(
+    maxsize=settings.job_store_size,
+    timeout=settings.job_timeout,
+    concurrency_limit=settings.job_concurrency_limit,
+)
+
+
+async def run_procedures(subject_id: str) -> Response:
+    """
+    Build a subject's procedures with backend clients owned by the job.
+
+    Parameters
+    ----------
+    subject_id : str
+
+    Returns
+    -------
+    Response
+    """
+    async with procedures_api_instances() as api_instances:
+        return await get_procedures(subject_id=subject_id, **api_instances)
+
+
+async def run_bergamo_session(
+    request: Request, job_settings: Dict[str, Any]
+) -> Response:
+    """
+    Proxy a bergamo session request with a session owned by the job.
+
+    Parameters
+    ----------
+    request : Request
+        Original request whose headers are forwarded
+    job_settings : Dict[str, Any]
+
+    Returns
+    -------
+    Response
+    """
+    session_context = asynccontextmanager(get_aind_data_schema_v1_session)
+    async with session_context() as aind_data_schema_v1_session:
+        return await proxy(
+            request,
+            "/bergamo_session",
+            aind_data_schema_v1_session,
+            QueryParams(job_settings),
+        )
+
+
+def submit_job(kind: str, awaitable, response: Response) -> Dict[str, Any]:
+    """
+    Add a job to the store and point the Location header at its status.
+
+    Parameters
+    ----------
+    kind : str
+    awaitable : Coroutine
+    response : Response
+
+    Returns
+    -------
+    Dict[str, Any]
+        Status of the new job
+
+    Raises
+    ------
+    HTTPException
+        503 if too many jobs are still running.
+    """
+    try:
+        job = job_store.submit(kind, awaitable)
+    except JobStoreFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    response.headers["Location"] = f"/api/v2/jobs/{job.job_id}"
+    return job.to_dict()
+
+
+@router.post(
+    "/api/v2/jobs/procedures/{subject_id}",
+    status_code=202,
+    response_model=JobStatus,
+    responses={503: {"description": "Too many jobs are running"}},
+)
+async def submit_procedures_job(
+    response: Response,
+    subject_id: str = Path(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample subject ID",
+                "description": "Example subject ID for Procedures",
+                "value": "822178",
+            }
+        },
+    ),
+):
+    """
+    ## Procedures Job
+    Start building Procedure metadata in the background and return a job to
+    poll. The job result has the status_code, data and error the procedures
+    endpoint would return.
+    """
+    return submit_job("procedures", run_procedures(subject_id), response)
+
+
+@router.post(
+    "/api/v2/jobs/bergamo_session",
+    status_code=202,
+    response_model=JobStatus,
+    responses={503: {"description": "Too many jobs are running"}},
+)
+async def submit_bergamo_session_job(
+    request: Request,
+    response: Response,
+    job_settings: Dict[str, Any] = Body(...),
+):
+    """
+    ## Session Job
+    Start computing bergamo session metadata in the background and return a
+    job to poll. The job result has the status_code, data and error the
+    bergamo_session endpoint would return.
+    """
+    return submit_job(
+        "bergamo_session", run_bergamo_session(request, job_settings), response
+    )
+
+
+@router.get(
+    "/api/v2/jobs/{job_id}",
+    response_model=JobStatus,
+    responses={404: {"description": "Not found"}},
+)
+async def get_job(
+    job_id: str = Path(..., description="ID returned when submitting a job"),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=60,
+        description=(
+            "Seconds to wait for a pending job to complete before returning"
+        ),
+    ),
+):
+    """
+    ## Job
+    Return the status of a job, and its result once completed. Jobs are kept
+    in memory and the oldest completed ones are evicted when the store is
+    full, so fetch results soon after they complete.
+    """
+    job: Job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    await job.wait(wait)
+    return job.to_dict()
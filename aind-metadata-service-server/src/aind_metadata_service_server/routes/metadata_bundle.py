@@ -0,0 +1,110 @@
+"""Module to handle the combined metadata bundle endpoint"""
+
+import asyncio
+
+from fastapi import APIRouter, Depends, Path
+from fastapi.responses import JSONResponse
+
+from aind_metadata_service_server.models import MetadataBundle
+from aind_metadata_service_server.routes.dataverse import (
+    get_mouse_weight_records,
+)
+from aind_metadata_service_server.routes.intended_measurements import (
+    get_intended_measurements,
+)
+from aind_metadata_service_server.routes.procedures import get_procedures
+from aind_metadata_service_server.routes.subject import get_subject
+from aind_metadata_service_server.sessions import (
+    get_dataverse_api_instance,
+    get_labtracks_api_instance,
+    get_mgi_api_instance,
+    get_sharepoint_api_instance,
+    get_smartsheet_api_instance,
+    get_tars_api_instance,
+)
+from aind_metadata_service_server.utils import capture_response
+
+router = APIRouter()
+
+# Seconds each part may take before it is reported as timed out
+BUNDLE_PART_TIMEOUTS = {
+    "subject": 20,
+    "procedures": 120,
+    "intended_measurements": 20,
+    "mouse_weights": 20,
+}
+
+
+@router.get(
+    "/api/v2/metadata_bundle/{subject_id}",
+    response_model=MetadataBundle,
+)
+async def get_metadata_bundle(
+    subject_id: str = Path(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample subject ID",
+                "description": "Example subject ID",
+                "value": "632269",
+            }
+        },
+    ),
+    labtracks_api_instance=Depends(get_labtracks_api_instance),
+    mgi_api_instance=Depends(get_mgi_api_instance),
+    sharepoint_api_instance=Depends(get_sharepoint_api_instance),
+    smartsheet_api_instance=Depends(get_smartsheet_api_instance),
+    tars_api_instance=Depends(get_tars_api_instance),
+    dataverse_api_instance=Depends(get_dataverse_api_instance),
+) -> JSONResponse:
+    """
+    ## Metadata Bundle
+    Return subject, procedures, intended measurements and mouse weight
+    metadata for a subject in one response. The parts are built
+    concurrently and share backend responses, so SharePoint records used by
+    both procedures and intended measurements are fetched once. Each part
+    has its own status code and error, matching what its individual
+    endpoint would return, so one failing or slow part does not fail the
+    others.
+    """
+    parts = {
+        "subject": get_subject(
+            subject_id=subject_id,
+            labtracks_api_instance=labtracks_api_instance,
+            mgi_api_instance=mgi_api_instance,
+        ),
+        "procedures": get_procedures(
+            subject_id=subject_id,
+            labtracks_api_instance=labtracks_api_instance,
+            sharepoint_api_instance=sharepoint_api_instance,
+            smartsheet_api_instance=smartsheet_api_instance,
+            tars_api_instance=tars_api_instance,
+        ),
+        "intended_measurements": get_intended_measurements(
+            subject_id=subject_id,
+            sharepoint_api_instance=sharepoint_api_instance,
+        ),
+        "mouse_weights": get_mouse_weight_records(
+            subject_id=subject_id,
+            acquisition_datetime=None,
+            start=None,
+            end=None,
+            dataverse_api_instance=dataverse_api_instance,
+        ),
+    }
+    results = await asyncio.gather(
+        *[
+            capture_response(
+                part,
+                timeout=BUNDLE_PART_TIMEOUTS[name],
+                name=f"{name} part of metadata bundle",
+            )
+            for name, part in parts.items()
+        ]
+    )
+    return JSONResponse(
+        content={
+            "subject_id": subject_id,
+            "parts": dict(zip(parts.keys(), results)),
+        }
+    )
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Path
 from aind_metadata_service_server.mappers.perfusion import PerfusionMapper
 from aind_metadata_service_server.mappers.responses import map_to_response
 from aind_metadata_service_server.sessions import get_smartsheet_api_instance
+from aind_metadata_service_server.sources import call_subject_source
 
 router = APIRouter()
 
@@ -43,8 +44,12 @@ async def get_perfusions(
     ## Perfusions
     Return Perfusions metadata.
     """
-    perfusions_response = await smartsheet_api_instance.get_perfusions(
-        subject_id, _request_timeout=10
+    perfusions_response = await call_subject_source(
+        "smartsheet",
+        smartsheet_api_instance,
+        "get_perfusions",
+        subject_id,
+        _request_timeout=10,
     )
     mappers = [
         PerfusionMapper(smartsheet_perfusion=smartsheet_perfusion)
@@ -1,23 +1,193 @@
 """Module to handle procedures endpoints"""
 
+import asyncio
+import json
+import logging
+import time
 from asyncio import gather
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from aind_data_schema.core.procedures import Procedures
+from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from fastapi.responses import Response, StreamingResponse
 
-from aind_metadata_service_server.mappers.injection_materials import (
-    InjectionMaterialsMapper,
-)
 from aind_metadata_service_server.mappers.procedures import ProceduresMapper
 from aind_metadata_service_server.mappers.responses import map_to_response
+from aind_metadata_service_server.metrics import mapping_stage
+from aind_metadata_service_server.models import SubjectBatchRequest
+from aind_metadata_service_server.routes.injection_materials import (
+    resolve_injection_materials,
+)
+from aind_metadata_service_server.routes.protocol import get_protocols_mapping
 from aind_metadata_service_server.sessions import (
     get_labtracks_api_instance,
     get_sharepoint_api_instance,
     get_smartsheet_api_instance,
     get_tars_api_instance,
+    settings,
 )
+from aind_metadata_service_server.sources import call_subject_source
+from aind_metadata_service_server.tracing import tracer
+from aind_metadata_service_server.utils import capture_response, format_sse
 
 router = APIRouter()
 
+# Seconds to wait for a single subject's procedures in a batch
+BATCH_PROCEDURES_TIMEOUT = 120
+
+
+@dataclass(frozen=True)
+class ProceduresSource:
+    """Backend call that returns procedures for a subject"""
+
+    name: str
+    backend: str
+    operation: str
+    mapper_field: str
+    timeout: int
+
+
+PROCEDURES_SOURCES = [
+    ProceduresSource(
+        "LabTracks", "labtracks", "get_tasks", "labtracks_tasks", 20
+    ),
+    ProceduresSource("LAS2020", "sharepoint", "get_las2020", "las_2020", 30),
+    ProceduresSource("NSB2019", "sharepoint", "get_nsb2019", "nsb_2019", 20),
+    ProceduresSource("NSB2023", "sharepoint", "get_nsb2023", "nsb_2023", 20),
+    ProceduresSource(
+        "NSB Present", "sharepoint", "get_nsb_present", "nsb_present", 20
+    ),
+    ProceduresSource(
+        "Smartsheet Perfusions",
+        "smartsheet",
+        "get_perfusions",
+        "smartsheet_perfusion",
+        20,
+    ),
+    ProceduresSource(
+        "Smartsheet ExaSPIM",
+        "smartsheet",
+        "get_exaspim_info",
+        "smartsheet_exaspim",
+        100,
+    ),
+]
+
+# Called with a source, its response, the seconds it took and the error it
+# raised, if any, as soon as the source finishes
+SourceCallback = Callable[
+    [ProceduresSource, Any, float, Optional[Exception]], None
+]
+
+
+@tracer.start_as_current_span("build_procedures")
+async def build_procedures(
+    subject_id: str,
+    labtracks_api_instance,
+    sharepoint_api_instance,
+    smartsheet_api_instance,
+    tars_api_instance,
+    on_source_complete: Optional[SourceCallback] = None,
+) -> Procedures:
+    """
+    Fetch a subject's procedures from every backend, merge them, and enrich
+    them with protocols and injection materials.
+
+    Parameters
+    ----------
+    subject_id : str
+    labtracks_api_instance : DefaultApi
+    sharepoint_api_instance : DefaultApi
+    smartsheet_api_instance : DefaultApi
+    tars_api_instance : DefaultApi
+    on_source_complete : Optional[SourceCallback]
+        Called as each of PROCEDURES_SOURCES finishes, to report progress
+
+    Returns
+    -------
+    Procedures
+
+    Raises
+    ------
+    HTTPException
+        404 if no backend has procedures for the subject.
+    """
+    api_instances = {
+        "labtracks": labtracks_api_instance,
+        "sharepoint": sharepoint_api_instance,
+        "smartsheet": smartsheet_api_instance,
+    }
+
+    async def fetch_source(source: ProceduresSource) -> Any:
+        """Call a source and report how it went."""
+        start = time.monotonic()
+        try:
+            response = await call_subject_source(
+                source.backend,
+                api_instances[source.backend],
+                source.operation,
+                subject_id,
+                _request_timeout=source.timeout,
+            )
+        except Exception as e:
+            if on_source_complete is not None:
+                on_source_complete(source, None, time.monotonic() - start, e)
+            raise
+        if on_source_complete is not None:
+            on_source_complete(
+                source, response, time.monotonic() - start, None
+            )
+        return response
+
+    responses = await gather(
+        *[fetch_source(source) for source in PROCEDURES_SOURCES]
+    )
+    mapper = ProceduresMapper(
+        **{
+            source.mapper_field: response
+            for source, response in zip(PROCEDURES_SOURCES, responses)
+        }
+    )
+    with mapping_stage("map_responses_to_aind_procedures", "Procedures"):
+        procedures = mapper.map_responses_to_aind_procedures(subject_id)
+    if not procedures:
+        raise HTTPException(status_code=404, detail="Not found")
+
+    # integrate protocols from smartsheet
+    protocol_names = mapper.get_protocols_list(procedures)
+    protocols_mapping = await get_protocols_mapping(
+        smartsheet_api_instance, protocol_names
+    )
+
+    with mapping_stage(
+        "integrate_protocols_into_aind_procedures", "Procedures"
+    ):
+        procedures = mapper.integrate_protocols_into_aind_procedures(
+            procedures, protocols_mapping
+        )
+
+    # integrate injection materials from tars
+    viruses = mapper.get_virus_strains(procedures)
+    virus_mappers_by_strain = await resolve_injection_materials(
+        tars_api_instance, viruses
+    )
+    tars_mapping = {
+        virus_strain: (
+            mappers[0].map_to_viral_material_information() if mappers else None
+        )
+        for virus_strain, mappers in virus_mappers_by_strain.items()
+    }
+
+    with mapping_stage(
+        "integrate_injection_materials_into_aind_procedures", "Procedures"
+    ):
+        procedures = mapper.integrate_injection_materials_into_aind_procedures(
+            procedures, tars_mapping
+        )
+    return procedures
+
 
 @router.get(
     "/api/v2/procedures/{subject_id}",
@@ -76,122 +246,12 @@ async def get_procedures(
     ## Procedures
     Return Procedure metadata.
     """
-    tasks = list()
-    tasks.append(
-        labtracks_api_instance.get_tasks(subject_id, _request_timeout=20)
-    )
-    tasks.append(
-        sharepoint_api_instance.get_las2020(subject_id, _request_timeout=30)
-    )
-    tasks.append(
-        sharepoint_api_instance.get_nsb2019(subject_id, _request_timeout=20)
-    )
-    tasks.append(
-        sharepoint_api_instance.get_nsb2023(subject_id, _request_timeout=20)
-    )
-    tasks.append(
-        sharepoint_api_instance.get_nsb_present(
-            subject_id, _request_timeout=20
-        )
-    )
-    tasks.append(
-        smartsheet_api_instance.get_perfusions(subject_id, _request_timeout=20)
-    )
-    tasks.append(
-        smartsheet_api_instance.get_exaspim_info(
-            subject_id, _request_timeout=100
-        )
-    )
-    (
-        labtracks_response,
-        las_2020_response,
-        nsb_2019_response,
-        nsb_2023_response,
-        nsb_present_response,
-        smartsheet_perfusion_response,
-        smartsheet_exaspim_response,
-    ) = await gather(*tasks)
-
-    mapper = ProceduresMapper(
-        labtracks_tasks=labtracks_response,
-        las_2020=las_2020_response,
-        nsb_2019=nsb_2019_response,
-        nsb_2023=nsb_2023_response,
-        nsb_present=nsb_present_response,
-        smartsheet_perfusion=smartsheet_perfusion_response,
-        smartsheet_exaspim=smartsheet_exaspim_response,
-    )
-    procedures = mapper.map_responses_to_aind_procedures(subject_id)
-    if not procedures:
-        raise HTTPException(status_code=404, detail="Not found")
-
-    # integrate protocols from smartsheet
-    protocol_names = mapper.get_protocols_list(procedures)
-    protocol_tasks = [
-        smartsheet_api_instance.get_protocols(protocol_name=protocol_name)
-        for protocol_name in protocol_names
-    ]
-    protocol_results = await gather(*protocol_tasks) if protocol_tasks else []
-    protocols_mapping = {
-        name: (records[0] if records else None)
-        for name, records in zip(protocol_names, protocol_results)
-    }
-
-    procedures = mapper.integrate_protocols_into_aind_procedures(
-        procedures, protocols_mapping
-    )
-
-    # integrate injection materials from tars
-    viruses = mapper.get_virus_strains(procedures)
-    viral_prep_tasks = [
-        tars_api_instance.get_viral_prep_lots(
-            lot=virus_strain, _request_timeout=10
-        )
-        for virus_strain in viruses
-    ]
-    viral_prep_results = (
-        await gather(*viral_prep_tasks) if viral_prep_tasks else []
-    )
-    virus_mappers_by_strain = {}
-    virus_ids_to_fetch = []
-    virus_id_to_strain_mapper = []
-
-    for virus_strain, tars_prep_lot_response in zip(
-        viruses, viral_prep_results
-    ):
-        tars_mappers = [
-            InjectionMaterialsMapper(tars_prep_lot_data=prep_lot_data)
-            for prep_lot_data in tars_prep_lot_response
-        ]
-        virus_mappers_by_strain[virus_strain] = tars_mappers
-
-        for tars_mapper in tars_mappers:
-            if tars_mapper.virus_id:
-                virus_ids_to_fetch.append(tars_mapper.virus_id)
-                virus_id_to_strain_mapper.append((virus_strain, tars_mapper))
-
-    if virus_ids_to_fetch:
-        virus_tasks = [
-            tars_api_instance.get_viruses(name=virus_id, _request_timeout=10)
-            for virus_id in virus_ids_to_fetch
-        ]
-        virus_responses = await gather(*virus_tasks)
-        for (virus_strain, tars_mapper), virus_response in zip(
-            virus_id_to_strain_mapper, virus_responses
-        ):
-            tars_mapper.tars_virus_data = virus_response
-
-    tars_mapping = {}
-    for virus_strain, mappers in virus_mappers_by_strain.items():
-        if mappers:
-            tars_mapping[virus_strain] = mappers[
-                0
-            ].map_to_viral_material_information()
-        else:
-            tars_mapping[virus_strain] = None
-
-    procedures = mapper.integrate_injection_materials_into_aind_procedures(
-        procedures, tars_mapping
+    procedures = await build_procedures(
+        subject_id,
+        labtracks_api_instance=labtracks_api_instance,
+        sharepoint_api_instance=sharepoint_api_instance,
+        smartsheet_api_instance=smartsheet_api_instance,
+        tars_api_instance=tars_api_instance,
     )
     return map_to_response(procedures)
 
@@ -230,12 +290,261 @@ async def get_exaspim_procedures(
     ## ExaSPIM Procedures
     Return ExaSPIM procedure metadata from Smartsheet
     """
-    smartsheet_exaspim_response = (
-        await smartsheet_api_instance.get_exaspim_info(
-            subject_id, _request_timeout=120
-        )
+    smartsheet_exaspim_response = await call_subject_source(
+        "smartsheet",
+        smartsheet_api_instance,
+        "get_exaspim_info",
+        subject_id,
+        _request_timeout=120,
     )
     if not smartsheet_exaspim_response:
         raise HTTPException(status_code=404, detail="Not found")
 
     return smartsheet_exaspim_response
+
+
+@asynccontextmanager
+async def procedures_api_instances() -> AsyncIterator[Dict[str, Any]]:
+    """
+    Open the backend clients used by build_procedures outside of a request's
+    dependencies, for work that outlives the route handler.
+
+    Yields
+    ------
+    Dict[str, Any]
+        Keyword arguments for build_procedures and get_procedures
+    """
+    async with AsyncExitStack() as stack:
+        yield {
+            "labtracks_api_instance": await stack.enter_async_context(
+                asynccontextmanager(get_labtracks_api_instance)()
+            ),
+            "sharepoint_api_instance": await stack.enter_async_context(
+                asynccontextmanager(get_sharepoint_api_instance)()
+            ),
+            "smartsheet_api_instance": await stack.enter_async_context(
+                asynccontextmanager(get_smartsheet_api_instance)()
+            ),
+            "tars_api_instance": await stack.enter_async_context(
+                asynccontextmanager(get_tars_api_instance)()
+            ),
+        }
+
+
+def map_source_event(
+    subject_id: str,
+    source: ProceduresSource,
+    response: Any,
+    seconds: float,
+    error: Optional[Exception],
+) -> Dict[str, Any]:
+    """
+    Describe a finished source and map its response on its own, so clients
+    can show partial results before every source has finished.
+
+    Parameters
+    ----------
+    subject_id : str
+    source : ProceduresSource
+    response : Any
+        Raw response of the source, or None if it raised
+    seconds : float
+        Seconds the source took
+    error : Optional[Exception]
+        Error raised by the source, if any
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary with source, seconds, records, error, message and partial
+        keys. Records and partial are None if the source failed or its
+        response could not be mapped.
+    """
+    records = None
+    partial = None
+    if error is None:
+        try:
+            procedures = ProceduresMapper(
+                **{source.mapper_field: response}
+            ).map_responses_to_aind_procedures(subject_id)
+        except Exception:
+            logging.exception(f"Error mapping {source.name} for {subject_id}")
+        else:
+            records = 0
+            if procedures is not None:
+                records = len(procedures.subject_procedures) + len(
+                    procedures.specimen_procedures
+                )
+                partial = procedures.model_dump(mode="json")
+    if error is not None:
+        message = f"{source.name} failed after {seconds:.1f}s: {error}"
+    elif records is None:
+        message = f"{source.name} returned a response that could not be mapped"
+    else:
+        message = (
+            f"{source.name} returned {records} procedures in {seconds:.1f}s"
+        )
+    return {
+        "source": source.name,
+        "seconds": round(seconds, 3),
+        "records": records,
+        "error": None if error is None else str(error),
+        "message": message,
+        "partial": partial,
+    }
+
+
+async def iter_procedures_events(subject_id: str) -> AsyncIterator[str]:
+    """
+    Build a subject's procedures and yield Server-Sent Events as it goes. A
+    source event is sent as each backend finishes, followed by a single
+    result event.
+
+    Parameters
+    ----------
+    subject_id : str
+
+    Yields
+    ------
+    str
+        Server-Sent Events message
+    """
+    finished_sources: asyncio.Queue = asyncio.Queue()
+
+    def on_source_complete(*args) -> None:
+        """Queue a finished source to be sent."""
+        finished_sources.put_nowait(args)
+
+    async with procedures_api_instances() as api_instances:
+
+        async def run() -> Response:
+            """Build procedures and map them to the endpoint's response."""
+            procedures = await build_procedures(
+                subject_id,
+                on_source_complete=on_source_complete,
+                **api_instances,
+            )
+            return map_to_response(procedures)
+
+        task = asyncio.create_task(
+            capture_response(
+                run(), timeout=None, name=f"procedures for {subject_id}"
+            )
+        )
+        # A finished build is marked with None after its sources
+        task.add_done_callback(lambda _: finished_sources.put_nowait(None))
+        try:
+            while (finished := await finished_sources.get()) is not None:
+                # Mapping a source is CPU bound, so it runs in a thread to
+                # keep the event loop free for the build and other requests
+                event = await asyncio.to_thread(
+                    map_source_event, subject_id, *finished
+                )
+                yield format_sse("source", event)
+            yield format_sse("result", task.result())
+        finally:
+            task.cancel()
+
+
+async def iter_batch_procedures(subject_ids: List[str]) -> AsyncIterator[str]:
+    """
+    Build procedures for many subjects, at most batch_concurrency_limit at a
+    time, and yield one NDJSON line per subject as soon as it finishes.
+
+    Parameters
+    ----------
+    subject_ids : List[str]
+
+    Yields
+    ------
+    str
+        JSON object with subject_id, status_code, data and error keys,
+        followed by a newline
+    """
+    semaphore = asyncio.Semaphore(settings.batch_concurrency_limit)
+    async with procedures_api_instances() as api_instances:
+
+        async def run(subject_id: str) -> Dict[str, Any]:
+            """Build procedures for one subject."""
+            async with semaphore:
+                result = await capture_response(
+                    get_procedures(subject_id=subject_id, **api_instances),
+                    timeout=BATCH_PROCEDURES_TIMEOUT,
+                    name=f"procedures for {subject_id}",
+                )
+            return {"subject_id": subject_id, **result}
+
+        tasks = [asyncio.create_task(run(s)) for s in subject_ids]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield json.dumps(await next_result) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+@router.post("/api/v2/procedures/batch")
+async def get_batch_procedures(
+    batch_request: SubjectBatchRequest = Body(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample batch request",
+                "description": "Example subject IDs for Procedures",
+                "value": {"subject_ids": ["823508", "632269"]},
+            }
+        },
+    ),
+) -> StreamingResponse:
+    """
+    ## Procedures Batch
+    Return Procedure metadata for many subjects as newline-delimited JSON.
+    Subjects are processed concurrently up to a server-side limit, and each
+    line is written as soon as its subject finishes, so lines are not in
+    request order. Each line has the subject_id plus the status_code, data
+    and error the single-subject endpoint would return. Protocols and TARS
+    lookups are shared across subjects through the service caches.
+    """
+    subject_ids = list(dict.fromkeys(batch_request.subject_ids))
+    return StreamingResponse(
+        iter_batch_procedures(subject_ids),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/api/v2/procedures/{subject_id}/events",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Server-Sent Events stream",
+            "content": {"text/event-stream": {}},
+        }
+    },
+)
+async def get_procedures_events(
+    subject_id: str = Path(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample subject ID",
+                "description": "Example subject ID for Procedures",
+                "value": "823508",
+            }
+        },
+    ),
+) -> StreamingResponse:
+    """
+    ## Procedures Events
+    Stream progress while building Procedure metadata as Server-Sent Events.
+    A source event is sent as each backend finishes, with the number of
+    procedures it returned, how long it took, any error, and its procedures
+    mapped on their own as a partial result. A final result event has the
+    status_code, data and error the procedures endpoint would return.
+    Closing the connection early stops the remaining work.
+    """
+    return StreamingResponse(
+        iter_procedures_events(subject_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
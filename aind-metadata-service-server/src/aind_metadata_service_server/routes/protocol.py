@@ -1,13 +1,204 @@
 """Module to handle protocol endpoints"""
 
+import logging
+from asyncio import gather
+from typing import Dict, Iterable, List, Optional
+
+from aind_smartsheet_service_async_client.models import ProtocolsModel
 from fastapi import APIRouter, Depends, HTTPException, Path
 
-from aind_metadata_service_server.mappers.protocol import ProtocolMapper
+from aind_metadata_service_server.caches import TTLCache
+from aind_metadata_service_server.mappers.protocol import (
+    ProtocolCatalog,
+    ProtocolMapper,
+)
 from aind_metadata_service_server.mappers.responses import map_to_response
-from aind_metadata_service_server.sessions import get_smartsheet_api_instance
+from aind_metadata_service_server.models import ProtocolInformation
+from aind_metadata_service_server.sessions import (
+    get_smartsheet_api_instance,
+    settings,
+)
 
 router = APIRouter()
 
+protocol_catalog_cache = TTLCache(
+    name="protocol_catalog",
+    ttl=settings.protocol_catalog_ttl,
+    maxsize=1,
+    negative_ttl=0,
+    stale_if_error=True,
+)
+# Remembers that the catalog could not be loaded, so that requests go
+# straight to the per-name lookup instead of waiting for the download
+protocol_catalog_failures = TTLCache(
+    name="protocol_catalog_failures",
+    ttl=settings.negative_cache_ttl,
+    maxsize=1,
+)
+# Protocols requested by name that were not in the catalog
+protocol_lookup_cache = TTLCache(
+    name="protocol_lookups",
+    ttl=settings.protocol_catalog_ttl,
+    negative_ttl=settings.negative_cache_ttl,
+)
+
+
+async def fetch_protocol_catalog(smartsheet_api_instance) -> ProtocolCatalog:
+    """
+    Download the protocols sheet and index it.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+
+    Returns
+    -------
+    ProtocolCatalog
+    """
+    protocols_response = await smartsheet_api_instance.get_protocols(
+        _request_timeout=30
+    )
+    return ProtocolCatalog(protocols_response)
+
+
+async def get_protocol_catalog(
+    smartsheet_api_instance,
+) -> Optional[ProtocolCatalog]:
+    """
+    Return the cached protocol catalog, loading it if needed.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+
+    Returns
+    -------
+    ProtocolCatalog | None
+        None if the catalog could not be loaded. After a failure, loading
+        is not retried for negative_cache_ttl seconds.
+    """
+    if protocol_catalog_failures.get("protocols", None) is not None:
+        return protocol_catalog_cache.get("protocols", None)
+    try:
+        return await protocol_catalog_cache.get_or_fetch(
+            "protocols",
+            lambda: fetch_protocol_catalog(smartsheet_api_instance),
+        )
+    except Exception as e:
+        logging.warning(f"Unable to load protocol catalog: {e}")
+        protocol_catalog_failures.set("protocols", True)
+        return None
+
+
+async def get_protocol_records(
+    smartsheet_api_instance, protocol_name: str
+) -> List[ProtocolsModel]:
+    """
+    Return the protocols sheet rows for a protocol name. Names in the
+    catalog are resolved in memory. Other names are fetched individually
+    and cached.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+    protocol_name : str
+
+    Returns
+    -------
+    List[ProtocolsModel]
+    """
+    catalog = await get_protocol_catalog(smartsheet_api_instance)
+    if catalog is not None and protocol_name in catalog:
+        return catalog.get_protocols(protocol_name)
+    return await lookup_protocol_records(
+        smartsheet_api_instance, protocol_name
+    )
+
+
+async def lookup_protocol_records(
+    smartsheet_api_instance, protocol_name: str
+) -> List[ProtocolsModel]:
+    """
+    Fetch the protocols sheet rows for a name that is not in the catalog,
+    caching the result.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+    protocol_name : str
+
+    Returns
+    -------
+    List[ProtocolsModel]
+    """
+    return await protocol_lookup_cache.get_or_fetch(
+        protocol_name,
+        lambda: smartsheet_api_instance.get_protocols(
+            protocol_name=protocol_name, _request_timeout=10
+        ),
+    )
+
+
+async def get_protocol_information(
+    smartsheet_api_instance, protocol_name: str
+) -> List[ProtocolInformation]:
+    """
+    Return the mapped protocols for a protocol name. Names in the catalog
+    were mapped when it was loaded. Other names are fetched individually
+    and mapped.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+    protocol_name : str
+
+    Returns
+    -------
+    List[ProtocolInformation]
+    """
+    catalog = await get_protocol_catalog(smartsheet_api_instance)
+    if catalog is not None and protocol_name in catalog:
+        return catalog.get_protocol_information(protocol_name)
+    records = await lookup_protocol_records(
+        smartsheet_api_instance, protocol_name
+    )
+    protocols = [
+        ProtocolMapper(
+            smartsheet_protocol=record
+        ).map_to_protocol_information()
+        for record in records
+    ]
+    return [protocol for protocol in protocols if protocol is not None]
+
+
+async def get_protocols_mapping(
+    smartsheet_api_instance, protocol_names: Iterable[str]
+) -> Dict[str, Optional[ProtocolsModel]]:
+    """
+    Map each protocol name to its first row in the protocols sheet.
+
+    Parameters
+    ----------
+    smartsheet_api_instance : DefaultApi
+    protocol_names : Iterable[str]
+
+    Returns
+    -------
+    Dict[str, Optional[ProtocolsModel]]
+        None for names that are not in the protocols sheet.
+    """
+    unique_names = list(dict.fromkeys(protocol_names))
+    results = await gather(
+        *[
+            get_protocol_records(smartsheet_api_instance, protocol_name)
+            for protocol_name in unique_names
+        ]
+    )
+    return {
+        name: (records[0] if records else None)
+        for name, records in zip(unique_names, results)
+    }
+
 
 @router.get(
     "/api/v2/protocols/{protocol_name}",
@@ -46,18 +237,9 @@ async def get_protocols(
     ## Protocols
     Return Protocols metadata.
     """
-    protocols_response = await smartsheet_api_instance.get_protocols(
-        protocol_name=protocol_name, _request_timeout=10
+    protocols = await get_protocol_information(
+        smartsheet_api_instance, protocol_name
     )
-    mappers = [
-        ProtocolMapper(smartsheet_protocol=smartsheet_protocol)
-        for smartsheet_protocol in protocols_response
-    ]
-    protocols = [
-        mapper.map_to_protocol_information()
-        for mapper in mappers
-        if mapper.map_to_protocol_information() is not None
-    ]
     if len(protocols) == 0:
         raise HTTPException(status_code=404, detail="Not found")
     elif len(protocols) > 1:
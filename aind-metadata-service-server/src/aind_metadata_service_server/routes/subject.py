@@ -1,19 +1,54 @@
 """Module to handle subject endpoints"""
 
 import logging
+from typing import Dict
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
+from fastapi.responses import JSONResponse
 
 from aind_metadata_service_server.mappers.responses import map_to_response
 from aind_metadata_service_server.mappers.subject import SubjectMapper
+from aind_metadata_service_server.models import (
+    CapturedResponse,
+    SubjectBatchRequest,
+)
 from aind_metadata_service_server.sessions import (
     get_labtracks_api_instance,
     get_mgi_api_instance,
+    settings,
+)
+from aind_metadata_service_server.sources import call_subject_source
+from aind_metadata_service_server.utils import (
+    capture_response,
+    gather_with_concurrency,
 )
 
 router = APIRouter()
 
 
+def validate_subject_id(subject_id: str) -> None:
+    """
+    Reject subject IDs that are not numeric.
+
+    Parameters
+    ----------
+    subject_id : str
+
+    Raises
+    ------
+    HTTPException
+        406 if the subject ID is not numeric
+    """
+    if not subject_id.isdigit():
+        raise HTTPException(
+            status_code=406,
+            detail=(
+                f"Subject ID {subject_id} is not valid."
+                " Please specify a numeric subject ID."
+            ),
+        )
+
+
 @router.get(
     "/api/v2/subject/{subject_id}",
     responses={
@@ -50,17 +85,14 @@ async def get_subject(
     ## Subject
     Return Subject metadata.
     """
-    if not subject_id.isdigit():
-        raise HTTPException(
-            status_code=406,
-            detail=(
-                f"Subject ID {subject_id} is not valid."
-                " Please specify a numeric subject ID."
-            ),
-        )
+    validate_subject_id(subject_id)
 
-    labtracks_response = await labtracks_api_instance.get_subject(
-        subject_id, _request_timeout=10
+    labtracks_response = await call_subject_source(
+        "labtracks",
+        labtracks_api_instance,
+        "get_subject",
+        subject_id,
+        _request_timeout=10,
     )
     mappers = [
         SubjectMapper(labtracks_subject=labtracks_subject)
@@ -114,18 +146,73 @@ async def get_labtracks_subject(
     ## LabTracks Subject
     Return LabTracks Subject metadata.
     """
-    if not subject_id.isdigit():
-        raise HTTPException(
-            status_code=406,
-            detail=(
-                f"Subject ID {subject_id} is not valid."
-                " Please specify a numeric subject ID."
-            ),
-        )
+    validate_subject_id(subject_id)
 
-    labtracks_response = await labtracks_api_instance.get_subject(
-        subject_id, _request_timeout=10
+    labtracks_response = await call_subject_source(
+        "labtracks",
+        labtracks_api_instance,
+        "get_subject",
+        subject_id,
+        _request_timeout=10,
     )
     if not labtracks_response:
         raise HTTPException(status_code=404, detail="Not found")
     return labtracks_response
+
+
+@router.post(
+    "/api/v2/subject/batch",
+    response_model=Dict[str, CapturedResponse],
+)
+async def get_batch_subjects(
+    batch_request: SubjectBatchRequest = Body(
+        ...,
+        openapi_examples={
+            "default": {
+                "summary": "A sample batch request",
+                "description": "Example subject IDs for LabTracks",
+                "value": {"subject_ids": ["632269", "632270"]},
+            }
+        },
+    ),
+    labtracks_api_instance=Depends(get_labtracks_api_instance),
+    mgi_api_instance=Depends(get_mgi_api_instance),
+) -> JSONResponse:
+    """
+    ## Subject Batch
+    Return Subject metadata for many subjects. Subject IDs are validated
+    before anything is fetched, and LabTracks is queried for the valid ones
+    concurrently up to a server-side limit. Each subject ID maps to the
+    status_code, data and error the single-subject endpoint would return.
+    """
+    subject_ids = list(dict.fromkeys(batch_request.subject_ids))
+    results: Dict[str, Dict] = {}
+    for subject_id in subject_ids:
+        try:
+            validate_subject_id(subject_id)
+        except HTTPException as e:
+            results[subject_id] = {
+                "status_code": e.status_code,
+                "data": None,
+                "error": e.detail,
+            }
+    valid_subject_ids = [s for s in subject_ids if s not in results]
+    responses = await gather_with_concurrency(
+        settings.backend_concurrency_limit,
+        [
+            capture_response(
+                get_subject(
+                    subject_id=subject_id,
+                    labtracks_api_instance=labtracks_api_instance,
+                    mgi_api_instance=mgi_api_instance,
+                ),
+                timeout=None,
+                name=f"subject {subject_id}",
+            )
+            for subject_id in valid_subject_ids
+        ],
+    )
+    results.update(zip(valid_subject_ids, responses))
+    return JSONResponse(
+        content={subject_id: results[subject_id] for subject_id in subject_ids}
+    )
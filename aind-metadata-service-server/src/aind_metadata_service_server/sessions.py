@@ -13,6 +13,7 @@ from aind_data_access_api.document_db import Client as DocDBClient
 from httpx import AsyncClient
 
 from aind_metadata_service_server.configs import get_settings
+from aind_metadata_service_server.metrics import InstrumentedApi
 
 settings = get_settings()
 labtracks_config = aind_labtracks_service_async_client.Configuration(
@@ -52,7 +53,7 @@ async def get_labtracks_api_instance() -> (
         api_instance = aind_labtracks_service_async_client.DefaultApi(
             api_client
         )
-        yield api_instance
+        yield InstrumentedApi("labtracks", api_instance)
 
 
 async def get_mgi_api_instance() -> (
@@ -65,7 +66,7 @@ async def get_mgi_api_instance() -> (
         mgi_config
     ) as api_client:
         api_instance = aind_mgi_service_async_client.DefaultApi(api_client)
-        yield api_instance
+        yield InstrumentedApi("mgi", api_instance)
 
 
 async def get_sharepoint_api_instance() -> (
@@ -80,7 +81,7 @@ async def get_sharepoint_api_instance() -> (
         api_instance = aind_sharepoint_service_async_client.DefaultApi(
             api_client
         )
-        yield api_instance
+        yield InstrumentedApi("sharepoint", api_instance)
 
 
 async def get_smartsheet_api_instance() -> (
@@ -95,7 +96,7 @@ async def get_smartsheet_api_instance() -> (
         api_instance = aind_smartsheet_service_async_client.DefaultApi(
             api_client
         )
-        yield api_instance
+        yield InstrumentedApi("smartsheet", api_instance)
 
 
 async def get_tars_api_instance() -> (
@@ -108,7 +109,7 @@ async def get_tars_api_instance() -> (
         tars_config
     ) as api_client:
         api_instance = aind_tars_service_async_client.DefaultApi(api_client)
-        yield api_instance
+        yield InstrumentedApi("tars", api_instance)
 
 
 async def get_aind_data_schema_v1_session() -> (
@@ -121,7 +122,7 @@ async def get_aind_data_schema_v1_session() -> (
     async with AsyncClient(
         base_url=settings.aind_data_schema_v1_host.unicode_string()
     ) as session:
-        yield session
+        yield InstrumentedApi("aind_data_schema_v1", session)
 
 
 async def get_dataverse_api_instance() -> (
@@ -136,7 +137,7 @@ async def get_dataverse_api_instance() -> (
         api_instance = aind_dataverse_service_async_client.DefaultApi(
             api_client
         )
-        yield api_instance
+        yield InstrumentedApi("dataverse", api_instance)
 
 
 async def get_active_directory_api_instance() -> (
@@ -151,15 +152,24 @@ async def get_active_directory_api_instance() -> (
         api_instance = aind_active_directory_service_async_client.DefaultApi(
             api_client
         )
-        yield api_instance
+        yield InstrumentedApi("active_directory", api_instance)
 
 
 def get_instruments_client() -> DocDBClient:
     """
     Returns a client to read/write instruments.
     """
-    return DocDBClient(
+    docdb_client = DocDBClient(
         host=settings.docdb_api_host,
         database="metadata_files",
         collection="instruments",
     )
+    return InstrumentedApi(
+        "docdb",
+        docdb_client,
+        sync_operations=[
+            "retrieve_docdb_records",
+            "insert_one_docdb_record",
+            "delete_one_record",
+        ],
+    )
@@ -0,0 +1,82 @@
+"""Module for short-lived caching of raw backend responses per subject"""
+
+from typing import Any, Awaitable, Callable
+
+from aind_metadata_service_server.caches import TTLCache
+from aind_metadata_service_server.sessions import settings
+
+# Raw client responses keyed by (backend, operation, subject_id). Routes
+# called for the same subject within a few seconds of each other share them.
+# Responses are cached before any mapping, so each route still maps them
+# to its own models.
+source_cache = TTLCache(
+    name="subject_sources",
+    ttl=settings.source_cache_ttl,
+    maxsize=4096,
+)
+
+
+async def get_subject_source(
+    backend: str,
+    operation: str,
+    subject_id: str,
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Return a backend response for a subject, calling fetch only if it was
+    not requested within the last source_cache_ttl seconds.
+
+    Parameters
+    ----------
+    backend : str
+        Name of the backend, such as 'sharepoint'
+    operation : str
+        Name of the client method, such as 'get_nsb2023'
+    subject_id : str
+    fetch : Callable[[], Awaitable[Any]]
+        Called without arguments to request the response from the backend
+
+    Returns
+    -------
+    Any
+        The unmodified client response
+    """
+    return await source_cache.get_or_fetch(
+        (backend, operation, subject_id), fetch
+    )
+
+
+async def call_subject_source(
+    backend: str,
+    api_instance: Any,
+    operation: str,
+    subject_id: str,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a client method that takes a subject ID as its first argument,
+    reusing a recent response for the same subject if there is one.
+
+    Parameters
+    ----------
+    backend : str
+        Name of the backend, such as 'sharepoint'
+    api_instance : Any
+        Client for the backend
+    operation : str
+        Name of the client method, such as 'get_nsb2023'
+    subject_id : str
+    kwargs : Any
+        Passed to the client method, such as _request_timeout
+
+    Returns
+    -------
+    Any
+        The unmodified client response
+    """
+    return await get_subject_source(
+        backend,
+        operation,
+        subject_id,
+        lambda: getattr(api_instance, operation)(subject_id, **kwargs),
+    )
@@ -0,0 +1,164 @@
+"""Module for the Server-Timing response header"""
+
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestTimings:
+    """Durations and cache lookups collected while handling a request"""
+
+    def __init__(self):
+        """Class constructor"""
+        self.start = time.perf_counter()
+        # Name -> [number of calls, total seconds, description]
+        self.durations: Dict[str, list] = {}
+        # Cache name -> [hits, misses]
+        self.cache_lookups: Dict[str, List[int]] = {}
+
+    def add_duration(
+        self, name: str, seconds: float, description: Optional[str] = None
+    ) -> None:
+        """
+        Add a duration. Durations with the same name are summed.
+
+        Parameters
+        ----------
+        name : str
+            Metric name, such as labtracks.get_subject
+        seconds : float
+        description : Optional[str]
+            Shown next to the duration, such as the model being mapped
+        """
+        entry = self.durations.setdefault(name, [0, 0.0, description])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def add_cache_lookup(self, cache_name: str, hit: bool) -> None:
+        """
+        Count a cache lookup.
+
+        Parameters
+        ----------
+        cache_name : str
+        hit : bool
+        """
+        lookups = self.cache_lookups.setdefault(cache_name, [0, 0])
+        lookups[0 if hit else 1] += 1
+
+    def to_header(self) -> str:
+        """
+        Format the collected timings as a Server-Timing header value. The
+        total is the time until the response started.
+
+        Returns
+        -------
+        str
+        """
+        metrics = []
+        for name, (count, seconds, description) in self.durations.items():
+            details = [description] if description else []
+            if count > 1:
+                details.append(f"{count} calls")
+            metric = f"{name};dur={seconds * 1000:.1f}"
+            if details:
+                metric += f';desc="{", ".join(details)}"'
+            metrics.append(metric)
+        for cache_name, (hits, misses) in self.cache_lookups.items():
+            metrics.append(
+                f'cache.{cache_name};desc="{hits} hits, {misses} misses"'
+            )
+        total = (time.perf_counter() - self.start) * 1000
+        metrics.append(f"total;dur={total:.1f}")
+        return ", ".join(metrics)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Timings of the request being handled, or None if it is not timed."""
+    return _request_timings.get()
+
+
+def record_duration(
+    name: str, seconds: float, description: Optional[str] = None
+) -> None:
+    """
+    Add a duration to the current request's Server-Timing header, if the
+    request is being timed.
+
+    Parameters
+    ----------
+    name : str
+    seconds : float
+    description : Optional[str]
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add_duration(name, seconds, description)
+
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """
+    Count a cache lookup in the current request's Server-Timing header, if
+    the request is being timed.
+
+    Parameters
+    ----------
+    cache_name : str
+    hit : bool
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add_cache_lookup(cache_name, hit)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that adds a Server-Timing header to responses of routes
+    under a path prefix. Timings are collected while the route runs, so
+    streaming responses only report what happened before they started.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/v2/"):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        app : ASGIApp
+        path_prefix : str
+            Only requests whose path starts with this are timed. Default is
+            /api/v2/.
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle a request while collecting its timings."""
+        if scope["type"] != "http" or not scope["path"].startswith(
+            self.path_prefix
+        ):
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+
+        async def send_with_timings(message: Message) -> None:
+            """Add the Server-Timing header when the response starts."""
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.to_header())
+                headers.append("Timing-Allow-Origin", "*")
+            await send(message)
+
+        token = _request_timings.set(timings)
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _request_timings.reset(token)
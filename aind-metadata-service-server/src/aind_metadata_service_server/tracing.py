@@ -0,0 +1,111 @@
+"""Module for OpenTelemetry tracing"""
+
+from typing import Any, Dict
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from aind_metadata_service_server import __version__
+
+# Spans are no-ops until a tracer provider is configured
+tracer = trace.get_tracer("aind_metadata_service_server", __version__)
+
+
+def configure_tracing() -> Any:
+    """
+    Export spans over OTLP/HTTP. The exporter reads the standard
+    OTEL_EXPORTER_OTLP_* environment variables, such as
+    OTEL_EXPORTER_OTLP_ENDPOINT.
+
+    Returns
+    -------
+    TracerProvider
+        The provider that was set globally. Shut it down to flush spans.
+
+    Raises
+    ------
+    ImportError
+        If the tracing extra is not installed.
+    """
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError as e:
+        raise ImportError(
+            "Tracing requires the tracing extra. Install it with "
+            "pip install aind-metadata-service-server[tracing]"
+        ) from e
+    provider = TracerProvider(
+        resource=Resource.create(
+            {
+                "service.name": "aind-metadata-service",
+                "service.version": __version__,
+            }
+        )
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    return provider
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that starts a server span for every request, continuing
+    a trace from incoming traceparent headers. Spans for backend calls and
+    mapping stages made while handling the request are its children. It
+    steps aside for versions of FastAPI that create request spans natively.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Class constructor
+
+        Parameters
+        ----------
+        app : ASGIApp
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle a request inside a server span."""
+        if scope["type"] != "http" or "fastapi.telemetry" in scope:
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        headers: Dict[str, str] = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+
+        with tracer.start_as_current_span(
+            method,
+            context=propagate.extract(headers),
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.request.method": method,
+                "url.path": scope["path"],
+            },
+        ) as span:
+
+            async def send_with_status(message: Message) -> None:
+                """Record the status code of the response on the span."""
+                if message["type"] == "http.response.start":
+                    span.set_attribute(
+                        "http.response.status_code", message["status"]
+                    )
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.set_attribute("http.route", route)
+                    span.update_name(f"{method} {route}")
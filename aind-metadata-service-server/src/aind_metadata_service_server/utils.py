@@ -0,0 +1,148 @@
+"""Module for helper functions shared across routes"""
+
+import asyncio
+import json
+import logging
+from asyncio import Semaphore, gather
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+T = TypeVar("T")
+
+
+async def gather_with_concurrency(
+    limit: int,
+    awaitables: Iterable[Awaitable[T]],
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Await many awaitables, running at most limit of them at a time.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of awaitables to run concurrently
+    awaitables : Iterable[Awaitable[T]]
+        The awaitables to run
+    return_exceptions : bool
+        Passed through to asyncio.gather. Default is False.
+
+    Returns
+    -------
+    List[Any]
+        Results in the same order as the awaitables
+    """
+    semaphore = Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        """Await a single awaitable while holding the semaphore."""
+        async with semaphore:
+            return await awaitable
+
+    return await gather(
+        *(run(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions,
+    )
+
+
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """
+    Split a sequence into consecutive chunks of at most size items.
+
+    Parameters
+    ----------
+    items : Sequence[T]
+    size : int
+
+    Returns
+    -------
+    List[Sequence[T]]
+    """
+    chunks = []
+    for start in range(0, len(items), size):
+        end = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
+async def capture_response(
+    awaitable: Awaitable[Any], timeout: Optional[float], name: str
+) -> Dict[str, Any]:
+    """
+    Await a route handler and capture its outcome as a dictionary instead
+    of raising, so it can be embedded in a larger response.
+
+    Parameters
+    ----------
+    awaitable : Awaitable[Any]
+        Route handler call returning a Response or a JSON serializable value
+    timeout : Optional[float]
+        Seconds to wait before giving up. None waits indefinitely.
+    name : str
+        Description of the call used when logging unexpected errors
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary with status_code, data and error keys. Timeouts have a
+        504 status code and unexpected exceptions a 500 status code. Response
+        bodies that are not JSON are returned as text.
+    """
+    try:
+        result = await asyncio.wait_for(awaitable, timeout=timeout)
+    except asyncio.TimeoutError:
+        return {
+            "status_code": 504,
+            "data": None,
+            "error": f"Timed out after {timeout} seconds",
+        }
+    except HTTPException as e:
+        return {"status_code": e.status_code, "data": None, "error": e.detail}
+    except Exception as e:
+        logging.exception(f"Error building {name}")
+        return {"status_code": 500, "data": None, "error": str(e)}
+    if isinstance(result, Response):
+        try:
+            data = json.loads(result.body)
+        except ValueError:
+            data = result.body.decode(errors="replace")
+        return {
+            "status_code": result.status_code,
+            "data": data,
+            "error": result.headers.get("X-Error-Message"),
+        }
+    return {
+        "status_code": 200,
+        "data": jsonable_encoder(result),
+        "error": None,
+    }
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Format a Server-Sent Events message with a JSON payload.
+
+    Parameters
+    ----------
+    event : str
+        Event name clients can listen for
+    data : Any
+        JSON serializable payload
+
+    Returns
+    -------
+    str
+    """
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
@@ -6,6 +6,7 @@ from typing import Any, Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from aind_dataverse_service_async_client.models import EntityTableRow
 from aind_tars_service_async_client import (
     Alias,
     PrepLotData,
@@ -14,15 +15,61 @@ from aind_tars_service_async_client import (
 )
 from aind_smartsheet_service_async_client.models import ExaSPIMInfo
 from fastapi.testclient import TestClient
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
 from pytest_mock import MockFixture
 from starlette.responses import JSONResponse
 
+from aind_metadata_service_server.caches import clear_caches
 from aind_metadata_service_server.main import app
 from aind_metadata_service_server.sessions import (
     get_aind_data_schema_v1_session,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_service_caches() -> Generator[None, Any, None]:
+    """Clear in-memory caches so tests do not share backend responses."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture(scope="session")
+def span_exporter() -> InMemorySpanExporter:
+    """Collect spans in memory. Clear it before use to see a test's spans."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture()
+def mock_dataverse_table_info(mocker: MockFixture) -> AsyncMock:
+    """Mock the Dataverse table catalog."""
+    return mocker.patch(
+        "aind_dataverse_service_async_client.DefaultApi.get_table_info",
+        new_callable=AsyncMock,
+        return_value=[
+            EntityTableRow(
+                entitysetname="cr138_projects",
+                logicalname="cr138_project",
+                name="Project",
+            ),
+            EntityTableRow(
+                entitysetname="invalid_table",
+                logicalname="invalid_table",
+                name="Invalid Table",
+            ),
+        ],
+    )
+
+
 @pytest.fixture()
 def mock_proxy(mocker: MockFixture) -> AsyncMock:
     """Mock the proxy method."""
@@ -0,0 +1,241 @@
+"""Tests caches module"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from aind_metadata_service_server.caches import (
+    MISSING,
+    TTLCache,
+    clear_caches,
+    get_registered_caches,
+)
+from aind_metadata_service_server.utils import capture_response
+
+
+class TestTTLCache(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in TTLCache class"""
+
+    def test_get_set_and_expiry(self):
+        """Tests values expire after the ttl"""
+        cache = TTLCache(name="test", ttl=10)
+        with patch("time.monotonic", return_value=100):
+            cache.set("a", 1)
+            self.assertEqual(1, cache.get("a"))
+            self.assertIs(MISSING, cache.get("b"))
+        with patch("time.monotonic", return_value=111):
+            self.assertIsNone(cache.get("a", None))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(1, len(cache))
+        cache.delete("a")
+        self.assertEqual(0, len(cache))
+
+    def test_negative_ttl(self):
+        """Tests empty values use the negative ttl"""
+        cache = TTLCache(name="test", ttl=10, negative_ttl=1)
+        with patch("time.monotonic", return_value=100):
+            cache.set("empty", [])
+            cache.set("full", [1])
+        with patch("time.monotonic", return_value=102):
+            self.assertIs(MISSING, cache.get("empty"))
+            self.assertEqual([1], cache.get("full"))
+        uncached = TTLCache(name="test", ttl=10, negative_ttl=0)
+        uncached.set("empty", None)
+        self.assertEqual(0, len(uncached))
+
+    def test_maxsize(self):
+        """Tests least recently used entries are evicted"""
+        cache = TTLCache(name="test", ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(1, cache.get("a"))
+        self.assertIs(MISSING, cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+
+    def test_clear_caches(self):
+        """Tests every registered cache can be cleared"""
+        cache = TTLCache(name="test", ttl=10)
+        cache.set("a", 1)
+        cache.get("a")
+        self.assertIn(cache, get_registered_caches())
+        clear_caches()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+
+    async def test_get_or_fetch(self):
+        """Tests concurrent fetches for a key are coalesced"""
+        cache = TTLCache(name="test", ttl=10)
+        started = asyncio.Event()
+
+        async def fetch():
+            """Slow fetch"""
+            started.set()
+            await asyncio.sleep(0.01)
+            return "value"
+
+        fetch_mock = AsyncMock(side_effect=fetch)
+        results = await asyncio.gather(
+            cache.get_or_fetch("a", fetch_mock),
+            cache.get_or_fetch("a", fetch_mock),
+        )
+        self.assertEqual(["value", "value"], results)
+        self.assertEqual("value", await cache.get_or_fetch("a", fetch_mock))
+        self.assertEqual(1, fetch_mock.await_count)
+
+    async def test_get_or_fetch_errors(self):
+        """Tests errors are raised to every waiter"""
+        cache = TTLCache(name="test", ttl=10)
+
+        async def fail():
+            """Slow failing fetch"""
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            cache.get_or_fetch("a", fail),
+            cache.get_or_fetch("a", fail),
+            return_exceptions=True,
+        )
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(0, len(cache))
+
+    async def test_get_or_fetch_stale_if_error(self):
+        """Tests an expired value is served if refreshing it fails"""
+        cache = TTLCache(name="test", ttl=10, stale_if_error=True)
+        with patch("time.monotonic", return_value=100):
+            cache.set("a", "stale")
+        with self.assertLogs(level="WARNING") as captured:
+            value = await cache.get_or_fetch(
+                "a", AsyncMock(side_effect=ValueError("failed"))
+            )
+        self.assertEqual("stale", value)
+        self.assertIn("Serving stale test entry", captured.output[0])
+        with self.assertRaises(ValueError):
+            await cache.get_or_fetch(
+                "b", AsyncMock(side_effect=ValueError("failed"))
+            )
+
+    async def test_get_or_fetch_owner_cancelled(self):
+        """Tests waiters fetch with their own client if the caller whose
+        client the fetch uses is cancelled and closes it"""
+        cache = TTLCache(name="test", ttl=10)
+        fetched_by = []
+
+        class Client:
+            """Request-scoped client that cannot be used once closed"""
+
+            def __init__(self, name: str):
+                """Class constructor"""
+                self.name = name
+                self.closed = False
+
+            async def fetch(self):
+                """Slow fetch that records whether the client was open"""
+                await asyncio.sleep(0.05)
+                fetched_by.append((self.name, self.closed))
+                return "value"
+
+        async def request(client: Client):
+            """Fetch through the cache and close the client afterwards"""
+            try:
+                return await cache.get_or_fetch("a", client.fetch)
+            finally:
+                client.closed = True
+
+        first = asyncio.create_task(request(Client("A")))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(request(Client("B")))
+        await asyncio.sleep(0)
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual("value", await second)
+        self.assertEqual([("B", False)], fetched_by)
+        self.assertEqual("value", cache.get("a"))
+        self.assertEqual({}, cache._pending)
+
+    async def test_get_or_fetch_waiter_cancelled(self):
+        """Tests a cancelled waiter does not cancel the fetch"""
+        cache = TTLCache(name="test", ttl=10)
+        fetch_mock = AsyncMock(return_value="value")
+
+        first = asyncio.create_task(cache.get_or_fetch("a", fetch_mock))
+        second = asyncio.create_task(cache.get_or_fetch("a", fetch_mock))
+        await asyncio.sleep(0)
+        second.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        self.assertEqual("value", await first)
+        self.assertEqual(1, fetch_mock.await_count)
+
+    async def test_get_or_fetch_timeout_with_waiter(self):
+        """Tests a caller timing out does not cancel another caller"""
+        cache = TTLCache(name="test", ttl=10)
+
+        async def fetch():
+            """Slow fetch"""
+            await asyncio.sleep(0.05)
+            return "value"
+
+        results = await asyncio.gather(
+            capture_response(
+                cache.get_or_fetch("a", fetch), timeout=0.01, name="first"
+            ),
+            capture_response(
+                cache.get_or_fetch("a", fetch), timeout=5, name="second"
+            ),
+        )
+        self.assertEqual(504, results[0]["status_code"])
+        self.assertEqual(
+            {"status_code": 200, "data": "value", "error": None}, results[1]
+        )
+
+    async def test_get_or_fetch_cancelled(self):
+        """Tests the fetch is cancelled once every caller is cancelled"""
+        cache = TTLCache(name="test", ttl=10)
+        fetch_cancelled = asyncio.Event()
+
+        async def slow():
+            """Fetch that never finishes"""
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                fetch_cancelled.set()
+                raise
+
+        first = asyncio.create_task(cache.get_or_fetch("a", slow))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_fetch("a", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        second.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        await asyncio.wait_for(fetch_cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+        self.assertEqual({}, cache._pending)
+
+    async def test_refresh(self):
+        """Tests refresh replaces fresh entries and keeps them on errors"""
+        cache = TTLCache(name="test", ttl=10)
+        cache.set("a", "old")
+        self.assertEqual(
+            "new", await cache.refresh("a", AsyncMock(return_value="new"))
+        )
+        self.assertEqual("new", cache.get("a"))
+        with self.assertLogs(level="WARNING"):
+            value = await cache.refresh(
+                "a", AsyncMock(side_effect=ValueError("failed"))
+            )
+        self.assertIs(MISSING, value)
+        self.assertEqual("new", cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
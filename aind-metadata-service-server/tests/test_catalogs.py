@@ -0,0 +1,104 @@
+"""Tests catalogs module"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from aind_smartsheet_service_async_client.models import (
+    FundingModel,
+    ProtocolsModel,
+)
+
+from aind_metadata_service_server.caches import clear_caches
+from aind_metadata_service_server.catalogs import (
+    refresh_catalogs,
+    refresh_catalogs_periodically,
+)
+from aind_metadata_service_server.routes.funding import (
+    funding_snapshot_cache,
+)
+from aind_metadata_service_server.routes.protocol import (
+    protocol_catalog_cache,
+)
+
+
+class TestCatalogs(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in catalogs module"""
+
+    def setUp(self):
+        """Start each test with empty caches"""
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_funding",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_protocols",
+        new_callable=AsyncMock,
+    )
+    async def test_refresh_catalogs(
+        self, mock_get_protocols: AsyncMock, mock_get_funding: AsyncMock
+    ):
+        """Tests catalogs are downloaded and cached"""
+        mock_get_protocols.return_value = [
+            ProtocolsModel(protocol_name="Protocol A")
+        ]
+        mock_get_funding.return_value = [
+            FundingModel(project_name="Ephys Platform")
+        ]
+        await refresh_catalogs()
+        self.assertIn("Protocol A", protocol_catalog_cache.get("protocols"))
+        self.assertEqual(
+            ["Ephys Platform"],
+            funding_snapshot_cache.get("funding").project_names,
+        )
+
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_funding",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_protocols",
+        new_callable=AsyncMock,
+    )
+    async def test_refresh_catalogs_error(
+        self, mock_get_protocols: AsyncMock, mock_get_funding: AsyncMock
+    ):
+        """Tests a failed download keeps the cached catalog"""
+        protocol_catalog_cache.set("protocols", "cached")
+        mock_get_protocols.side_effect = Exception("Timeout")
+        mock_get_funding.return_value = []
+        with self.assertLogs(level="WARNING") as captured:
+            await refresh_catalogs()
+        self.assertEqual("cached", protocol_catalog_cache.get("protocols"))
+        self.assertIn(
+            "Unable to refresh protocol_catalog entry protocols: Timeout",
+            captured.output[0],
+        )
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch(
+        "aind_metadata_service_server.catalogs.refresh_catalogs",
+        new_callable=AsyncMock,
+    )
+    async def test_refresh_catalogs_periodically(
+        self, mock_refresh: AsyncMock, mock_sleep: AsyncMock
+    ):
+        """Tests catalogs are refreshed until the task is cancelled"""
+        mock_refresh.side_effect = [Exception("Connection refused"), None]
+        mock_sleep.side_effect = [None, asyncio.CancelledError()]
+        with self.assertLogs(level="WARNING") as captured:
+            with self.assertRaises(asyncio.CancelledError):
+                await refresh_catalogs_periodically(60)
+        self.assertEqual(2, mock_refresh.await_count)
+        mock_sleep.assert_awaited_with(60)
+        self.assertIn(
+            "Unable to refresh catalogs: Connection refused",
+            captured.output[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
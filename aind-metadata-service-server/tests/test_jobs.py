@@ -0,0 +1,98 @@
+"""Tests jobs module"""
+
+import asyncio
+import unittest
+
+from aind_metadata_service_server.jobs import JobStore, JobStoreFullError
+
+
+class TestJobStore(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in JobStore class"""
+
+    async def test_submit_and_wait(self):
+        """Tests a job is pending until its awaitable finishes"""
+        store = JobStore(maxsize=2, timeout=1, concurrency_limit=2)
+        release = asyncio.Event()
+
+        async def work() -> dict:
+            """Return once released."""
+            await release.wait()
+            return {"message": "done"}
+
+        job = store.submit("test", work())
+        self.assertIs(job, store.get(job.job_id))
+        self.assertIsNone(store.get("unknown"))
+        await job.wait(0.01)
+        status = job.to_dict()
+        self.assertEqual("pending", status["status"])
+        self.assertIsNone(status["completed_at"])
+        self.assertIsNone(status["result"])
+        release.set()
+        await job.wait(1)
+        status = job.to_dict()
+        self.assertEqual("completed", status["status"])
+        self.assertIsNotNone(status["completed_at"])
+        self.assertEqual(
+            {"status_code": 200, "data": {"message": "done"}, "error": None},
+            status["result"],
+        )
+
+    async def test_timeout(self):
+        """Tests a job that runs too long completes with a 504 result"""
+        store = JobStore(maxsize=2, timeout=0.01, concurrency_limit=2)
+        job = store.submit("test", asyncio.sleep(1))
+        await job.wait(1)
+        self.assertEqual(504, job.to_dict()["result"]["status_code"])
+
+    async def test_eviction(self):
+        """Tests the oldest finished job is evicted when the store is full"""
+        store = JobStore(maxsize=2, timeout=1, concurrency_limit=2)
+        release = asyncio.Event()
+        running = store.submit("test", release.wait())
+        finished = store.submit("test", asyncio.sleep(0))
+        await finished.wait(1)
+        newest = store.submit("test", asyncio.sleep(0))
+        self.assertEqual(2, len(store))
+        self.assertIsNone(store.get(finished.job_id))
+        self.assertIs(running, store.get(running.job_id))
+        self.assertIs(newest, store.get(newest.job_id))
+        with self.assertRaises(JobStoreFullError):
+            store.submit("test", asyncio.sleep(0))
+        release.set()
+        await store.close()
+        self.assertEqual(0, len(store))
+
+    async def test_concurrency_limit(self):
+        """Tests jobs wait for a running job before starting"""
+        store = JobStore(maxsize=3, timeout=1, concurrency_limit=1)
+        release = asyncio.Event()
+        started = []
+
+        async def work(name: str) -> str:
+            """Record the start of the job and wait to be released."""
+            started.append(name)
+            await release.wait()
+            return name
+
+        first = store.submit("test", work("first"))
+        second = store.submit("test", work("second"))
+        await first.wait(0.01)
+        self.assertEqual(["first"], started)
+        self.assertEqual("pending", second.to_dict()["status"])
+        release.set()
+        await second.wait(1)
+        self.assertEqual(["first", "second"], started)
+        self.assertEqual("second", second.to_dict()["result"]["data"])
+
+    async def test_close_cancels_running_jobs(self):
+        """Tests closing the store cancels jobs that are still running"""
+        store = JobStore(maxsize=2, timeout=10, concurrency_limit=2)
+        job = store.submit("test", asyncio.Event().wait())
+        await job.wait(0.01)
+        await store.close()
+        self.assertTrue(job.task.cancelled())
+        self.assertEqual("pending", job.to_dict()["status"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Tests logs module"""
+
+import logging
+import sys
+from logging.handlers import BufferingHandler
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from aind_metadata_service_server.logs import (
+    NonBlockingQueueHandler,
+    RequestContextFilter,
+    SamplingFilter,
+    _request_id,
+    start_queue_listener,
+)
+from aind_metadata_service_server.timing import (
+    RequestTimings,
+    _request_timings,
+)
+
+
+def make_record(msg: str, *args, exc_info=None) -> logging.LogRecord:
+    """Create a warning record as if it was logged by a test."""
+    return logging.LogRecord(
+        "tests", logging.WARNING, __file__, 1, msg, args, exc_info
+    )
+
+
+class TestRequestContextFilter:
+    """Tests methods in RequestContextFilter class"""
+
+    def test_filter_in_request(self):
+        """Tests the request ID and backend timings are added"""
+        timings = RequestTimings()
+        timings.add_duration("labtracks.get_subject", 0.0123)
+        timings.add_duration("labtracks.get_subject", 0.01)
+        id_token = _request_id.set("abc123")
+        timings_token = _request_timings.set(timings)
+        try:
+            record = make_record("Found subject")
+            assert RequestContextFilter().filter(record)
+        finally:
+            _request_timings.reset(timings_token)
+            _request_id.reset(id_token)
+        assert "abc123" == record.request_id
+        assert {"labtracks.get_subject": 22.3} == record.backend_timings
+
+    def test_filter_outside_request(self):
+        """Tests records logged outside a request are unchanged"""
+        record = make_record("Refreshing catalogs")
+        assert RequestContextFilter().filter(record)
+        assert not hasattr(record, "request_id")
+        assert not hasattr(record, "backend_timings")
+
+
+class TestSamplingFilter:
+    """Tests methods in SamplingFilter class"""
+
+    def test_filter(self):
+        """Tests one in every n matching records is kept"""
+        sampling_filter = SamplingFilter(
+            patterns=["^Skipping allele"], one_in=5
+        )
+        kept = [
+            sampling_filter.filter(
+                make_record("Skipping allele %s search for 123", f"a{i}")
+            )
+            for i in range(11)
+        ]
+        assert [0, 5, 10] == [i for i, keep in enumerate(kept) if keep]
+        assert sampling_filter.filter(make_record("Skipping subject 123"))
+
+
+class TestNonBlockingQueueHandler:
+    """Tests methods in NonBlockingQueueHandler class"""
+
+    def test_prepare(self):
+        """Tests the message and traceback are rendered separately"""
+        try:
+            raise ValueError("Bad response")
+        except ValueError:
+            record = make_record(
+                "Error building %s", "procedures", exc_info=sys.exc_info()
+            )
+        prepared = NonBlockingQueueHandler(None).prepare(record)
+        assert "Error building procedures" == prepared.msg
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        assert prepared.exc_text.startswith("Traceback")
+        assert prepared.exc_text.endswith("ValueError: Bad response")
+        assert record.exc_info is not None
+
+
+class TestStartQueueListener:
+    """Tests start_queue_listener method"""
+
+    def test_start_queue_listener(self):
+        """Tests records are handled by the original handlers"""
+        handler = BufferingHandler(capacity=10)
+        logger = logging.getLogger("tests.test_logs.queued")
+        logger.addHandler(handler)
+        id_token = _request_id.set("abc123")
+        listener = start_queue_listener(
+            ["tests.test_logs.queued", "tests.test_logs.empty"]
+        )
+        try:
+            logger.warning("Skipping allele %s", "a1")
+        finally:
+            listener.stop()
+            _request_id.reset(id_token)
+            logger.handlers = []
+        assert 1 == len(handler.buffer)
+        assert "Skipping allele a1" == handler.buffer[0].getMessage()
+        assert "abc123" == handler.buffer[0].request_id
+        assert not logging.getLogger("tests.test_logs.empty").handlers
+
+    def test_start_queue_listener_defaults(self):
+        """Tests the root and uvicorn handlers are moved by default"""
+        names = ["", "uvicorn.error", "uvicorn.access"]
+        original = {name: logging.getLogger(name).handlers for name in names}
+        handler = BufferingHandler(capacity=10)
+        logging.getLogger("uvicorn.access").handlers = [handler]
+        listener = start_queue_listener()
+        try:
+            handlers = logging.getLogger("uvicorn.access").handlers
+        finally:
+            listener.stop()
+            for name, name_handlers in original.items():
+                logging.getLogger(name).handlers = name_handlers
+        assert 1 == len(handlers)
+        assert isinstance(handlers[0], NonBlockingQueueHandler)
+        assert handler in listener.handlers
+
+
+class TestRequestIdMiddleware:
+    """Tests request IDs are set and returned"""
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_request_id_header(
+        self, mock_get_subject: AsyncMock, client: TestClient
+    ):
+        """Tests valid client IDs are reused and others replaced"""
+        mock_get_subject.return_value = []
+        response = client.get("/api/v2/subject/123456")
+        generated_id = response.headers["X-Request-ID"]
+        assert 32 == len(generated_id)
+
+        response = client.get(
+            "/api/v2/subject/123456", headers={"X-Request-ID": "abc-123"}
+        )
+        assert "abc-123" == response.headers["X-Request-ID"]
+
+        response = client.get(
+            "/api/v2/subject/123456", headers={"X-Request-ID": "a b"}
+        )
+        assert response.headers["X-Request-ID"] not in ["a b", generated_id]
@@ -0,0 +1,104 @@
+"""Tests loop_monitor module"""
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+
+from aind_metadata_service_server.loop_monitor import (
+    EventLoopMonitor,
+    get_blocking_location,
+)
+from aind_metadata_service_server.utils import capture_response
+
+
+async def block_event_loop(seconds: float) -> None:
+    """Run synchronous code that blocks the event loop."""
+    time.sleep(seconds)
+
+
+class TestEventLoopMonitor(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in EventLoopMonitor class"""
+
+    def test_blocking_call_is_reported(self):
+        """Tests the stack of a blocking call is logged once and counted"""
+        location = f"{__name__}.block_event_loop"
+        blocks_before = (
+            REGISTRY.get_sample_value(
+                "event_loop_blocks_total", {"location": location}
+            )
+            or 0
+        )
+        lag_count_before = REGISTRY.get_sample_value(
+            "event_loop_lag_seconds_count"
+        )
+
+        async def run_monitor():
+            """Block the event loop while it is monitored."""
+            monitor = EventLoopMonitor(interval=0.01, threshold=0.05)
+            monitor.start()
+            await asyncio.sleep(0.05)
+            # Block in a separate task so this frame is not inspected
+            await asyncio.create_task(block_event_loop(0.3))
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        # The monitored loop runs in its own thread because inspecting a
+        # running stack from another thread stops coverage tracing it
+        loop_thread = threading.Thread(
+            target=asyncio.run, args=[run_monitor()]
+        )
+        with patch("logging.warning") as mock_warning:
+            loop_thread.start()
+            loop_thread.join()
+        mock_warning.assert_called_once()
+        message = mock_warning.call_args.args[0]
+        self.assertIn(f"in {location}:", message)
+        self.assertIn("time.sleep(seconds)", message)
+        self.assertEqual(
+            blocks_before + 1,
+            REGISTRY.get_sample_value(
+                "event_loop_blocks_total", {"location": location}
+            ),
+        )
+        self.assertGreater(
+            REGISTRY.get_sample_value("event_loop_lag_seconds_count"),
+            lag_count_before,
+        )
+
+    def test_check_without_loop_frame(self):
+        """Tests nothing is reported if the loop thread is not running"""
+        monitor = EventLoopMonitor(interval=0.01, threshold=0)
+        with patch("logging.warning") as mock_warning:
+            monitor.check()
+        mock_warning.assert_not_called()
+
+    async def test_get_blocking_location_prefers_package_frame(self):
+        """Tests the innermost frame from the package is used"""
+
+        async def locate():
+            """Locate the current frame while awaited by package code."""
+            return get_blocking_location(sys._getframe())
+
+        captured = await capture_response(locate(), timeout=None, name="x")
+        self.assertEqual(
+            "aind_metadata_service_server.utils.capture_response",
+            captured["data"],
+        )
+
+    def test_get_blocking_location_outside_package(self):
+        """Tests the innermost frame is used if no frame is in the package"""
+        frame = sys._getframe()
+        with patch.dict(frame.f_globals, {"__name__": "other"}):
+            location = get_blocking_location(frame)
+        self.assertEqual(
+            "other.test_get_blocking_location_outside_package", location
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,13 @@
 """Module to test main app"""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
+from aind_metadata_service_server import main
 from aind_metadata_service_server.main import routers
 
 
@@ -26,6 +30,57 @@ class TestMain:
         assert len(all_api_routes) > 0
         assert all(r.operation_id == r.name for r in all_api_routes)
 
+    def test_lifespan_refreshes_catalogs(self):
+        """Tests catalogs are refreshed in the background while running"""
+        started = []
+
+        async def mock_refresh(interval):
+            """Record the interval and wait to be cancelled"""
+            started.append(interval)
+            await asyncio.Event().wait()
+
+        with (
+            patch.object(main.settings, "catalog_refresh_interval", 600),
+            patch.object(
+                main, "refresh_catalogs_periodically", side_effect=mock_refresh
+            ),
+        ):
+            with TestClient(main.app) as client:
+                response = client.get("/api/v2/healthcheck")
+        assert 200 == response.status_code
+        assert [600] == started
+
+    def test_lifespan_configures_tracing(self):
+        """Tests traces are exported and flushed if tracing is enabled"""
+        provider = MagicMock()
+        with (
+            patch.object(main.settings, "tracing_enabled", True),
+            patch.object(
+                main, "configure_tracing", return_value=provider
+            ) as mock_configure,
+        ):
+            with TestClient(main.app) as client:
+                client.get("/api/v2/healthcheck")
+                provider.shutdown.assert_not_called()
+        mock_configure.assert_called_once()
+        provider.shutdown.assert_called_once()
+
+    def test_lifespan_monitors_event_loop(self):
+        """Tests the event loop monitor runs while the app is running"""
+        with (
+            patch.object(main.settings, "event_loop_monitor_interval", 0.01),
+            patch.object(main, "EventLoopMonitor") as mock_monitor_cls,
+        ):
+            mock_monitor = mock_monitor_cls.return_value
+            mock_monitor.stop = AsyncMock()
+            with TestClient(main.app) as client:
+                client.get("/api/v2/healthcheck")
+                mock_monitor.start.assert_called_once()
+        mock_monitor_cls.assert_called_once_with(
+            interval=0.01, threshold=main.settings.event_loop_block_threshold
+        )
+        mock_monitor.stop.assert_awaited_once()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,12 +1,26 @@
 """Module to test dataverse mapper"""
 
 import unittest
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+
+from aind_dataverse_service_async_client.models import EntityTableRow
 
 from aind_metadata_service_server.mappers.dataverse import (
+    MOUSE_WEIGHT_COLUMNS,
+    MOUSE_WEIGHT_FIELD_SOURCES,
+    DataverseTableCatalog,
+    _is_kept_key,
     _parse_datetime,
+    _project_schema,
+    aggregate_daily_mouse_weights,
+    build_mouse_weight_filter,
     filter_dataverse_metadata,
+    get_column_names,
+    get_select_columns,
+    get_unknown_columns,
+    group_mouse_weight_records,
     map_mouse_weight_records,
+    paginate_records,
 )
 from aind_metadata_service_server.models import MouseWeightData
 
@@ -66,6 +80,172 @@ class TestDataverseMapper(unittest.TestCase):
         }
         self.assertEqual(filtered, expected)
 
+    def test_filter_returns_untouched_structures(self):
+        """Test that records without metadata fields are not copied."""
+        clean_row = {"cr138_name": "a", "nested": {"keep": 1}, "tags": [1]}
+        dirty_row = {"cr138_name": "b", "@odata.etag": "etag"}
+        rows = [clean_row, dirty_row]
+        filtered = filter_dataverse_metadata(rows)
+        self.assertIsNot(rows, filtered)
+        self.assertIs(clean_row, filtered[0])
+        self.assertEqual({"cr138_name": "b"}, filtered[1])
+
+        clean_rows = [clean_row, {"cr138_name": "c"}]
+        self.assertIs(clean_rows, filter_dataverse_metadata(clean_rows))
+
+        nested_dirty = {"cr138_name": "d", "nested": {"_hidden": 1}}
+        self.assertEqual(
+            {"cr138_name": "d", "nested": {}},
+            filter_dataverse_metadata(nested_dirty),
+        )
+        self.assertEqual("raw", filter_dataverse_metadata("raw"))
+
+    def test_key_decisions_are_cached(self):
+        """Test that key and schema classification is memoized."""
+        _project_schema.cache_clear()
+        rows = [{"cr138_name": str(i), "_owner": i} for i in range(10)]
+        filter_dataverse_metadata(rows)
+        cache_info = _project_schema.cache_info()
+        self.assertEqual(1, cache_info.misses)
+        self.assertEqual(9, cache_info.hits)
+        self.assertEqual(
+            (("cr138_name",), False), _project_schema(("cr138_name", "_owner"))
+        )
+        self.assertTrue(
+            _is_kept_key("_owner@OData.Community.Display.V1.FormattedValue")
+        )
+        self.assertFalse(_is_kept_key("statecode@OData"))
+
+    def test_dataverse_table_catalog(self):
+        """Test lookups and searches in the table catalog."""
+        catalog = DataverseTableCatalog(
+            [
+                EntityTableRow(
+                    entitysetname="cr138_projects",
+                    logicalname="cr138_project",
+                    name="Project",
+                ),
+                EntityTableRow(logicalname="no_entity_set"),
+            ]
+        )
+        self.assertEqual(2, len(catalog))
+        self.assertIn("cr138_projects", catalog)
+        self.assertNotIn("no_entity_set", catalog)
+        self.assertEqual(
+            ["cr138_projects"],
+            [table.entitysetname for table in catalog.search("PROJECT")],
+        )
+        self.assertEqual(
+            ["no_entity_set"],
+            [table.logicalname for table in catalog.search("entity")],
+        )
+
+    def test_get_column_names(self):
+        """Test column names are read from the first record."""
+        self.assertEqual(set(), get_column_names([]))
+        self.assertEqual(
+            {"cr138_name", "_owner_value"},
+            get_column_names(
+                [
+                    {
+                        "@odata.etag": "etag",
+                        "cr138_name": "a",
+                        "_owner_value": "b",
+                        "_owner_value@OData.Community.Display.V1."
+                        "FormattedValue": "c",
+                    }
+                ]
+            ),
+        )
+
+    def test_get_unknown_columns(self):
+        """Test unknown columns in a selection are reported."""
+        self.assertEqual(
+            ["typo"],
+            get_unknown_columns(" cr138_name, typo,,", {"cr138_name"}),
+        )
+
+    def test_paginate_records(self):
+        """Test slicing pages out of a list of records"""
+        records = [{"id": i} for i in range(5)]
+        self.assertEqual((records, None), paginate_records(records))
+        self.assertEqual(
+            (records[3:], None), paginate_records(records, skip=3)
+        )
+        self.assertEqual(
+            (records[0:2], 2), paginate_records(records, top=2, skip=0)
+        )
+        self.assertEqual(
+            (records[2:4], 4), paginate_records(records, top=2, skip=2)
+        )
+        self.assertEqual(
+            (records[4:], None), paginate_records(records, top=2, skip=4)
+        )
+        self.assertEqual(([], None), paginate_records(records, top=2, skip=10))
+
+    def test_get_select_columns(self):
+        """Test that annotation keys are reduced to their base column."""
+        self.assertEqual(
+            "_owner_value,name",
+            get_select_columns(
+                {
+                    "owner": "_owner_value@OData.Community.Display.V1."
+                    "FormattedValue",
+                    "owner_id": "_owner_value",
+                    "name": "name",
+                }
+            ),
+        )
+
+    def test_mouse_weight_columns(self):
+        """Test the mouse weight selection covers every model field."""
+        self.assertEqual(
+            set(MouseWeightData.model_fields), set(MOUSE_WEIGHT_FIELD_SOURCES)
+        )
+        self.assertEqual(
+            (
+                "aibs_fact_mouse_weight_recordsid,_aibs_mouse_id_value,"
+                "aibs_weight,cr138_datetime,aibs_is_baseline_weight,"
+                "_aibs_operator_value,aibs_workstation,aibs_software_version,"
+                "aibs_software_source,statuscode,aibs_notes"
+            ),
+            MOUSE_WEIGHT_COLUMNS,
+        )
+
+    def test_build_mouse_weight_filter(self):
+        """Test OData filters for one or many subjects and date ranges."""
+        self.assertEqual(
+            "aibs_mouse_id/aibs_mouse_id eq '123'",
+            build_mouse_weight_filter(["123"]),
+        )
+        self.assertEqual(
+            (
+                "(aibs_mouse_id/aibs_mouse_id eq '123' or "
+                "aibs_mouse_id/aibs_mouse_id eq 'o''neil')"
+                " and cr138_datetime ge 2026-08-07T00:00:00Z"
+                " and cr138_datetime lt 2026-08-08T07:00:00Z"
+            ),
+            build_mouse_weight_filter(
+                ["123", "o'neil"],
+                start=datetime(2026, 8, 7),
+                end=datetime(2026, 8, 8, tzinfo=timezone(timedelta(hours=-7))),
+            ),
+        )
+
+    def test_group_mouse_weight_records(self):
+        """Test grouping records by subject ID."""
+        records = [
+            MouseWeightData(mouse_id="1", weight=20.0),
+            MouseWeightData(mouse_id="2", weight=21.0),
+            MouseWeightData(mouse_id="1", weight=22.0),
+            MouseWeightData(mouse_id="9", weight=23.0),
+        ]
+        grouped = group_mouse_weight_records(records, ["1", "2", "3"])
+        self.assertEqual(["1", "2", "3"], list(grouped))
+        self.assertEqual([20.0, 22.0], [r.weight for r in grouped["1"]])
+        self.assertEqual([21.0], [r.weight for r in grouped["2"]])
+        self.assertEqual([], grouped["3"])
+
     def test_map_mouse_weight_records_success(self):
         """Test successful mapping of mouse weight records"""
         raw_response = [
@@ -176,6 +356,48 @@ class TestDataverseMapper(unittest.TestCase):
         self.assertEqual(result[0].weight_datetime.minute, 30)
         self.assertEqual(result[0].weight_datetime.second, 14)
 
+    def test_aggregate_daily_mouse_weights(self):
+        """Test daily summaries computed from raw records."""
+        raw_response = [
+            {
+                "aibs_weight": 22.0,
+                "cr138_datetime": "2026-08-07T17:30:00Z",
+                "aibs_is_baseline_weight": False,
+            },
+            {
+                "aibs_weight": 21.0,
+                "cr138_datetime": "2026-08-07T09:00:00Z",
+                "aibs_is_baseline_weight": True,
+            },
+            {
+                "aibs_weight": 20.0,
+                "cr138_datetime": "2026-08-06T09:00:00Z",
+                "aibs_is_baseline_weight": True,
+            },
+            {"aibs_weight": None, "cr138_datetime": "2026-08-06T10:00:00Z"},
+            {"aibs_weight": 30.0, "cr138_datetime": None},
+        ]
+        summaries = aggregate_daily_mouse_weights(raw_response)
+        self.assertEqual(
+            [date(2026, 8, 6), date(2026, 8, 7)],
+            [summary.day for summary in summaries],
+        )
+        self.assertEqual(1, summaries[0].count)
+        self.assertEqual(2, summaries[1].count)
+        self.assertEqual(21.0, summaries[1].min_weight)
+        self.assertEqual(21.5, summaries[1].mean_weight)
+        self.assertEqual(22.0, summaries[1].max_weight)
+        self.assertEqual(22.0, summaries[1].latest_weight)
+        self.assertEqual(17, summaries[1].latest_weight_datetime.hour)
+
+        baseline_summaries = aggregate_daily_mouse_weights(
+            raw_response, baseline_only=True
+        )
+        self.assertEqual(2, len(baseline_summaries))
+        self.assertEqual(21.0, baseline_summaries[1].latest_weight)
+        self.assertEqual(1, baseline_summaries[1].count)
+        self.assertEqual([], aggregate_daily_mouse_weights(None))
+
     def test_parse_datetime(self):
         """Test parsing datetime strings from Dataverse"""
         result = _parse_datetime("2026-08-07T17:30:14Z")
@@ -7,7 +7,11 @@ from aind_data_schema.core.data_description import Funding
 from aind_data_schema_models.organizations import Organization
 from aind_smartsheet_service_async_client.models import FundingModel
 
-from aind_metadata_service_server.mappers.funding import FundingMapper
+from aind_metadata_service_server.mappers.funding import (
+    FundingMapper,
+    FundingSnapshot,
+    ProjectNameIndex,
+)
 
 
 class TestFundingMapper(unittest.TestCase):
@@ -261,6 +265,69 @@ class TestFundingMapper(unittest.TestCase):
         result = FundingMapper._parse_institution(None)
         self.assertIsNone(result)
 
+    def test_funding_snapshot(self):
+        """Tests the snapshot indexes rows by project and subproject"""
+        discovery_project = (
+            "Discovery-Neuromodulator circuit dynamics during foraging"
+        )
+        sub1 = (
+            "Subproject 1 Electrophysiological Recordings from NM Neurons"
+            " During Behavior"
+        )
+        snapshot = FundingSnapshot(self.funding_sheet)
+        self.assertEqual(6, len(snapshot))
+        self.assertEqual(
+            FundingMapper(self.funding_sheet).get_project_names(),
+            snapshot.project_names,
+        )
+        self.assertEqual(
+            self.funding_sheet[3:], snapshot.get_rows(discovery_project)
+        )
+        self.assertEqual(
+            self.funding_sheet[3:5],
+            snapshot.get_rows(discovery_project, sub1),
+        )
+        self.assertEqual([], snapshot.get_rows("Unknown Project"))
+        self.assertTrue(snapshot.has_subprojects(discovery_project))
+        self.assertFalse(snapshot.has_subprojects("Ephys Platform"))
+        self.assertEqual(
+            [Person(name="Person Six"), Person(name="Person Eight")],
+            snapshot.get_investigators(discovery_project, sub1),
+        )
+        self.assertEqual([], snapshot.get_investigators("Ephys Platform"))
+        self.assertEqual([], snapshot.get_investigators("Unknown Project"))
+
+    def test_project_name_index_search(self):
+        """Tests project names are ranked by similarity to a query"""
+        index = FundingSnapshot(self.funding_sheet).project_name_index
+        exact = index.search(
+            "discovery-neuromodulator circuit dynamics during foraging-"
+            "Subproject 2 molecular anatomy cell types"
+        )
+        self.assertEqual(
+            "Discovery-Neuromodulator circuit dynamics during foraging - "
+            "Subproject 2 Molecular Anatomy Cell Types",
+            exact[0].name,
+        )
+        self.assertEqual(1.0, exact[0].score)
+        typo = index.search("Ephys Platfrom")
+        self.assertEqual(["Ephys Platform"], [m.name for m in typo])
+        partial = index.search("platform")
+        self.assertEqual(
+            ["MSMA Platform", "Ephys Platform"], [m.name for m in partial]
+        )
+        self.assertEqual(1, len(index.search("platform", limit=1)))
+        self.assertEqual([], index.search(" - "))
+        self.assertEqual([], index.search("xyz"))
+
+    def test_project_name_index_normalize(self):
+        """Tests names are normalized before indexing"""
+        self.assertEqual(
+            "thalamus project 1",
+            ProjectNameIndex.normalize("Thalamus -Project  1"),
+        )
+        self.assertEqual({"  a", " a "}, ProjectNameIndex.trigrams("a"))
+
 
 if __name__ == "__main__":
     unittest.main()
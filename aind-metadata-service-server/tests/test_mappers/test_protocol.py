@@ -4,7 +4,10 @@ import unittest
 
 from aind_smartsheet_service_async_client.models import ProtocolsModel
 
-from aind_metadata_service_server.mappers.protocol import ProtocolMapper
+from aind_metadata_service_server.mappers.protocol import (
+    ProtocolCatalog,
+    ProtocolMapper,
+)
 from aind_metadata_service_server.models import ProtocolInformation
 
 
@@ -123,6 +126,25 @@ class TestProtocolMapper(unittest.TestCase):
         self.assertIsNotNone(protocol_info)
         self.assertFalse(protocol_info.protocol_collection)
 
+    def test_protocol_catalog(self):
+        """Tests protocols are indexed by protocol name"""
+        catalog = ProtocolCatalog(self.protocols_sheet)
+        name = (
+            "Tetrahydrofuran and Dichloromethane Delipidation of a "
+            "Whole Mouse Brain"
+        )
+        self.assertEqual(1, len(catalog))
+        self.assertIn(name, catalog)
+        self.assertEqual(
+            [self.protocols_sheet[0]], catalog.get_protocols(name)
+        )
+        self.assertEqual(
+            "Delipidation",
+            catalog.get_protocol_information(name)[0].procedure_name,
+        )
+        self.assertEqual([], catalog.get_protocols("Unknown"))
+        self.assertEqual([], catalog.get_protocol_information("Unknown"))
+
 
 if __name__ == "__main__":
     unittest.main()
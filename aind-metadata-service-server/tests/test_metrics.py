@@ -0,0 +1,110 @@
+"""Tests metrics module"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from prometheus_client import REGISTRY
+
+from aind_metadata_service_server.caches import TTLCache
+from aind_metadata_service_server.metrics import InstrumentedApi
+
+
+class TestInstrumentedApi(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in InstrumentedApi class"""
+
+    @staticmethod
+    def get_count(operation: str, outcome: str) -> float:
+        """Number of recorded calls for a test client operation"""
+        return (
+            REGISTRY.get_sample_value(
+                "backend_call_duration_seconds_count",
+                {
+                    "client": "test",
+                    "operation": operation,
+                    "outcome": outcome,
+                },
+            )
+            or 0
+        )
+
+    async def test_operations_are_timed(self):
+        """Tests async operations record their outcome"""
+        api_instance = MagicMock()
+        api_instance.get_item = AsyncMock(return_value=["item"])
+        api_instance.get_missing = AsyncMock(side_effect=ValueError("error"))
+        api = InstrumentedApi("test", api_instance)
+        successes = self.get_count("get_item", "success")
+        errors = self.get_count("get_missing", "error")
+
+        self.assertEqual(["item"], await api.get_item("1", _request_timeout=1))
+        with self.assertRaises(ValueError):
+            await api.get_missing("2")
+
+        api_instance.get_item.assert_awaited_once_with("1", _request_timeout=1)
+        self.assertEqual(successes + 1, self.get_count("get_item", "success"))
+        self.assertEqual(errors + 1, self.get_count("get_missing", "error"))
+        self.assertEqual(
+            0,
+            REGISTRY.get_sample_value(
+                "backend_calls_in_progress", {"client": "test"}
+            ),
+        )
+
+    def test_sync_operations_are_timed(self):
+        """Tests listed synchronous operations record their outcome"""
+        api_instance = MagicMock()
+        api_instance.retrieve_records.return_value = ["record"]
+        api = InstrumentedApi(
+            "test", api_instance, sync_operations=["retrieve_records"]
+        )
+        successes = self.get_count("retrieve_records", "success")
+
+        self.assertEqual(["record"], api.retrieve_records(filter_query={}))
+
+        api_instance.retrieve_records.assert_called_once_with(filter_query={})
+        self.assertEqual(
+            successes + 1, self.get_count("retrieve_records", "success")
+        )
+        self.assertIs(api_instance.close, api.close)
+
+    def test_other_attributes_are_not_wrapped(self):
+        """Tests private and synchronous attributes are returned as is"""
+        api_instance = MagicMock()
+        api = InstrumentedApi("test", api_instance)
+        self.assertIs(api_instance.api_client, api.api_client)
+        self.assertIs(
+            api_instance._get_item_serialize, api._get_item_serialize
+        )
+
+
+class TestCacheCollector(unittest.TestCase):
+    """Tests methods in CacheCollector class"""
+
+    def test_collect(self):
+        """Tests caches sharing a name are reported together"""
+        first = TTLCache(name="metrics_test", ttl=10)
+        second = TTLCache(name="metrics_test", ttl=10)
+        first.set("a", 1)
+        first.get("a")
+        first.get("b")
+        second.get("c")
+        labels = {"cache": "metrics_test"}
+        self.assertEqual(
+            1, REGISTRY.get_sample_value("cache_hits_total", labels)
+        )
+        self.assertEqual(
+            2, REGISTRY.get_sample_value("cache_misses_total", labels)
+        )
+        self.assertEqual(1, REGISTRY.get_sample_value("cache_entries", labels))
+        self.assertAlmostEqual(
+            1 / 3, REGISTRY.get_sample_value("cache_hit_ratio", labels)
+        )
+        first.clear()
+        second.clear()
+        self.assertEqual(
+            0, REGISTRY.get_sample_value("cache_hit_ratio", labels)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
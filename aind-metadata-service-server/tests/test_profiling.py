@@ -0,0 +1,95 @@
+"""Tests profiling module"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from aind_metadata_service_server.profiling import (
+    ProfilingMiddleware,
+    import_profiler,
+)
+
+
+def build_profiled_app() -> FastAPI:
+    """Build an app whose subject route can be profiled."""
+    profiled_app = FastAPI()
+
+    @profiled_app.get("/subject/{subject_id}")
+    async def get_subject(subject_id: str):
+        """Return a subject, or a 404 for unknown subjects."""
+        if subject_id == "000000":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"subject_id": subject_id}
+
+    profiled_app.add_middleware(
+        ProfilingMiddleware, token="secret", routes=["/subject/{subject_id}"]
+    )
+    return profiled_app
+
+
+class TestProfilingMiddleware:
+    """Tests requests are profiled on demand"""
+
+    def test_profile_html(self):
+        """Tests the profile is returned instead of the payload"""
+        profiled_client = TestClient(build_profiled_app())
+        response = profiled_client.get(
+            "/subject/000000", headers={"X-Profile-Token": "secret"}
+        )
+        assert 200 == response.status_code
+        assert "text/html" in response.headers["content-type"]
+        assert "404" == response.headers["X-Profiled-Status-Code"]
+        assert "pyinstrument" in response.text
+
+    def test_profile_text(self):
+        """Tests the profile can be returned as text"""
+        profiled_client = TestClient(build_profiled_app())
+        response = profiled_client.get(
+            "/subject/123456",
+            headers={"X-Profile-Token": "secret", "X-Profile-Format": "text"},
+        )
+        assert 200 == response.status_code
+        assert "text/plain" in response.headers["content-type"]
+        assert "200" == response.headers["X-Profiled-Status-Code"]
+        assert '{"subject_id"' not in response.text
+
+    def test_requests_without_token(self, client: TestClient):
+        """Tests requests without a token are handled normally"""
+        response = client.get("/api/v2/healthcheck")
+        assert 200 == response.status_code
+        assert "X-Profiled-Status-Code" not in response.headers
+
+    def test_invalid_token(self, client: TestClient):
+        """Tests requests with a wrong token are rejected"""
+        response = client.get(
+            "/api/v2/procedures/123456", headers={"X-Profile-Token": "wrong"}
+        )
+        assert 403 == response.status_code
+        assert {"detail": "Invalid profiling token"} == response.json()
+
+    def test_route_not_targeted(self, client: TestClient):
+        """Tests only target routes can be profiled"""
+        response = client.get(
+            "/api/v2/subject/123456",
+            headers={"X-Profile-Token": "test-profiling-token"},
+        )
+        assert 400 == response.status_code
+        assert {
+            "detail": (
+                "Only these routes can be profiled: "
+                "['/api/v2/procedures/{subject_id}']"
+            )
+        } == response.json()
+
+
+class TestImportProfiler:
+    """Tests import_profiler method"""
+
+    def test_missing_extra(self):
+        """Tests a helpful error is raised without the profiling extra"""
+        with patch.dict(sys.modules, {"pyinstrument": None}):
+            with pytest.raises(ImportError, match="profiling extra"):
+                import_profiler()
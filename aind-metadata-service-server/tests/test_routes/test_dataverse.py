@@ -1,14 +1,20 @@
 """Tests for dataverse routes"""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aind_dataverse_service_async_client.exceptions import (
     ApiException,
 )
+from aind_dataverse_service_async_client.models import EntityTableRow
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from aind_metadata_service_server.routes.dataverse import (
+    table_catalog_reloads,
+)
+
 
 class TestDataverseRoutes:
     """Tests for dataverse endpoints"""
@@ -21,21 +27,21 @@ class TestDataverseRoutes:
     ):
         """Test successful retrieval of table info"""
         mock_response = [
-            {
-                "LogicalName": "cr138_projects",
-                "EntitySetName": "cr138_projects",
-            },
-            {
-                "LogicalName": "cr138_subjects",
-                "EntitySetName": "cr138_subjects",
-            },
+            EntityTableRow(
+                logicalname="cr138_projects",
+                entitysetname="cr138_projects",
+            ),
+            EntityTableRow(
+                logicalname="cr138_subjects",
+                entitysetname="cr138_subjects",
+            ),
         ]
         mock_api_get.return_value = mock_response
 
         response = client.get("/api/v2/dataverse/tables")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.json() == mock_response
+        assert response.json() == [row.model_dump() for row in mock_response]
         assert len(mock_api_get.mock_calls) == 1
 
     @patch("aind_dataverse_service_async_client.DefaultApi.get_table_info")
@@ -58,6 +64,7 @@ class TestDataverseRoutes:
         self,
         mock_api_get: AsyncMock,
         client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
     ):
         """Test table data retrieval with various scenarios"""
         # Test successful retrieval
@@ -73,10 +80,19 @@ class TestDataverseRoutes:
 
         # Test not found
         mock_api_get.return_value = None
-        response = client.get("/api/v2/dataverse/tables/nonexistent_table")
+        response = client.get("/api/v2/dataverse/tables/cr138_projects")
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json() == {"detail": "Not found"}
 
+        # Test table missing from the catalog
+        response = client.get("/api/v2/dataverse/tables/nonexistent_table")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {
+            "detail": "Table nonexistent_table not found"
+        }
+        assert 2 == mock_api_get.call_count
+        assert 2 == mock_dataverse_table_info.call_count
+
         # Test API exception handling
         mock_exception = ApiException(
             http_resp=MagicMock(status=400),
@@ -96,6 +112,7 @@ class TestDataverseRoutes:
         self,
         mock_api_get: AsyncMock,
         client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
     ):
         """Test using both columns and filter parameters together"""
         mock_response = [
@@ -124,6 +141,250 @@ class TestDataverseRoutes:
             _request_timeout=10,
         )
 
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table_info")
+    def test_get_dataverse_table_info_search_and_cache(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test the table catalog is cached and can be searched"""
+        mock_api_get.return_value = [
+            EntityTableRow(entitysetname="cr138_projects", name="Project"),
+            EntityTableRow(entitysetname="cr138_subjects", name="Subject"),
+        ]
+        response = client.get(
+            "/api/v2/dataverse/tables", params={"search": "PROJ"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert ["cr138_projects"] == [
+            table["entitysetname"] for table in response.json()
+        ]
+        response = client.get("/api/v2/dataverse/tables")
+        assert 2 == len(response.json())
+        response = client.get(
+            "/api/v2/dataverse/tables", params={"search": "missing"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert 1 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_dataverse_table_validates_columns(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
+    ):
+        """Test unknown columns are rejected once a table has been seen"""
+        mock_api_get.return_value = [
+            {
+                "@odata.etag": "etag",
+                "cr138_projectid": "123",
+                "_ownerid_value": "owner",
+                "_ownerid_value@OData.Community.Display.V1.FormattedValue": (
+                    "Owner"
+                ),
+            }
+        ]
+        # Columns are not known yet, so the request is forwarded
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects",
+            params={"columns": "cr138_typo"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = client.get("/api/v2/dataverse/tables/cr138_projects")
+        assert response.status_code == status.HTTP_200_OK
+        assert 2 == mock_api_get.call_count
+
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects",
+            params={"columns": "cr138_projectid, _ownerid_value,cr138_typo"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {
+            "detail": "Unknown columns for cr138_projects: cr138_typo"
+        }
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects",
+            params={"columns": "cr138_projectid,_ownerid_value"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert 3 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table_info")
+    def test_get_dataverse_table_without_catalog(
+        self,
+        mock_api_get_info: AsyncMock,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test requests are forwarded when the catalog cannot be loaded"""
+        mock_exception = ApiException(
+            http_resp=MagicMock(status=500), body=None, data=None
+        )
+        mock_api_get_info.side_effect = mock_exception
+        mock_api_get.return_value = [{"cr138_projectid": "123"}]
+        response = client.get("/api/v2/dataverse/tables/any_table")
+        assert response.status_code == status.HTTP_200_OK
+        assert 1 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table_info")
+    def test_get_dataverse_table_catalog_reload(
+        self,
+        mock_api_get_info: AsyncMock,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test tables created after the catalog was loaded are found"""
+        old_table = EntityTableRow(
+            entitysetname="cr138_old", logicalname="cr138_old"
+        )
+        new_table = EntityTableRow(
+            entitysetname="cr138_new", logicalname="cr138_new"
+        )
+        mock_api_get_info.side_effect = [
+            [old_table],
+            [old_table, new_table],
+            ApiException(http_resp=MagicMock(status=500)),
+        ]
+        mock_api_get.return_value = [{"cr138_newid": "1"}]
+        response = client.get("/api/v2/dataverse/tables/cr138_new")
+        assert response.status_code == status.HTTP_200_OK
+        assert 2 == mock_api_get_info.call_count
+
+        # Reloads are rate limited
+        response = client.get("/api/v2/dataverse/tables/cr138_other")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert 2 == mock_api_get_info.call_count
+
+        # The cached catalog is kept if the reload fails
+        table_catalog_reloads.clear()
+        response = client.get("/api/v2/dataverse/tables/cr138_other")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert 3 == mock_api_get_info.call_count
+        assert 1 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_dataverse_table_pagination(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
+    ):
+        """Test paging through a table with top and skip"""
+        mock_api_get.return_value = [
+            {"cr138_projectid": str(i), "_hidden": i} for i in range(5)
+        ]
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects",
+            params={"top": 2, "skip": 1},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"cr138_projectid": "1"},
+            {"cr138_projectid": "2"},
+        ]
+        assert 'rel="next"' in response.headers["Link"]
+        assert "skip=3" in response.headers["Link"]
+        assert "top=2" in response.headers["Link"]
+
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects",
+            params={"top": 2, "skip": 3},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["cr138_projectid"] for r in response.json()] == ["3", "4"]
+        assert "Link" not in response.headers
+        mock_api_get.assert_called_once_with(
+            "cr138_projects", columns=None, filter=None, _request_timeout=60
+        )
+
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects", params={"top": 0}
+        )
+        assert response.status_code == 422
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_dataverse_table_pagination_large_table(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
+    ):
+        """Test tables too large to keep are fetched for every page"""
+        mock_api_get.return_value = [
+            {"cr138_projectid": str(i)} for i in range(5)
+        ]
+        with patch(
+            "aind_metadata_service_server.routes.dataverse.settings."
+            "dataverse_table_page_max_records",
+            4,
+        ):
+            for skip in [0, 2]:
+                response = client.get(
+                    "/api/v2/dataverse/tables/cr138_projects",
+                    params={"top": 2, "skip": skip},
+                )
+                assert response.status_code == status.HTTP_200_OK
+        assert 2 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_stream_dataverse_table(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
+    ):
+        """Test streaming a table as newline-delimited JSON"""
+        mock_api_get.return_value = [
+            {"cr138_projectid": str(i), "@odata.etag": "etag"}
+            for i in range(3)
+        ]
+        response = client.get(
+            "/api/v2/dataverse/tables/cr138_projects/stream",
+            params={"columns": "cr138_projectid", "skip": 1},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith(
+            "application/x-ndjson"
+        )
+        lines = response.text.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"cr138_projectid": "1"},
+            {"cr138_projectid": "2"},
+        ]
+        mock_api_get.assert_called_once_with(
+            "cr138_projects",
+            columns="cr138_projectid",
+            filter=None,
+            _request_timeout=60,
+        )
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_stream_dataverse_table_errors(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+        mock_dataverse_table_info: AsyncMock,
+    ):
+        """Test not found and upstream errors when streaming a table"""
+        mock_api_get.return_value = []
+        response = client.get("/api/v2/dataverse/tables/cr138_projects/stream")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        mock_exception = ApiException(
+            http_resp=MagicMock(status=400),
+            body='{"error": "Invalid table name"}',
+            data=None,
+        )
+        mock_exception.status = 400
+        mock_exception.reason = "Bad Request"
+        mock_api_get.side_effect = mock_exception
+        response = client.get("/api/v2/dataverse/tables/invalid_table/stream")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Error fetching invalid_table" in response.json()["detail"]
+
     @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
     def test_get_mouse_weight_records_success_and_multiple(
         self,
@@ -217,6 +478,11 @@ class TestDataverseRoutes:
         assert "aibs_mouse_id/aibs_mouse_id eq '888888'" in filter_arg
         assert "cr138_datetime ge 2026-08-07T00:00:00Z" in filter_arg
         assert "cr138_datetime lt 2026-08-08T00:00:00Z" in filter_arg
+        assert "aibs_weight" in call_args.kwargs["columns"].split(",")
+        assert (
+            "aibs_fact_mouse_weight_recordses"
+            == call_args.kwargs["entity_set_table_name"]
+        )
 
     @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
     def test_get_mouse_weight_records_errors(
@@ -247,6 +513,187 @@ class TestDataverseRoutes:
         )
         assert "Internal Server Error" in response.json()["detail"]
 
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_mouse_weight_records_with_range(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test mouse weight records with start and end filters"""
+        mock_api_get.return_value = [
+            {"aibs_fact_mouse_weight_recordsid": "test-record-range"}
+        ]
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/888888",
+            params={
+                "start": "2026-08-01T00:00:00",
+                "end": "2026-09-01T00:00:00",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        filter_arg = mock_api_get.call_args.kwargs["filter"]
+        assert "cr138_datetime ge 2026-08-01T00:00:00Z" in filter_arg
+        assert "cr138_datetime lt 2026-09-01T00:00:00Z" in filter_arg
+
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/888888",
+            params={
+                "start": "2026-08-01T00:00:00",
+                "acquisition_datetime": "2026-08-07T00:00:00",
+            },
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 1 == mock_api_get.call_count
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_daily_mouse_weights(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test daily mouse weight summaries"""
+        mock_api_get.return_value = [
+            {
+                "aibs_weight": 22.0,
+                "cr138_datetime": "2026-08-07T17:30:00Z",
+                "aibs_is_baseline_weight": False,
+            },
+            {
+                "aibs_weight": 21.0,
+                "cr138_datetime": "2026-08-07T09:00:00Z",
+                "aibs_is_baseline_weight": True,
+            },
+        ]
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/888888/daily",
+            params={"start": "2026-08-01T00:00:00"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "day": "2026-08-07",
+                "count": 2,
+                "min_weight": 21.0,
+                "mean_weight": 21.5,
+                "max_weight": 22.0,
+                "latest_weight": 22.0,
+                "latest_weight_datetime": "2026-08-07T17:30:00Z",
+            }
+        ]
+        filter_arg = mock_api_get.call_args.kwargs["filter"]
+        assert "cr138_datetime ge 2026-08-01T00:00:00Z" in filter_arg
+        assert (
+            "aibs_weight,cr138_datetime,aibs_is_baseline_weight"
+            == mock_api_get.call_args.kwargs["columns"]
+        )
+
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/888888/daily",
+            params={"aggregation": "baseline"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert 21.0 == response.json()[0]["latest_weight"]
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_daily_mouse_weights_errors(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test error handling for daily mouse weight summaries"""
+        mock_api_get.return_value = []
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/000000/daily"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        mock_exception = ApiException(
+            http_resp=MagicMock(status=500),
+            body='{"error": "Internal server error"}',
+            data=None,
+        )
+        mock_exception.status = 500
+        mock_exception.reason = "Internal Server Error"
+        mock_api_get.side_effect = mock_exception
+        response = client.get(
+            "/api/v2/dataverse/mouse_weight_records/555555/daily"
+        )
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_batch_mouse_weight_records(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test batch retrieval of mouse weight records"""
+        formatted_mouse_id = (
+            "_aibs_mouse_id_value@OData.Community.Display.V1.FormattedValue"
+        )
+
+        def get_table(entity_set_table_name, columns, filter, **kwargs):
+            """Return one record per subject ID in the filter"""
+            return [
+                {formatted_mouse_id: subject_id, "aibs_weight": 20.0}
+                for subject_id in [str(i) for i in range(60)]
+                if f"eq '{subject_id}'" in filter
+            ]
+
+        mock_api_get.side_effect = get_table
+        subject_ids = [str(i) for i in range(60)] + ["0", "999"]
+        response = client.post(
+            "/api/v2/dataverse/mouse_weight_records",
+            json={
+                "subject_ids": subject_ids,
+                "start": "2026-08-01T00:00:00",
+                "end": "2026-09-01T00:00:00",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert 61 == len(result)
+        assert 1 == len(result["0"])
+        assert result["0"][0]["mouse_id"] == "0"
+        assert [] == result["999"]
+        assert 2 == mock_api_get.call_count
+        filters = [c.kwargs["filter"] for c in mock_api_get.call_args_list]
+        assert all(
+            "cr138_datetime ge 2026-08-01T00:00:00Z" in f for f in filters
+        )
+        assert 50 == filters[0].count(" eq ")
+        assert 11 == filters[1].count(" eq ")
+
+    @patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+    def test_get_batch_mouse_weight_records_errors(
+        self,
+        mock_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Test validation and upstream errors for batch requests"""
+        response = client.post(
+            "/api/v2/dataverse/mouse_weight_records",
+            json={"subject_ids": []},
+        )
+        assert response.status_code == 422
+        mock_api_get.assert_not_called()
+
+        mock_exception = ApiException(
+            http_resp=MagicMock(status=500),
+            body='{"error": "Internal server error"}',
+            data=None,
+        )
+        mock_exception.status = 500
+        mock_exception.reason = "Internal Server Error"
+        mock_api_get.side_effect = mock_exception
+        response = client.post(
+            "/api/v2/dataverse/mouse_weight_records",
+            json={"subject_ids": ["555555"]},
+        )
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert (
+            "Error fetching mouse weight records" in response.json()["detail"]
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
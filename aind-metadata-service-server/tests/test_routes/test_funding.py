@@ -387,6 +387,91 @@ class TestRoute:
         assert 200 == response.status_code
         assert 1 == len(mock_get_funding.mock_calls)
 
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_funding",
+        new_callable=AsyncMock,
+    )
+    def test_funding_snapshot_is_shared(
+        self,
+        mock_get_funding: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests the funding sheet is downloaded once for every route"""
+        mock_get_funding.return_value = [
+            FundingModel(
+                project_name="Ephys Platform",
+                funding_institution="Allen Institute",
+                fundees="Person One",
+                investigators="Person Two",
+            ),
+        ]
+        funding_response = client.get("/api/v2/funding/Ephys Platform")
+        investigators_response = client.get(
+            "/api/v2/investigators/Ephys Platform"
+        )
+        project_names_response = client.get("/api/v2/project_names")
+        raw_response = client.get("/api/v2/smartsheet/funding")
+        assert 200 == funding_response.status_code
+        assert ["Person Two"] == [
+            p["name"] for p in investigators_response.json()
+        ]
+        assert ["Ephys Platform"] == project_names_response.json()
+        assert 1 == len(raw_response.json())
+        mock_get_funding.assert_awaited_once_with(_request_timeout=10)
+
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_funding",
+        new_callable=AsyncMock,
+    )
+    def test_empty_funding_sheet_is_not_cached(
+        self,
+        mock_get_funding: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests an empty funding sheet is downloaded again"""
+        mock_get_funding.return_value = []
+        client.get("/api/v2/project_names")
+        client.get("/api/v2/project_names")
+        assert 2 == len(mock_get_funding.mock_calls)
+
+    @patch(
+        "aind_smartsheet_service_async_client.DefaultApi.get_funding",
+        new_callable=AsyncMock,
+    )
+    def test_search_project_names(
+        self,
+        mock_get_funding: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests project names are ranked by similarity to the query"""
+        mock_get_funding.return_value = [
+            FundingModel(project_name="Ephys Platform"),
+            FundingModel(project_name="MSMA Platform"),
+            FundingModel(
+                project_name="Thalamus in the middle",
+                subproject="Project 6 Molecular Science Core",
+            ),
+        ]
+        response = client.get(
+            "/api/v2/project_names/search",
+            params={"q": "thalamus in the middle-project 6", "limit": 2},
+        )
+        no_match_response = client.get(
+            "/api/v2/project_names/search", params={"q": "zzz"}
+        )
+        assert 200 == response.status_code
+        assert (
+            "Thalamus in the middle - Project 6 Molecular Science Core"
+            == response.json()[0]["name"]
+        )
+        assert [] == no_match_response.json()
+        assert 1 == len(mock_get_funding.mock_calls)
+
+    def test_search_project_names_invalid(self, client: TestClient):
+        """Tests an empty query is rejected"""
+        response = client.get("/api/v2/project_names/search", params={"q": ""})
+        assert 422 == response.status_code
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
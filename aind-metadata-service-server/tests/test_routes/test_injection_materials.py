@@ -1,5 +1,8 @@
 """Test injection_materials routes"""
 
+import json
+import os
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -11,6 +14,13 @@ from aind_tars_service_async_client import (
 )
 from fastapi.testclient import TestClient
 
+RESOURCES_DIR = (
+    Path(os.path.dirname(os.path.realpath(__file__)))
+    / ".."
+    / "resources"
+    / "tars"
+)
+
 
 class TestRoute:
     """Test responses."""
@@ -58,6 +68,165 @@ class TestRoute:
         )
         assert 404 == response.status_code
 
+    @patch("aind_tars_service_async_client.DefaultApi.get_viruses")
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    def test_get_injection_materials_cached(
+        self,
+        mock_tars_api_get_viral_prep_lots: AsyncMock,
+        mock_tars_api_get_viruses: AsyncMock,
+        client: TestClient,
+        mock_tars_prep_lot_230929: PrepLotData,
+        mock_tars_virus_v123: VirusData,
+    ):
+        """Tests repeated lookups of a lot are served from the cache"""
+        mock_tars_api_get_viral_prep_lots.return_value = [
+            mock_tars_prep_lot_230929
+        ]
+        mock_tars_api_get_viruses.return_value = [mock_tars_virus_v123]
+        responses = [
+            client.get("/api/v2/tars_injection_materials/230929-12")
+            for _ in range(2)
+        ]
+        assert responses[0].json() == responses[1].json()
+        mock_tars_api_get_viral_prep_lots.assert_called_once_with(
+            lot="230929-12", _request_timeout=10
+        )
+        mock_tars_api_get_viruses.assert_called_once_with(
+            name="v_123", _request_timeout=10
+        )
+
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    def test_get_injection_materials_negative_cache(
+        self,
+        mock_tars_api_get_viral_prep_lots: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests missing lots are cached for the negative cache ttl"""
+        mock_tars_api_get_viral_prep_lots.return_value = []
+        with patch("time.monotonic", return_value=1000):
+            first = client.get("/api/v2/tars_injection_materials/typo")
+            second = client.get("/api/v2/tars_injection_materials/typo")
+        with patch("time.monotonic", return_value=1301):
+            third = client.get("/api/v2/tars_injection_materials/typo")
+        assert [404, 404, 404] == [
+            first.status_code,
+            second.status_code,
+            third.status_code,
+        ]
+        assert 2 == mock_tars_api_get_viral_prep_lots.call_count
+
+    @patch("aind_tars_service_async_client.DefaultApi.get_viruses")
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    def test_get_injection_materials_dedupes_viruses(
+        self,
+        mock_tars_api_get_viral_prep_lots: AsyncMock,
+        mock_tars_api_get_viruses: AsyncMock,
+        client: TestClient,
+        mock_tars_prep_lot_230929: PrepLotData,
+        mock_tars_virus_v123: VirusData,
+    ):
+        """Tests each virus is fetched once for lots with several preps"""
+        mock_tars_api_get_viral_prep_lots.return_value = [
+            mock_tars_prep_lot_230929,
+            mock_tars_prep_lot_230929,
+            PrepLotData(lot="230929-12"),
+        ]
+        mock_tars_api_get_viruses.return_value = [mock_tars_virus_v123]
+        response = client.get("/api/v2/tars_injection_materials/230929-12")
+        assert 3 == len(response.json())
+        mock_tars_api_get_viruses.assert_called_once_with(
+            name="v_123", _request_timeout=10
+        )
+
+    @patch("aind_tars_service_async_client.DefaultApi.get_viruses")
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    def test_get_batch_injection_materials(
+        self,
+        mock_tars_api_get_viral_prep_lots: AsyncMock,
+        mock_tars_api_get_viruses: AsyncMock,
+        client: TestClient,
+        mock_tars_prep_lot_230929: PrepLotData,
+    ):
+        """Tests many lots are resolved with per-lot errors"""
+        with open(RESOURCES_DIR / "prep_lot_example.json", "r") as f:
+            valid_prep_lot = PrepLotData.model_validate(json.load(f))
+        with open(RESOURCES_DIR / "virus_data_example.json", "r") as f:
+            valid_viruses = [VirusData.model_validate(m) for m in json.load(f)]
+        failing_prep_lot = PrepLotData(
+            lot="failing_virus",
+            viral_prep=ViralPrep(
+                virus=VirusData(
+                    aliases=[Alias(is_preferred=True, name="v_broken")]
+                )
+            ),
+        )
+        prep_lots = {
+            "valid": [valid_prep_lot],
+            "invalid": [mock_tars_prep_lot_230929],
+            "missing": [],
+            "failing_virus": [failing_prep_lot],
+        }
+
+        async def get_viral_prep_lots(lot, _request_timeout):
+            """Mock prep lots lookup"""
+            if lot == "error":
+                raise Exception("Timeout")
+            return prep_lots[lot]
+
+        async def get_viruses(name, _request_timeout):
+            """Mock virus lookup"""
+            if name == "v_broken":
+                raise Exception("Bad gateway")
+            return valid_viruses if name == "VIR300001_PHPeB" else None
+
+        mock_tars_api_get_viral_prep_lots.side_effect = get_viral_prep_lots
+        mock_tars_api_get_viruses.side_effect = get_viruses
+        response = client.post(
+            "/api/v2/tars_injection_materials",
+            json={
+                "prep_lot_numbers": [
+                    "valid",
+                    "invalid",
+                    "missing",
+                    "error",
+                    "failing_virus",
+                    "valid",
+                ]
+            },
+        )
+        results = response.json()
+        assert 200 == response.status_code
+        assert [
+            "valid",
+            "invalid",
+            "missing",
+            "error",
+            "failing_virus",
+        ] == list(results.keys())
+        assert results["valid"]["error"] is None
+        assert 1 == len(results["valid"]["viral_materials"])
+        assert 1 == len(results["invalid"]["viral_materials"])
+        assert "string_type" in results["invalid"]["error"]
+        assert {"viral_materials": [], "error": "Not found"} == results[
+            "missing"
+        ]
+        assert {
+            "viral_materials": [],
+            "error": "Error fetching from TARS: Timeout",
+        } == results["error"]
+        assert {
+            "viral_materials": [],
+            "error": "Error fetching from TARS: Bad gateway",
+        } == results["failing_virus"]
+        assert 5 == mock_tars_api_get_viral_prep_lots.call_count
+
+    def test_get_batch_injection_materials_empty(self, client: TestClient):
+        """Tests a batch request without lots is rejected"""
+        response = client.post(
+            "/api/v2/tars_injection_materials", json={"prep_lot_numbers": []}
+        )
+        assert 422 == response.status_code
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
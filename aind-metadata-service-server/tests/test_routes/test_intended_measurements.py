@@ -10,6 +10,8 @@ from aind_sharepoint_service_async_client.models.nsb2023_list import (
 )
 from fastapi.testclient import TestClient
 
+from tests.conftest import suppress_pydantic_serialization_warnings
+
 TEST_DIR = Path(__file__).parent / ".."
 EXAMPLE_NSB2023_JSON = (
     TEST_DIR / "resources" / "nsb2023" / "nsb2023_intended_measurements.json"
@@ -51,6 +53,48 @@ class TestRoute:
         response = client.get("/api/v2/intended_measurements/000000")
         assert response.status_code == 404
 
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    def test_get_intended_measurements_reuses_procedures_fetch(
+        self,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_exaspim: AsyncMock,
+        mock_perfusions: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        mock_protocols: AsyncMock,
+        mock_prep_lots: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests NSB records fetched by procedures are reused."""
+        with open(EXAMPLE_NSB2023_JSON) as f:
+            contents = json.load(f)
+        mock_nsb2023.return_value = [NSB2023List.model_validate(contents)]
+        mock_nsb_present.return_value = []
+        mock_labtracks.return_value = []
+        mock_las.return_value = []
+        mock_nsb2019.return_value = []
+        mock_perfusions.return_value = []
+        mock_exaspim.return_value = None
+        mock_protocols.return_value = []
+        mock_prep_lots.return_value = []
+
+        with suppress_pydantic_serialization_warnings():
+            client.get("/api/v2/procedures/000000")
+        response = client.get("/api/v2/intended_measurements/000000")
+        assert response.status_code == 200
+        mock_nsb2023.assert_called_once_with("000000", _request_timeout=20)
+        mock_nsb_present.assert_called_once_with("000000", _request_timeout=20)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""Tests jobs routes"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import JSONResponse
+
+from aind_metadata_service_server.routes import jobs
+
+
+class TestRoute:
+    """Test responses."""
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    def test_procedures_job(
+        self,
+        mock_get_exaspim_info: AsyncMock,
+        mock_get_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests a procedures job completes with the endpoint's response"""
+        for mock in [
+            mock_labtracks,
+            mock_las,
+            mock_nsb2019,
+            mock_nsb2023,
+            mock_nsb_present,
+            mock_get_perfusions,
+        ]:
+            mock.return_value = []
+        mock_get_exaspim_info.return_value = None
+        response = client.post("/api/v2/jobs/procedures/123456")
+        job_id = response.json()["job_id"]
+        assert 202 == response.status_code
+        assert f"/api/v2/jobs/{job_id}" == response.headers["Location"]
+        assert "procedures" == response.json()["kind"]
+
+        response = client.get(f"/api/v2/jobs/{job_id}", params={"wait": 5})
+        assert 200 == response.status_code
+        assert "completed" == response.json()["status"]
+        assert {
+            "status_code": 404,
+            "data": None,
+            "error": "Not found",
+        } == response.json()["result"]
+        mock_labtracks.assert_called_once()
+
+    def test_bergamo_session_job(self, client: TestClient):
+        """Tests a bergamo session job polls as pending, then completes"""
+
+        async def slow_proxy(*args) -> JSONResponse:
+            """Mock proxy that takes a while to respond."""
+            await asyncio.sleep(0.5)
+            return JSONResponse({"message": "Success"})
+
+        with patch.object(jobs, "proxy", side_effect=slow_proxy) as mock:
+            response = client.post(
+                "/api/v2/jobs/bergamo_session", json={"foo": "bar"}
+            )
+            job_id = response.json()["job_id"]
+            pending_response = client.get(f"/api/v2/jobs/{job_id}")
+            completed_response = client.get(
+                f"/api/v2/jobs/{job_id}", params={"wait": 5}
+            )
+        assert 202 == response.status_code
+        assert "pending" == pending_response.json()["status"]
+        assert "completed" == completed_response.json()["status"]
+        assert {
+            "status_code": 200,
+            "data": {"message": "Success"},
+            "error": None,
+        } == completed_response.json()["result"]
+        assert "/bergamo_session" == mock.call_args.args[1]
+        assert {"foo": "bar"} == dict(mock.call_args.args[3])
+
+    def test_submit_job_store_full(self, client: TestClient):
+        """Tests jobs are rejected while the store is full of running jobs"""
+        with patch.object(jobs.job_store, "maxsize", 0):
+            response = client.post("/api/v2/jobs/procedures/123456")
+        assert 503 == response.status_code
+
+    def test_get_job_not_found(self, client: TestClient):
+        """Tests polling an unknown job"""
+        response = client.get("/api/v2/jobs/unknown")
+        assert 404 == response.status_code
+        assert {"detail": "Not found"} == response.json()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,169 @@
+"""Test metadata bundle routes"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aind_sharepoint_service_async_client.models.nsb2023_list import (
+    NSB2023List,
+)
+from fastapi.testclient import TestClient
+
+from tests.conftest import suppress_pydantic_serialization_warnings
+
+TEST_DIR = Path(__file__).parent / ".."
+EXAMPLE_NSB2023_JSON = (
+    TEST_DIR / "resources" / "nsb2023" / "nsb2023_intended_measurements.json"
+)
+
+
+@patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+@patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+@patch("aind_dataverse_service_async_client.DefaultApi.get_table")
+@patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+@patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+@patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+@patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+@patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+@patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+@patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+@patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+class TestRoute:
+    """Test responses."""
+
+    @pytest.fixture(autouse=True)
+    def nsb_2023_records(self):
+        """NSB2023 records with intended measurements"""
+        with open(EXAMPLE_NSB2023_JSON) as f:
+            contents = json.load(f)
+        return [NSB2023List.model_validate(contents)]
+
+    @staticmethod
+    def set_empty_responses(*mocks: AsyncMock):
+        """Set every backend to return no records"""
+        for mock in mocks:
+            mock.return_value = []
+
+    def test_get_metadata_bundle(
+        self,
+        mock_exaspim: AsyncMock,
+        mock_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_tasks: AsyncMock,
+        mock_subject: AsyncMock,
+        mock_get_table: AsyncMock,
+        mock_protocols: AsyncMock,
+        mock_prep_lots: AsyncMock,
+        client: TestClient,
+        nsb_2023_records,
+    ):
+        """Tests parts are returned with their own statuses"""
+        self.set_empty_responses(
+            mock_perfusions,
+            mock_nsb_present,
+            mock_nsb2019,
+            mock_las,
+            mock_tasks,
+            mock_subject,
+            mock_protocols,
+            mock_prep_lots,
+        )
+        mock_exaspim.return_value = None
+        mock_nsb2023.return_value = nsb_2023_records
+        mock_get_table.return_value = [
+            {
+                "aibs_fact_mouse_weight_recordsid": "record-1",
+                "_aibs_mouse_id_value@OData.Community.Display.V1."
+                "FormattedValue": "000000",
+                "aibs_weight": 22.1,
+                "cr138_datetime": "2026-08-07T10:00:00Z",
+            }
+        ]
+        with suppress_pydantic_serialization_warnings():
+            response = client.get("/api/v2/metadata_bundle/000000")
+        bundle = response.json()
+        parts = bundle["parts"]
+        assert 200 == response.status_code
+        assert "000000" == bundle["subject_id"]
+        assert {
+            "status_code": 404,
+            "data": None,
+            "error": "Not found",
+        } == parts["subject"]
+        # The example surgery is incomplete, so validation errors are returned
+        # alongside the data just like the procedures endpoint does
+        assert 400 == parts["procedures"]["status_code"]
+        assert parts["procedures"]["data"]
+        assert parts["procedures"]["error"]
+        assert 200 == parts["intended_measurements"]["status_code"]
+        assert parts["intended_measurements"]["data"]
+        assert 200 == parts["mouse_weights"]["status_code"]
+        assert 22.1 == parts["mouse_weights"]["data"][0]["weight"]
+        mock_nsb2023.assert_called_once()
+        mock_nsb_present.assert_called_once()
+
+    def test_get_metadata_bundle_errors(
+        self,
+        mock_exaspim: AsyncMock,
+        mock_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_tasks: AsyncMock,
+        mock_subject: AsyncMock,
+        mock_get_table: AsyncMock,
+        mock_protocols: AsyncMock,
+        mock_prep_lots: AsyncMock,
+        client: TestClient,
+        nsb_2023_records,
+    ):
+        """Tests slow and failing parts do not fail the bundle"""
+
+        async def slow_exaspim_info(*args, **kwargs):
+            """ExaSPIM lookup that takes too long"""
+            await asyncio.sleep(1)
+
+        self.set_empty_responses(
+            mock_perfusions,
+            mock_nsb_present,
+            mock_nsb2023,
+            mock_nsb2019,
+            mock_las,
+            mock_tasks,
+            mock_subject,
+        )
+        mock_exaspim.side_effect = slow_exaspim_info
+        mock_get_table.side_effect = Exception("Connection reset")
+        with patch.dict(
+            "aind_metadata_service_server.routes.metadata_bundle."
+            "BUNDLE_PART_TIMEOUTS",
+            {"procedures": 0.01},
+        ):
+            with patch("logging.exception") as mock_log:
+                response = client.get("/api/v2/metadata_bundle/000000")
+        parts = response.json()["parts"]
+        assert 200 == response.status_code
+        assert {
+            "status_code": 504,
+            "data": None,
+            "error": "Timed out after 0.01 seconds",
+        } == parts["procedures"]
+        assert 404 == parts["intended_measurements"]["status_code"]
+        assert {
+            "status_code": 500,
+            "data": None,
+            "error": "Connection reset",
+        } == parts["mouse_weights"]
+        mock_log.assert_called_once_with(
+            "Error building mouse_weights part of metadata bundle"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
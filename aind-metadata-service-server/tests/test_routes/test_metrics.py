@@ -0,0 +1,36 @@
+"""Tests metrics route"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestRoute:
+    """Test responses."""
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_get_metrics(
+        self, mock_get_subject: AsyncMock, client: TestClient
+    ):
+        """Tests requests and backend calls are reported"""
+        mock_get_subject.return_value = []
+        client.get("/api/v2/subject/123456")
+        client.get("/not_a_route")
+        response = client.get("/metrics")
+        assert 200 == response.status_code
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/api/v2/subject/{subject_id}",status_code="404"}'
+        ) in response.text
+        assert 'route="unmatched"' in response.text
+        assert (
+            'backend_call_duration_seconds_count{client="labtracks",'
+            'operation="get_subject",outcome="success"}'
+        ) in response.text
+        assert 'cache_hit_ratio{cache="subject_sources"}' in response.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,9 @@
 """Tests procedures route"""
 
+import asyncio
+import json
 from datetime import datetime
+from typing import Any, List, Tuple
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,6 +13,33 @@ from aind_sharepoint_service_async_client.models import (
 )
 from aind_smartsheet_service_async_client.models import ProtocolsModel
 from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from aind_metadata_service_server.mappers.procedures import ProceduresMapper
+from aind_metadata_service_server.routes.injection_materials import (
+    get_prep_lots,
+)
+from aind_metadata_service_server.routes.procedures import (
+    PROCEDURES_SOURCES,
+    map_source_event,
+)
+from aind_metadata_service_server.sessions import settings
+
+
+def parse_events(text: str) -> List[Tuple[str, Any]]:
+    """Parse a Server-Sent Events stream into event names and payloads"""
+    events = []
+    for message in text.strip().split("\n\n"):
+        event_line, data_line = message.split("\n")
+        events.append(
+            (
+                event_line.removeprefix("event: "),
+                json.loads(data_line.removeprefix("data: ")),
+            )
+        )
+    return events
 
 
 class TestRoute:
@@ -361,6 +391,319 @@ class TestRoute:
             "000000", _request_timeout=120
         )
 
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    def test_get_batch_procedures(
+        self,
+        mock_get_exaspim_info: AsyncMock,
+        mock_get_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests procedures are streamed for each subject in a batch"""
+
+        async def get_las2020(subject_id, _request_timeout):
+            """Mock LAS2020 lookup that fails for one subject"""
+            if subject_id == "222222":
+                raise Exception("Service unavailable")
+            return []
+
+        mock_labtracks.return_value = []
+        mock_las.side_effect = get_las2020
+        mock_nsb2019.return_value = []
+        mock_nsb2023.return_value = []
+        mock_nsb_present.return_value = []
+        mock_get_perfusions.return_value = []
+        mock_get_exaspim_info.return_value = None
+        with patch("logging.exception"):
+            response = client.post(
+                "/api/v2/procedures/batch",
+                json={"subject_ids": ["111111", "222222", "111111"]},
+            )
+        lines = [json.loads(line) for line in response.iter_lines()]
+        results = {line["subject_id"]: line for line in lines}
+        assert 200 == response.status_code
+        assert "application/x-ndjson" == response.headers["content-type"]
+        assert 2 == len(lines)
+        assert {
+            "subject_id": "111111",
+            "status_code": 404,
+            "data": None,
+            "error": "Not found",
+        } == results["111111"]
+        assert {
+            "subject_id": "222222",
+            "status_code": 500,
+            "data": None,
+            "error": "Service unavailable",
+        } == results["222222"]
+        assert 2 == mock_labtracks.call_count
+
+    def test_get_batch_procedures_empty(self, client: TestClient):
+        """Tests a batch request without subjects is rejected"""
+        response = client.post(
+            "/api/v2/procedures/batch", json={"subject_ids": []}
+        )
+        assert 422 == response.status_code
+
+    @patch("aind_tars_service_async_client.DefaultApi.get_viral_prep_lots")
+    def test_get_batch_procedures_shared_lot_timeout(
+        self, mock_get_viral_prep_lots: AsyncMock, client: TestClient
+    ):
+        """Tests a subject timing out while fetching a lot shared with
+        another subject does not stop the batch"""
+
+        async def get_viral_prep_lots(lot, _request_timeout):
+            """Mock TARS lookup that is only slow the first time"""
+            if mock_get_viral_prep_lots.await_count == 1:
+                await asyncio.sleep(0.5)
+            return [lot]
+
+        async def get_procedures(subject_id, tars_api_instance, **_):
+            """Mock procedures that look up the same lot"""
+            if subject_id == "333333":
+                await asyncio.sleep(0.2)
+                return []
+            return await get_prep_lots(tars_api_instance, "VT1")
+
+        mock_get_viral_prep_lots.side_effect = get_viral_prep_lots
+        with (
+            patch(
+                "aind_metadata_service_server.routes.procedures."
+                "get_procedures",
+                side_effect=get_procedures,
+            ),
+            patch(
+                "aind_metadata_service_server.routes.procedures."
+                "BATCH_PROCEDURES_TIMEOUT",
+                0.4,
+            ),
+            patch.object(settings, "batch_concurrency_limit", 2),
+        ):
+            # The third subject starts after the second finishes and waits
+            # on the lot fetched by the first subject. When the first times
+            # out, its fetch is cancelled and the third fetches the lot
+            response = client.post(
+                "/api/v2/procedures/batch",
+                json={"subject_ids": ["111111", "333333", "222222"]},
+            )
+        results = {
+            line["subject_id"]: line
+            for line in map(json.loads, response.iter_lines())
+        }
+        assert 200 == response.status_code
+        assert {"111111", "222222", "333333"} == set(results)
+        assert 504 == results["111111"]["status_code"]
+        assert 200 == results["333333"]["status_code"]
+        assert {
+            "subject_id": "222222",
+            "status_code": 200,
+            "data": ["VT1"],
+            "error": None,
+        } == results["222222"]
+        assert 2 == mock_get_viral_prep_lots.await_count
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+    def test_get_procedures_events(
+        self,
+        mock_get_protocols: AsyncMock,
+        mock_get_exaspim_info: AsyncMock,
+        mock_get_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests progress is streamed as each source finishes"""
+        mock_labtracks.return_value = [
+            LabTracksTask(
+                id="00000",
+                type_name="Perfusion Gel",
+                date_start=datetime(2022, 10, 11, 0, 0),
+                date_end=datetime(2022, 10, 11, 4, 30),
+                investigator_id="28803",
+                task_object="000000",
+                protocol_number="2002",
+                task_status="F",
+            )
+        ]
+        mock_las.return_value = []
+        mock_nsb2019.return_value = []
+        mock_nsb2023.return_value = []
+        mock_nsb_present.return_value = []
+        mock_get_perfusions.return_value = []
+        mock_get_exaspim_info.return_value = None
+        mock_get_protocols.return_value = []
+        response = client.get("/api/v2/procedures/000000/events")
+        events = parse_events(response.text)
+        sources = {data["source"]: data for event, data in events[:-1]}
+        assert 200 == response.status_code
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert ["source"] * 7 + ["result"] == [event for event, _ in events]
+        assert 1 == sources["LabTracks"]["records"]
+        assert "000000" == sources["LabTracks"]["partial"]["subject_id"]
+        assert sources["LabTracks"]["message"].startswith(
+            "LabTracks returned 1 procedures in "
+        )
+        assert 0 == sources["LAS2020"]["records"]
+        assert sources["LAS2020"]["partial"] is None
+        assert 200 == events[-1][1]["status_code"]
+        assert "000000" == events[-1][1]["data"]["subject_id"]
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    def test_get_procedures_events_source_error(
+        self,
+        mock_get_exaspim_info: AsyncMock,
+        mock_get_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests a failing source is reported before the final result"""
+        mock_labtracks.return_value = []
+        mock_las.side_effect = Exception("Service unavailable")
+        mock_nsb2019.return_value = []
+        mock_nsb2023.return_value = []
+        mock_nsb_present.return_value = []
+        mock_get_perfusions.return_value = []
+        mock_get_exaspim_info.return_value = None
+        with patch("logging.exception"):
+            response = client.get("/api/v2/procedures/111111/events")
+        events = parse_events(response.text)
+        sources = {data["source"]: data for event, data in events[:-1]}
+        assert "Service unavailable" == sources["LAS2020"]["error"]
+        assert sources["LAS2020"]["records"] is None
+        assert sources["LAS2020"]["message"].startswith("LAS2020 failed after")
+        assert (
+            "result",
+            {
+                "status_code": 500,
+                "data": None,
+                "error": "Service unavailable",
+            },
+        ) == events[-1]
+
+    def test_map_source_event_mapping_error(self):
+        """Tests a response that cannot be mapped is still reported"""
+        with (
+            patch.object(
+                ProceduresMapper,
+                "map_responses_to_aind_procedures",
+                side_effect=ValueError("bad record"),
+            ),
+            patch("logging.exception") as mock_log,
+        ):
+            event = map_source_event(
+                "111111", PROCEDURES_SOURCES[0], [], 0.5, None
+            )
+        mock_log.assert_called_once()
+        assert event["records"] is None
+        assert event["partial"] is None
+        assert (
+            "LabTracks returned a response that could not be mapped"
+            == event["message"]
+        )
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_tasks")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_las2020")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2019")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb2023")
+    @patch("aind_sharepoint_service_async_client.DefaultApi.get_nsb_present")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_perfusions")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_exaspim_info")
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+    def test_get_procedures_spans(
+        self,
+        mock_get_protocols: AsyncMock,
+        mock_get_exaspim_info: AsyncMock,
+        mock_get_perfusions: AsyncMock,
+        mock_nsb_present: AsyncMock,
+        mock_nsb2023: AsyncMock,
+        mock_nsb2019: AsyncMock,
+        mock_las: AsyncMock,
+        mock_labtracks: AsyncMock,
+        client: TestClient,
+        span_exporter: InMemorySpanExporter,
+    ):
+        """Tests backend calls and mapping stages are traced"""
+        mock_labtracks.return_value = [
+            LabTracksTask(
+                id="00000",
+                type_name="Perfusion Gel",
+                date_start=datetime(2022, 10, 11, 0, 0),
+                date_end=datetime(2022, 10, 11, 4, 30),
+                investigator_id="28803",
+                task_object="000000",
+                protocol_number="2002",
+                task_status="F",
+            )
+        ]
+        for mock in [
+            mock_las,
+            mock_nsb2019,
+            mock_nsb2023,
+            mock_nsb_present,
+            mock_get_perfusions,
+            mock_get_protocols,
+        ]:
+            mock.return_value = []
+        mock_get_exaspim_info.return_value = None
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        span_exporter.clear()
+        response = client.get(
+            "/api/v2/procedures/000000",
+            headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"},
+        )
+        finished_spans = span_exporter.get_finished_spans()
+        spans = {span.name: span for span in finished_spans}
+        build_span = spans["build_procedures"]
+        assert 200 == response.status_code
+        assert 1 == [span.name for span in finished_spans].count(
+            "GET /api/v2/procedures/{subject_id}"
+        )
+        assert {trace_id} == {
+            format(span.context.trace_id, "032x") for span in finished_spans
+        }
+        for name in [
+            "labtracks.get_tasks",
+            "sharepoint.get_las2020",
+            "smartsheet.get_exaspim_info",
+            "smartsheet.get_protocols",
+            "map_responses_to_aind_procedures",
+            "integrate_protocols_into_aind_procedures",
+            "integrate_injection_materials_into_aind_procedures",
+        ]:
+            assert build_span.context.span_id == spans[name].parent.span_id
+        for name in ["validate_response", "serialize_response"]:
+            assert "Procedures" == spans[name].attributes["aind.model"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -6,6 +6,8 @@ import pytest
 from aind_smartsheet_service_async_client.models import ProtocolsModel
 from fastapi.testclient import TestClient
 
+from aind_metadata_service_server.mappers.protocol import ProtocolMapper
+
 
 class TestRoute:
     """Test responses."""
@@ -35,13 +37,7 @@ class TestRoute:
         )
         assert 200 == response.status_code
         assert 1 == len(mock_get_protocols.mock_calls)
-        mock_get_protocols.assert_called_once_with(
-            protocol_name=(
-                "Tetrahydrofuran and Dichloromethane Delipidation"
-                " of a Whole Mouse Brain"
-            ),
-            _request_timeout=10,
-        )
+        mock_get_protocols.assert_called_once_with(_request_timeout=30)
 
     @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
     def test_get_protocols_not_found(
@@ -53,8 +49,8 @@ class TestRoute:
         mock_get_protocols.return_value = []
         response = client.get("/api/v2/protocols/Nonexistent Protocol Name")
         assert 404 == response.status_code
-        assert 1 == len(mock_get_protocols.mock_calls)
-        mock_get_protocols.assert_called_once_with(
+        assert 2 == len(mock_get_protocols.mock_calls)
+        mock_get_protocols.assert_called_with(
             protocol_name="Nonexistent Protocol Name",
             _request_timeout=10,
         )
@@ -94,13 +90,7 @@ class TestRoute:
         )
         assert 500 == response.status_code
         assert 1 == len(mock_get_protocols.mock_calls)
-        mock_get_protocols.assert_called_once_with(
-            protocol_name=(
-                "Tetrahydrofuran and Dichloromethane Delipidation"
-                " of a Whole Mouse Brain"
-            ),
-            _request_timeout=10,
-        )
+        mock_get_protocols.assert_called_once_with(_request_timeout=30)
 
     @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
     def test_get_protocols_with_collection(
@@ -132,6 +122,69 @@ class TestRoute:
         response_data = response.json()
         assert response_data["protocol_collection"] is True
 
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+    def test_get_protocols_from_catalog(
+        self,
+        mock_get_protocols: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests protocols are served from the catalog once loaded"""
+        mock_get_protocols.return_value = [
+            ProtocolsModel(
+                protocol_type="Specimen Procedures",
+                procedure_name="Perfusion",
+                protocol_name=(
+                    "Mouse Cardiac Perfusion Fixation and Brain Collection V.5"
+                ),
+                doi="dx.doi.org/10.17504/protocols.io.test",
+                version="1.0",
+            ),
+        ]
+        with patch(
+            "aind_metadata_service_server.mappers.protocol.ProtocolMapper."
+            "map_to_protocol_information",
+            autospec=True,
+            side_effect=ProtocolMapper.map_to_protocol_information,
+        ) as mock_map:
+            for _ in range(2):
+                response = client.get(
+                    "/api/v2/protocols/Mouse Cardiac Perfusion Fixation and "
+                    "Brain Collection V.5"
+                )
+                assert 200 == response.status_code
+        mock_get_protocols.assert_called_once_with(_request_timeout=30)
+        # Protocols are mapped once, when the catalog is loaded
+        assert 1 == mock_map.call_count
+
+    @patch("aind_smartsheet_service_async_client.DefaultApi.get_protocols")
+    def test_get_protocols_catalog_error(
+        self,
+        mock_get_protocols: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests protocols are fetched by name if the catalog fails to load"""
+        protocol = ProtocolsModel(
+            protocol_type="Specimen Procedures",
+            procedure_name="Perfusion",
+            protocol_name="Perfusion Protocol",
+            doi="dx.doi.org/10.17504/protocols.io.test",
+            version="1.0",
+        )
+        mock_get_protocols.side_effect = [Exception("Timeout"), [protocol], []]
+        with patch("logging.warning") as mock_warn:
+            response = client.get("/api/v2/protocols/Perfusion Protocol")
+            assert 200 == response.status_code
+            # The failure is remembered, so the catalog is not retried
+            response = client.get("/api/v2/protocols/Other Protocol")
+            assert 404 == response.status_code
+        mock_warn.assert_called_once_with(
+            "Unable to load protocol catalog: Timeout"
+        )
+        assert 3 == mock_get_protocols.call_count
+        mock_get_protocols.assert_called_with(
+            protocol_name="Other Protocol", _request_timeout=10
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -207,6 +207,61 @@ class TestRoute:
         assert 406 == response.status_code
         assert expected_response == response.json()
 
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_subject_routes_share_labtracks_response(
+        self,
+        mock_lb_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests subject routes reuse a recent LabTracks response"""
+        mock_lb_api_get.return_value = []
+        response = client.get("/api/v2/subject/632269")
+        labtracks_response = client.get(
+            "/api/v2/labtracks/subject", params={"subject_id": "632269"}
+        )
+        assert 404 == response.status_code
+        assert 404 == labtracks_response.status_code
+        mock_lb_api_get.assert_called_once_with("632269", _request_timeout=10)
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_get_batch_subjects(
+        self,
+        mock_lb_api_get: AsyncMock,
+        client: TestClient,
+    ):
+        """Tests subjects are returned per ID with their own statuses"""
+
+        async def get_subject(subject_id, _request_timeout):
+            """Mock LabTracks lookup that fails for one subject"""
+            if subject_id == "222222":
+                raise Exception("Service unavailable")
+            return []
+
+        mock_lb_api_get.side_effect = get_subject
+        with patch("logging.exception"):
+            response = client.post(
+                "/api/v2/subject/batch",
+                json={"subject_ids": ["111111", "abc", "222222", "111111"]},
+            )
+        assert 200 == response.status_code
+        assert {
+            "111111": {"status_code": 404, "data": None, "error": "Not found"},
+            "abc": {
+                "status_code": 406,
+                "data": None,
+                "error": (
+                    "Subject ID abc is not valid. Please specify a numeric "
+                    "subject ID."
+                ),
+            },
+            "222222": {
+                "status_code": 500,
+                "data": None,
+                "error": "Service unavailable",
+            },
+        } == response.json()
+        assert 2 == mock_lb_api_get.call_count
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,8 +2,10 @@
 
 import pytest
 
+from aind_metadata_service_server.metrics import InstrumentedApi
 from aind_metadata_service_server.sessions import (
     get_aind_data_schema_v1_session,
+    get_instruments_client,
 )
 
 
@@ -16,6 +18,14 @@ class TestSession:
         session = await get_aind_data_schema_v1_session().__anext__()
         base_url = str(session.base_url)
         assert "http://example.com/v1/" == base_url
+        assert isinstance(session, InstrumentedApi)
+
+    def test_get_instruments_client(self):
+        """Tests DocDB calls of the instruments client are timed"""
+        docdb_client = get_instruments_client()
+        assert isinstance(docdb_client, InstrumentedApi)
+        assert "instruments" == docdb_client.collection
+        assert hasattr(docdb_client.retrieve_docdb_records, "__wrapped__")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""Tests sources module"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aind_metadata_service_server.caches import clear_caches
+from aind_metadata_service_server.sources import call_subject_source
+from aind_metadata_service_server.utils import capture_response
+
+
+class TestSources(unittest.IsolatedAsyncioTestCase):
+    """Tests methods in sources module"""
+
+    def setUp(self):
+        """Start each test with empty caches"""
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    async def test_call_subject_source(self):
+        """Tests responses are reused per backend, operation and subject"""
+        api_instance = MagicMock()
+        api_instance.get_tasks = AsyncMock(return_value=["task"])
+        api_instance.get_subject = AsyncMock(return_value=["subject"])
+        with patch("time.monotonic", return_value=1000):
+            for _ in range(2):
+                tasks = await call_subject_source(
+                    "labtracks",
+                    api_instance,
+                    "get_tasks",
+                    "123",
+                    _request_timeout=20,
+                )
+            subject = await call_subject_source(
+                "labtracks", api_instance, "get_subject", "123"
+            )
+            await call_subject_source(
+                "labtracks", api_instance, "get_tasks", "456"
+            )
+        with patch("time.monotonic", return_value=1061):
+            await call_subject_source(
+                "labtracks", api_instance, "get_tasks", "123"
+            )
+        self.assertEqual(["task"], tasks)
+        self.assertEqual(["subject"], subject)
+        self.assertEqual(3, api_instance.get_tasks.await_count)
+        api_instance.get_tasks.assert_any_await("123", _request_timeout=20)
+        api_instance.get_subject.assert_awaited_once_with("123")
+
+    async def test_call_subject_source_owner_times_out(self):
+        """Tests a request waiting on a subject source fetched by a request
+        that times out gets the response from its own client"""
+
+        async def get_nsb2023(subject_id, _request_timeout):
+            """Slow SharePoint lookup"""
+            await asyncio.sleep(0.1)
+            return [subject_id]
+
+        owner_api_instance = MagicMock()
+        owner_api_instance.get_nsb2023 = AsyncMock(side_effect=get_nsb2023)
+        waiter_api_instance = MagicMock()
+        waiter_api_instance.get_nsb2023 = AsyncMock(side_effect=get_nsb2023)
+        results = await asyncio.gather(
+            capture_response(
+                call_subject_source(
+                    "sharepoint",
+                    owner_api_instance,
+                    "get_nsb2023",
+                    "1",
+                    _request_timeout=10,
+                ),
+                timeout=0.05,
+                name="owner",
+            ),
+            capture_response(
+                call_subject_source(
+                    "sharepoint",
+                    waiter_api_instance,
+                    "get_nsb2023",
+                    "1",
+                    _request_timeout=10,
+                ),
+                timeout=5,
+                name="waiter",
+            ),
+        )
+        self.assertEqual(504, results[0]["status_code"])
+        self.assertEqual(
+            {"status_code": 200, "data": ["1"], "error": None}, results[1]
+        )
+        waiter_api_instance.get_nsb2023.assert_awaited_once_with(
+            "1", _request_timeout=10
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests timing module"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from aind_metadata_service_server.timing import (
+    RequestTimings,
+    record_cache_lookup,
+    record_duration,
+)
+
+
+class TestRequestTimings:
+    """Tests methods in RequestTimings class"""
+
+    def test_to_header(self):
+        """Tests durations are combined by name and caches are counted"""
+        timings = RequestTimings()
+        timings.add_duration("smartsheet.get_protocols", 0.01)
+        timings.add_duration("smartsheet.get_protocols", 0.02)
+        timings.add_duration("serialize_response", 0.005, "Procedures")
+        timings.add_cache_lookup("subject_sources", hit=True)
+        timings.add_cache_lookup("subject_sources", hit=False)
+        timings.add_cache_lookup("subject_sources", hit=False)
+        header = timings.to_header()
+        assert header.startswith(
+            'smartsheet.get_protocols;dur=30.0;desc="2 calls", '
+            'serialize_response;dur=5.0;desc="Procedures", '
+            'cache.subject_sources;desc="1 hits, 2 misses", '
+            "total;dur="
+        )
+
+    def test_record_outside_request(self):
+        """Tests recording without a timed request does nothing"""
+        record_duration("labtracks.get_subject", 0.1)
+        record_cache_lookup("subject_sources", hit=True)
+
+
+class TestServerTimingMiddleware:
+    """Tests the Server-Timing header is added to v2 routes"""
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_server_timing_header(
+        self, mock_get_subject: AsyncMock, client: TestClient
+    ):
+        """Tests backend calls and cache lookups are reported"""
+        mock_get_subject.return_value = []
+        client.get("/api/v2/subject/123456")
+        response = client.get("/api/v2/subject/123456")
+        server_timing = response.headers["Server-Timing"]
+        assert "labtracks.get_subject" not in server_timing
+        assert 'cache.subject_sources;desc="1 hits, 0 misses"' in server_timing
+        assert "*" == response.headers["Timing-Allow-Origin"]
+
+        response = client.get("/metrics")
+        assert "Server-Timing" not in response.headers
+
+    @patch("aind_labtracks_service_async_client.DefaultApi.get_subject")
+    def test_server_timing_backend_call(
+        self, mock_get_subject: AsyncMock, client: TestClient
+    ):
+        """Tests a backend call made by the request is reported"""
+        mock_get_subject.return_value = []
+        response = client.get("/api/v2/subject/123456")
+        assert (
+            "labtracks.get_subject;dur=" in response.headers["Server-Timing"]
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+"""Tests tracing module"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from aind_metadata_service_server.tracing import (
+    TracingMiddleware,
+    configure_tracing,
+)
+
+
+class TestTracing:
+    """Tests methods in tracing module"""
+
+    def test_configure_tracing(self):
+        """Tests an OTLP exporting tracer provider is set globally"""
+        with patch("opentelemetry.trace.set_tracer_provider") as mock_set:
+            provider = configure_tracing()
+        mock_set.assert_called_once_with(provider)
+        assert isinstance(provider, TracerProvider)
+        assert (
+            "aind-metadata-service"
+            == provider.resource.attributes["service.name"]
+        )
+        provider.shutdown()
+
+    def test_configure_tracing_without_extra(self):
+        """Tests a helpful error is raised if the sdk is missing"""
+        with patch.dict(sys.modules, {"opentelemetry.sdk.trace": None}):
+            with pytest.raises(ImportError, match="tracing extra"):
+                configure_tracing()
+
+    def test_middleware_marks_server_errors(
+        self, span_exporter: InMemorySpanExporter
+    ):
+        """Tests server errors set an error status on the request span"""
+
+        async def unavailable(_) -> PlainTextResponse:
+            """Respond with a server error."""
+            return PlainTextResponse("Unavailable", status_code=503)
+
+        app = Starlette()
+        app.add_route("/unavailable", unavailable)
+        app.add_middleware(TracingMiddleware)
+        span_exporter.clear()
+        with TestClient(app) as client:
+            response = client.get("/unavailable")
+        (span,) = span_exporter.get_finished_spans()
+        assert 503 == response.status_code
+        assert "GET /unavailable" == span.name
+        assert SpanKind.SERVER == span.kind
+        assert 503 == span.attributes["http.response.status_code"]
+        assert StatusCode.ERROR == span.status.status_code
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,84 @@
+"""Tests utils module"""
+
+import asyncio
+import unittest
+
+from starlette.responses import PlainTextResponse
+
+from aind_metadata_service_server.utils import (
+    capture_response,
+    chunked,
+    format_sse,
+    gather_with_concurrency,
+)
+
+
+class TestUtils(unittest.IsolatedAsyncioTestCase):
+    """Tests helper functions"""
+
+    async def test_gather_with_concurrency(self):
+        """Tests that results keep order and concurrency is bounded"""
+        running = 0
+        max_running = 0
+
+        async def work(value: int) -> int:
+            """Track how many coroutines run at the same time."""
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value * 2
+
+        results = await gather_with_concurrency(
+            2, [work(value) for value in range(5)]
+        )
+        self.assertEqual([0, 2, 4, 6, 8], results)
+        self.assertEqual(2, max_running)
+
+    async def test_gather_with_concurrency_exceptions(self):
+        """Tests exceptions can be returned instead of raised"""
+
+        async def fail() -> None:
+            """Raise an error."""
+            raise ValueError("failed")
+
+        results = await gather_with_concurrency(
+            2, [fail()], return_exceptions=True
+        )
+        self.assertIsInstance(results[0], ValueError)
+        with self.assertRaises(ValueError):
+            await gather_with_concurrency(2, [fail()])
+
+    def test_chunked(self):
+        """Tests splitting a list into chunks"""
+        self.assertEqual([[1, 2], [3, 4], [5]], chunked([1, 2, 3, 4, 5], 2))
+        self.assertEqual([], chunked([], 2))
+
+    def test_format_sse(self):
+        """Tests formatting a Server-Sent Events message"""
+        self.assertEqual(
+            'event: source\ndata: {"records": 1}\n\n',
+            format_sse("source", {"records": 1}),
+        )
+
+    async def test_capture_response_text_body(self):
+        """Tests that a response body that is not JSON is kept as text"""
+
+        async def proxied() -> PlainTextResponse:
+            """Return a plain text error."""
+            return PlainTextResponse("Proxy request failed", status_code=500)
+
+        result = await capture_response(proxied(), timeout=1, name="test")
+        self.assertEqual(
+            {
+                "status_code": 500,
+                "data": "Proxy request failed",
+                "error": None,
+            },
+            result,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()